@@ -0,0 +1,119 @@
+from time import monotonic
+
+import pytest
+import vtk
+from PyQt5.QtCore import QCoreApplication
+
+import vtkat.render_widgets.adaptive_quality
+from vtkat.render_widgets.adaptive_quality import AdaptiveQuality
+
+# the restore timer needs an event loop
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(vtkat.render_widgets.adaptive_quality, "perf_counter", clock)
+    return clock
+
+
+@pytest.fixture
+def scene():
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetMultiSamples(4)
+    render_window.SetSize(100, 100)
+    renderer = vtk.vtkRenderer()
+    renderer.UseFXAAOn()
+    render_window.AddRenderer(renderer)
+
+    actor = vtk.vtkActor()
+    actor.SetMapper(vtk.vtkPolyDataMapper())
+    actor.GetProperty().RenderPointsAsSpheresOn()
+    renderer.AddActor(actor)
+
+    yield render_window, renderer, actor
+    render_window.Finalize()
+
+
+def feed(render_window, clock, *frame_times):
+    for frame_time in frame_times:
+        render_window.InvokeEvent("StartEvent")
+        clock.now += frame_time
+        render_window.InvokeEvent("EndEvent")
+
+
+def test_level_follows_the_frame_times(scene, clock):
+    render_window, renderer, actor = scene
+    quality = AdaptiveQuality(render_window, target_frame_time=0.02)
+
+    # nothing changes outside of interactions
+    feed(render_window, clock, 0.1, 0.1)
+    assert quality.level == 0
+    assert quality.get_frame_times() == pytest.approx([0.1, 0.1])
+
+    quality.start_interaction()
+    feed(render_window, clock, 0.1)
+    assert quality.level == 1
+    assert render_window.GetMultiSamples() == 0
+    assert not renderer.GetUseFXAA()
+
+    feed(render_window, clock, 0.1, 0.1, 0.1)
+    assert quality.level == AdaptiveQuality.MAX_LEVEL
+    assert not actor.GetProperty().GetRenderPointsAsSpheres()
+
+    # frames under the budget, but not much faster, keep the level
+    feed(render_window, clock, 0.015, 0.015, 0.015)
+    assert quality.level == 3
+
+    # three fast frames at a level go one step up
+    feed(render_window, clock, 0.005, 0.005)
+    assert quality.level == 3
+    feed(render_window, clock, 0.005)
+    assert quality.level == 2
+    assert not actor.GetProperty().GetRenderPointsAsSpheres()
+    feed(render_window, clock, 0.005, 0.005, 0.005)
+    assert quality.level == 1
+    assert actor.GetProperty().GetRenderPointsAsSpheres()
+    quality.close()
+
+
+def test_full_quality_after_the_idle_timer(scene, clock):
+    render_window, renderer, actor = scene
+    quality = AdaptiveQuality(render_window, target_frame_time=0.02, settle_ms=10)
+
+    quality.start_interaction()
+    feed(render_window, clock, 0.1, 0.1, 0.1)
+    assert quality.level == 3
+
+    quality.end_interaction()
+    assert quality.level == 3
+
+    start = monotonic()
+    while quality.level != 0 and monotonic() - start < 2:
+        QCoreApplication.processEvents()
+
+    assert quality.level == 0
+    assert render_window.GetMultiSamples() == 4
+    assert renderer.GetUseFXAA()
+    assert actor.GetProperty().GetRenderPointsAsSpheres()
+
+    # a new interaction before the timer ends keeps the lower quality
+    quality.start_interaction()
+    feed(render_window, clock, 0.1)
+    quality.end_interaction()
+    quality.start_interaction()
+    start = monotonic()
+    while monotonic() - start < 0.05:
+        QCoreApplication.processEvents()
+    assert quality.level == 1
+    quality.close()
@@ -0,0 +1,53 @@
+from time import monotonic
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from vtkat.render_widgets import BackgroundBuilder
+
+# the results are delivered by the event loop
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def builder():
+    builder = BackgroundBuilder()
+    yield builder
+    builder.shutdown()
+
+
+def process_events(builder, timeout=2):
+    start = monotonic()
+    while builder._current and monotonic() - start < timeout:
+        QCoreApplication.processEvents()
+    QCoreApplication.processEvents()
+
+
+def fail():
+    raise RuntimeError("bad model")
+
+
+def test_result_is_given_to_on_ready(builder):
+    results = []
+    builder.submit("model", sum, [1, 2, 3], on_ready=results.append)
+    process_events(builder)
+    assert results == [6]
+
+
+def test_errors_go_to_on_error(builder):
+    errors, failed = [], []
+    builder.build_failed.connect(lambda key, error: failed.append(key))
+    builder.submit("model", fail, on_error=errors.append)
+    process_events(builder)
+
+    assert isinstance(errors[0], RuntimeError)
+    assert failed == ["model"]
+
+
+def test_errors_without_on_error_are_reported(builder, monkeypatch):
+    reported = []
+    monkeypatch.setattr("sys.excepthook", lambda *info: reported.append(info[1]))
+    builder.submit("model", fail)
+    process_events(builder)
+
+    assert isinstance(reported[0], RuntimeError)
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from vtkat.poly_data import LinesData
+from vtkat.utils import HarmonicDeformation
+
+
+def make_lines(offset=0.0):
+    lines = np.arange(24, dtype=np.float32).reshape(4, 6) + offset
+    return LinesData(lines)
+
+
+def get_coords(data):
+    return vtk_to_numpy(data.GetPoints().GetData())
+
+
+@pytest.mark.parametrize("complex_field", [False, True])
+def test_displacement_formula(complex_field):
+    data = make_lines()
+    base = get_coords(data).copy()
+    rng = np.random.default_rng(0)
+    displacement = rng.normal(size=base.shape)
+    if complex_field:
+        displacement = displacement + 1j * rng.normal(size=base.shape)
+
+    deformation = HarmonicDeformation(data, displacement, 0.5, number_of_frames=8)
+    for frame in (0, 1, 2, 5, 11):
+        deformation.apply(frame)
+        phase = 2 * np.pi * (frame % 8) / 8
+        expected = base + 0.5 * (displacement * np.exp(1j * phase)).real
+        np.testing.assert_allclose(get_coords(data), expected, rtol=1e-5, atol=1e-5)
+
+    deformation.reset()
+    np.testing.assert_array_equal(get_coords(data), base)
+
+
+def test_scalars_are_restored():
+    data = make_lines()
+    original = np.arange(4, dtype=np.float32)
+    array = numpy_to_vtk(original, deep=True)
+    data.GetCellData().SetScalars(array)
+
+    deformation = HarmonicDeformation(data, np.zeros((8, 3)), number_of_frames=4)
+    deformation.add_scalars(np.full(4, 2 + 2j), array)
+
+    deformation.apply(1)
+    np.testing.assert_allclose(vtk_to_numpy(array), [-2] * 4, atol=1e-6)
+
+    deformation.reset()
+    np.testing.assert_array_equal(vtk_to_numpy(array), original)
+
+
+def test_rebuilt_data_is_read_again():
+    data = make_lines()
+    displacement = np.ones((8, 3))
+    deformation = HarmonicDeformation(data, displacement, number_of_frames=4)
+    deformation.apply(0)
+
+    data.lines_list = np.arange(24, dtype=np.float32).reshape(4, 6) + 100
+    data.build()
+    new_base = get_coords(data).copy()
+
+    deformation.apply(0)
+    np.testing.assert_allclose(get_coords(data), new_base + 1)
+    deformation.reset()
+    np.testing.assert_array_equal(get_coords(data), new_base)
+
+    # other changes in the data do not change the base
+    data.GetCellData().SetScalars(numpy_to_vtk(np.zeros(4), deep=True))
+    deformation.apply(0)
+    deformation.reset()
+    np.testing.assert_array_equal(get_coords(data), new_base)
+
+
+def test_replaced_actor_data_is_followed():
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(make_lines())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    deformation = HarmonicDeformation(actor, np.ones((8, 3)), number_of_frames=4)
+
+    new_data = make_lines(offset=50)
+    new_base = get_coords(new_data).copy()
+    mapper.SetInputData(new_data)
+
+    deformation.apply(2)
+    np.testing.assert_allclose(get_coords(new_data), new_base - 1)
+
+    mapper.SetInputData(LinesData(np.zeros((1, 6))))
+    with pytest.raises(ValueError):
+        deformation.apply(0)
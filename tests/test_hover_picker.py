@@ -0,0 +1,116 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk
+
+from vtkat.interactor_styles import ArcballCameraInteractorStyle
+from vtkat.pickers import HoverPicker
+
+
+def make_scene():
+    # a plane with 4 x 3 cells, numbered along x first
+    source = vtk.vtkPlaneSource()
+    source.SetOrigin(0, 0, 0)
+    source.SetPoint1(4, 0, 0)
+    source.SetPoint2(0, 3, 0)
+    source.SetResolution(4, 3)
+    source.Update()
+    data = source.GetOutput()
+
+    values = numpy_to_vtk(np.arange(12, dtype=np.int32) * 10, deep=True)
+    values.SetName("entity")
+    data.GetCellData().AddArray(values)
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+
+    renderer = vtk.vtkRenderer()
+    renderer.AddActor(actor)
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetMultiSamples(0)
+    render_window.SetSize(200, 150)
+    render_window.AddRenderer(renderer)
+    renderer.ResetCamera()
+    render_window.Render()
+    return renderer, render_window, actor
+
+
+def to_display(renderer, point):
+    renderer.SetWorldPoint(*point, 1)
+    renderer.WorldToDisplay()
+    x, y, _ = renderer.GetDisplayPoint()
+    return int(x), int(y)
+
+
+def count_selector_renders(renderer):
+    renders = []
+
+    def render_started(obj, event):
+        if obj.GetSelector() is not None:
+            renders.append(event)
+
+    renderer.AddObserver("StartEvent", render_started)
+    return renders
+
+
+def test_hovered_cell():
+    renderer, render_window, actor = make_scene()
+    picker = HoverPicker(renderer)
+    selector_renders = count_selector_renders(renderer)
+
+    # the center of the cell in the column 2 and row 1
+    x, y = to_display(renderer, (2.5, 1.5, 0))
+    assert picker.pick(x, y) == (actor, 6)
+    assert picker.pick_property(x, y, "entity") == (actor, 60)
+
+    x, y = to_display(renderer, (0.5, 2.5, 0))
+    assert picker.pick(x, y) == (actor, 8)
+    assert picker.pick(1, 1) == (None, -1)
+    assert picker.pick(500, 10) == (None, -1)
+    assert len(selector_renders) > 0
+
+    # the id buffers are kept until the camera moves
+    renders = len(selector_renders)
+    picker.pick(*to_display(renderer, (3.5, 0.5, 0)))
+    assert len(selector_renders) == renders
+
+    renderer.GetActiveCamera().Azimuth(5)
+    picker.pick(x, y)
+    assert len(selector_renders) > renders
+    render_window.Finalize()
+
+
+def test_no_hover_while_dragging():
+    renderer, render_window, actor = make_scene()
+    interactor = vtk.vtkGenericRenderWindowInteractor()
+    interactor.SetRenderWindow(render_window)
+    style = ArcballCameraInteractorStyle()
+    style.SetDefaultRenderer(renderer)
+    interactor.SetInteractorStyle(style)
+
+    picker = HoverPicker(renderer)
+    picks = []
+    pick = picker.pick
+    picker.pick = lambda x, y: picks.append((x, y)) or pick(x, y)
+
+    hovered = []
+    style.set_hover_picking(picker, lambda *args: hovered.append(args), rate=1e9)
+
+    x, y = to_display(renderer, (2.5, 1.5, 0))
+    interactor.SetEventPosition(x, y)
+    style.InvokeEvent("LeftButtonPressEvent")
+    style.InvokeEvent("MouseMoveEvent")
+    assert picks == []
+
+    style.InvokeEvent("LeftButtonReleaseEvent")
+    style.InvokeEvent("MouseMoveEvent")
+    assert picks == [(x, y)]
+    assert hovered == [(actor, 6)]
+
+    # the callback is only called when the hovered cell changes
+    style.InvokeEvent("MouseMoveEvent")
+    assert len(picks) == 2
+    assert len(hovered) == 1
+    render_window.Finalize()
@@ -0,0 +1,145 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+import vtkat.poly_data.lines_data
+from vtkat.actors import LinesActor
+from vtkat.pickers import CellAreaPicker
+from vtkat.poly_data import LinesData
+
+
+def make_lines():
+    # a chain of 3 segments, a loose segment and a chain of 2 segments
+    points = [(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0)]
+    lines = [(*points[i], *points[i + 1]) for i in range(3)]
+    lines.append((0, 5, 0, 1, 5, 0))
+    lines.append((0, 9, 0, 1, 9, 0))
+    lines.append((1, 9, 0, 2, 9, 0))
+    return np.array(lines, dtype=np.float32)
+
+
+def get_cells(data):
+    lines = data.GetLines()
+    offsets = vtk_to_numpy(lines.GetOffsetsArray())
+    connectivity = vtk_to_numpy(lines.GetConnectivityArray())
+    return np.diff(offsets).tolist(), connectivity
+
+
+def test_segments_without_consolidation():
+    lines = make_lines()
+    data = LinesData(lines)
+
+    assert data.GetNumberOfCells() == len(lines)
+    assert data.GetNumberOfPoints() == 2 * len(lines)
+    assert data.get_number_of_segments() == len(lines)
+    assert [data.get_segment(cell) for cell in range(len(lines))] == list(range(6))
+    np.testing.assert_array_equal(data.get_segments_points().reshape(-1, 6), lines)
+
+
+def test_consolidated_segments():
+    lines = make_lines()
+    data = LinesData(lines, consolidate=True)
+
+    assert data.GetNumberOfCells() == 3
+    assert data.GetNumberOfPoints() == 9
+    assert data.get_number_of_segments() == len(lines)
+    assert get_cells(data)[0] == [4, 2, 3]
+    np.testing.assert_array_equal(data.get_segments_points().reshape(-1, 6), lines)
+
+    assert data.get_segment(0, 2) == 2
+    assert data.get_segment(1) == 3
+    assert data.get_segment(2, 1) == 5
+
+    np.testing.assert_array_equal(data.get_cells_segments([2, 0]), [4, 5, 0, 1, 2])
+    np.testing.assert_array_equal(data.get_cells_segments([1]), [3])
+
+    cells, sub_ids = data.get_segments_cells([0, 2, 3, 4, 5])
+    np.testing.assert_array_equal(cells, [0, 0, 1, 2, 2])
+    np.testing.assert_array_equal(sub_ids, [0, 2, 0, 0, 1])
+
+
+def test_chain_keys_split_chains():
+    lines = make_lines()
+    keys = [1, 1, 2, 3, 4, 4]
+    data = LinesData(lines, consolidate=True, chain_keys=keys)
+
+    assert get_cells(data)[0] == [3, 2, 2, 3]
+    cells, _ = data.get_segments_cells(np.arange(len(lines)))
+    np.testing.assert_array_equal(cells, [0, 0, 1, 2, 3, 3])
+
+
+def test_chunks_join_across_boundaries():
+    lines = make_lines()
+    expected = LinesData(lines, consolidate=True)
+
+    data = LinesData(consolidate=True)
+    for chunk in (lines[:2], lines[2:5], lines[5:]):
+        data.append_chunk(chunk)
+    data.finish_chunks()
+
+    assert get_cells(data)[0] == get_cells(expected)[0]
+    np.testing.assert_array_equal(get_cells(data)[1], get_cells(expected)[1])
+    np.testing.assert_array_equal(data.get_segments_points().reshape(-1, 6), lines)
+
+
+def test_chunks_join_with_chain_keys():
+    lines = make_lines()
+    keys = np.array([1, 1, 2, 3, 4, 4])
+
+    data = LinesData(consolidate=True)
+    data.append_chunk(lines[:2], keys[:2])
+    data.append_chunk(lines[2:], keys[2:])
+    assert get_cells(data)[0] == [3, 2, 2, 3]
+
+    data = LinesData(consolidate=True)
+    data.append_chunk(lines[:2], keys[:2])
+    data.append_chunk(lines[2:], np.array([1, 3, 4, 4]))
+    assert get_cells(data)[0] == [4, 2, 3]
+
+
+def test_ids_switch_to_64_bits(monkeypatch):
+    lines = make_lines()
+    data = LinesData(lines[:2], consolidate=True)
+    assert not data.GetLines().IsStorage64Bit()
+
+    monkeypatch.setattr(vtkat.poly_data.lines_data, "_INT32_MAX", 4)
+    data.append_chunk(lines[2:])
+
+    assert data.GetLines().IsStorage64Bit()
+    assert data._offsets.dtype == data._connectivity.dtype == np.int64
+    assert get_cells(data)[0] == [4, 2, 3]
+    np.testing.assert_array_equal(data.get_segments_points().reshape(-1, 6), lines)
+
+
+def test_picker_caches_the_segments(monkeypatch):
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(400, 300)
+    render_window.AddRenderer(renderer)
+
+    actor = LinesActor(make_lines(), consolidate=True)
+    renderer.AddActor(actor)
+    renderer.ResetCamera()
+    data = actor.GetMapper().GetInput()
+
+    computed = []
+    get_segments_points = LinesData.get_segments_points
+    monkeypatch.setattr(
+        LinesData,
+        "get_segments_points",
+        lambda data: computed.append(data) or get_segments_points(data),
+    )
+
+    picker = CellAreaPicker()
+    for _ in range(2):
+        picker.area_pick(0, 0, 400, 300, renderer)
+        picker.polygon_pick([(0, 0), (400, 0), (400, 300), (0, 300)], renderer)
+    assert len(computed) == 1
+    np.testing.assert_array_equal(picker.get_picked_segments()[actor], np.arange(6))
+
+    data.append_chunk([(2, 9, 0, 3, 9, 0)])
+    picker.area_pick(0, 0, 400, 300, renderer)
+    assert len(computed) == 2
+    np.testing.assert_array_equal(picker.get_picked_segments()[actor], np.arange(7))
+    render_window.Finalize()
@@ -0,0 +1,167 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+import vtkat.utils.memory
+from vtkat.actors import LinesActor
+from vtkat.pickers import CellAreaPicker
+from vtkat.poly_data import VerticesData
+from vtkat.utils import MemoryBudget, set_polydata_colors, set_polydata_property
+
+
+def make_renderer():
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(400, 300)
+    render_window.AddRenderer(renderer)
+    return renderer, render_window
+
+
+def make_chains():
+    # two chains of segments along x, one above the other
+    x = np.arange(11, dtype=np.float32)
+    lines = []
+    for y in (0, 5):
+        for x0, x1 in zip(x[:-1], x[1:]):
+            lines.append((x0, y, 0, x1, y, 0))
+    return np.array(lines, dtype=np.float32)
+
+
+def hide_and_show(budget, actor):
+    actor.VisibilityOff()
+    assert budget.is_evicted(actor)
+    actor.VisibilityOn()
+    assert not budget.is_evicted(actor)
+
+
+def test_spilled_lines_are_restored(tmp_path):
+    renderer, render_window = make_renderer()
+    lines = make_chains()
+    actor = LinesActor.from_chunks(np.split(lines, 4), consolidate=True)
+    data = actor.GetMapper().GetInput()
+    set_polydata_colors(data, (255, 0, 0))
+    renderer.AddActor(actor)
+    renderer.ResetCamera()
+
+    budget = MemoryBudget(renderer, 0, spill_dir=tmp_path)
+    hide_and_show(budget, actor)
+
+    data = actor.GetMapper().GetInput()
+    assert data.GetNumberOfCells() == 2
+    assert data.get_number_of_segments() == len(lines)
+    assert data.GetCellData().GetScalars() is not None
+    np.testing.assert_array_equal(data.get_segments_points().reshape(-1, 6), lines)
+
+    picker = CellAreaPicker()
+    picker.area_pick(0, 0, 400, 300, renderer)
+    np.testing.assert_array_equal(picker.get_picked()[actor], [0, 1])
+    np.testing.assert_array_equal(
+        picker.get_picked_segments()[actor], np.arange(len(lines))
+    )
+
+    # the middle of the segment 13, in the second chain
+    renderer.SetWorldPoint(3.5, 5, 0, 1)
+    renderer.WorldToDisplay()
+    x, y, _ = renderer.GetDisplayPoint()
+    picker.pick(x, y, 0, renderer)
+    np.testing.assert_array_equal(picker.get_picked_segments()[actor], [13])
+
+    # the restored data still continues its last polyline
+    data.append_chunk([(10, 5, 0, 11, 5, 0)])
+    assert data.GetNumberOfCells() == 2
+    assert data.get_number_of_segments() == len(lines) + 1
+    budget.close()
+    render_window.Finalize()
+
+
+def test_spilled_vertices_are_restored(tmp_path):
+    renderer, render_window = make_renderer()
+    points = np.random.default_rng(0).uniform(-1, 1, (100, 3))
+    data = VerticesData(points, keep_source=False)
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    renderer.AddActor(actor)
+    renderer.ResetCamera()
+
+    budget = MemoryBudget(renderer, 0, spill_dir=tmp_path)
+    hide_and_show(budget, actor)
+
+    assert data.GetNumberOfCells() == len(points)
+    picker = CellAreaPicker()
+    picker.area_pick(0, 0, 400, 300, renderer)
+    assert len(picker.get_picked()[actor]) == len(points)
+
+    data.append_chunk([(0, 0, 0)])
+    assert data.GetNumberOfCells() == len(points) + 1
+    np.testing.assert_allclose(
+        data._coords.view[: len(points)], points.astype(np.float32)
+    )
+    budget.close()
+    render_window.Finalize()
+
+
+def test_rebuilt_lines_keep_their_cell_arrays():
+    renderer, render_window = make_renderer()
+    lines = make_chains()
+    actor = LinesActor(lines)
+    data = actor.GetMapper().GetInput()
+    set_polydata_colors(data, (0, 255, 0))
+    set_polydata_property(data, 7, "entity_index")
+    renderer.AddActor(actor)
+
+    budget = MemoryBudget(renderer, 0)
+    hide_and_show(budget, actor)
+
+    assert data.GetNumberOfCells() == len(lines)
+    scalars = data.GetCellData().GetScalars()
+    assert scalars.GetName() == "colors"
+    np.testing.assert_array_equal(vtk_to_numpy(scalars), [(0, 255, 0)] * len(lines))
+    assert set(vtk_to_numpy(data.GetCellData().GetArray("entity_index"))) == {7}
+    budget.close()
+    render_window.Finalize()
+
+
+def test_only_new_actors_are_measured(monkeypatch):
+    renderer, render_window = make_renderer()
+    for _ in range(3):
+        renderer.AddActor(LinesActor(make_chains()))
+    budget = MemoryBudget(renderer, 10**9)
+    budget.enforce()
+
+    measured = []
+    measure = vtkat.utils.memory.get_actor_memory_usage
+    monkeypatch.setattr(
+        vtkat.utils.memory,
+        "get_actor_memory_usage",
+        lambda actor: measured.append(actor) or measure(actor),
+    )
+
+    actor = LinesActor(make_chains())
+    renderer.AddActor(actor)
+    assert measured == [actor]
+    budget.close()
+    render_window.Finalize()
+
+
+def test_plain_poly_data_is_evicted(tmp_path):
+    renderer, render_window = make_renderer()
+    source = vtk.vtkSphereSource()
+    source.Update()
+    data = vtk.vtkPolyData()
+    data.DeepCopy(source.GetOutput())
+    cells = data.GetNumberOfCells()
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    renderer.AddActor(actor)
+
+    budget = MemoryBudget(renderer, 0, spill_dir=tmp_path)
+    hide_and_show(budget, actor)
+    assert data.GetNumberOfCells() == cells
+    budget.close()
+    render_window.Finalize()
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from vtkat.actors import GhostActor, SelectionShapeActor
+from vtkat.render_widgets.overlay_layer import OverlayLayer
+
+
+def make_scene(multi_samples: int):
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetMultiSamples(multi_samples)
+    render_window.SetSize(200, 150)
+    render_window.AddRenderer(renderer)
+
+    source = vtk.vtkSphereSource()
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputConnection(source.GetOutputPort())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    renderer.AddActor(actor)
+    renderer.ResetCamera()
+
+    overlay = OverlayLayer(renderer)
+    return renderer, render_window, overlay
+
+
+def count_renders(renderer: vtk.vtkRenderer) -> list:
+    renders = []
+    renderer.AddObserver("StartEvent", lambda obj, event: renders.append(event))
+    return renders
+
+
+def read_image(render_window: vtk.vtkRenderWindow) -> np.ndarray:
+    width, height = render_window.GetSize()
+    pixels = vtk.vtkUnsignedCharArray()
+    render_window.GetPixelData(0, 0, width - 1, height - 1, 1, pixels, 0)
+    return vtk_to_numpy(pixels).copy()
+
+
+@pytest.mark.parametrize("multi_samples", [0, 4])
+def test_overlay_only_render_matches_full_render(multi_samples):
+    renderer, render_window, overlay = make_scene(multi_samples)
+    render_window.Render()
+
+    shape = SelectionShapeActor(fill_opacity=0.25)
+    shape.set_polygon([(20, 20), (120, 30), (90, 110)])
+    overlay.add_actor(shape)
+
+    # with multisampling the whole window is always rendered
+    full_renders = 1 if multi_samples else 0
+    scene_renders = count_renders(renderer)
+    overlay.render()
+    assert len(scene_renders) == full_renders
+    overlay_only = read_image(render_window)
+
+    overlay.invalidate()
+    overlay.render()
+    full = read_image(render_window)
+    np.testing.assert_array_equal(overlay_only, full)
+
+    # the scene is read before the overlay, that is visible now
+    overlay.render()
+    np.testing.assert_array_equal(read_image(render_window), full)
+    assert len(scene_renders) == 1 + 2 * full_renders
+    render_window.Finalize()
+
+
+def test_render_skips_the_scene_while_the_cache_is_valid():
+    renderer, render_window, overlay = make_scene(0)
+    scene_renders = count_renders(renderer)
+    overlay_renders = count_renders(overlay.renderer)
+
+    overlay.render()
+    assert len(scene_renders) == len(overlay_renders) == 1
+
+    overlay.render()
+    overlay.render()
+    assert len(scene_renders) == 1
+    assert len(overlay_renders) == 3
+
+    renderer.GetActiveCamera().Azimuth(10)
+    overlay.render()
+    assert len(scene_renders) == 2
+
+    renderer.AddActor(vtk.vtkActor())
+    overlay.render()
+    assert len(scene_renders) == 3
+    render_window.Finalize()
+
+
+def test_ghost_is_only_in_the_overlay():
+    renderer, render_window, overlay = make_scene(0)
+    other_renderer = vtk.vtkRenderer()
+
+    ghost = GhostActor()
+    ghost.SetMapper(vtk.vtkPolyDataMapper())
+    renderer.AddActor(ghost)
+    other_renderer.AddActor(ghost)
+    ghost.make_ghost(overlay)
+
+    assert ghost.GetNumberOfConsumers() == 1
+    assert overlay.renderer.HasViewProp(ghost)
+    assert not renderer.HasViewProp(ghost)
+    assert not other_renderer.HasViewProp(ghost)
+    render_window.Finalize()
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+import vtk
+
+from vtkat.actors import OctreePointsActor
+from vtkat.utils import PointOctree, matrix_to_numpy
+from vtkat.utils.point_octree import _decode_morton, _encode_morton
+
+
+def make_cloud(number_of_points=64_000):
+    cloud = np.random.default_rng(0).uniform(0, 1, (number_of_points, 3))
+    return cloud.astype(np.float32)
+
+
+def test_morton_round_trip():
+    cells = np.array([(1, 0, 0), (0, 1, 0), (0, 0, 1), (1, 1, 1), (2, 0, 0)])
+    np.testing.assert_array_equal(
+        _encode_morton(cells.astype(np.uint64)), [1, 2, 4, 7, 8]
+    )
+
+    rng = np.random.default_rng(0)
+    cells = rng.integers(0, 1 << 21, (1000, 3), dtype=np.uint64)
+    cells[0] = (1 << 21) - 1
+    np.testing.assert_array_equal(_decode_morton(_encode_morton(cells)), cells)
+
+
+def test_nodes_contain_their_points():
+    octree = PointOctree(make_cloud(5000), max_depth=3)
+    assert len(octree) == 5000
+
+    for level in range(octree.max_depth + 1):
+        assert octree.counts[level].sum() == 5000
+        boxes = octree.get_node_boxes(level)
+        for index in range(0, len(boxes), 7):
+            points = octree.get_node_points(level, index)
+            assert len(points) == octree.counts[level][index]
+            assert (points >= boxes[index, :3]).all()
+            assert (points <= boxes[index, 3:]).all()
+
+    children, parents = octree.get_children(1, np.arange(len(octree.keys[1])))
+    np.testing.assert_array_equal(
+        np.bincount(parents, octree.counts[2][children]), octree.counts[1]
+    )
+
+
+def test_select_nodes_refines_by_size_and_fits_the_budget():
+    octree = PointOctree(make_cloud(), max_depth=3)
+
+    # a node of the level 2 covers about 75 pixels, the level 1 about 150
+    def pixels_per_unit(centers):
+        return np.full(len(centers), 300.0)
+
+    levels, indices, strides = octree.select_nodes(
+        np.empty((0, 4)), pixels_per_unit, max_node_pixels=128, point_budget=8100
+    )
+    assert (levels == 2).all()
+    np.testing.assert_array_equal(indices, np.arange(64))
+    counts = octree.counts[2][indices]
+    assert np.sum(-(-counts // strides)) <= 8100
+    assert (strides == 8).all()
+
+    # only the nodes where x >= 0.6
+    levels, indices, _ = octree.select_nodes(
+        np.array([(1, 0, 0, -0.6)]), pixels_per_unit, max_node_pixels=128
+    )
+    boxes = octree.get_node_boxes(2, indices)
+    assert len(indices) == 32
+    assert (boxes[:, 3] >= 0.6).all()
+
+
+@pytest.mark.parametrize("distance, level", [(100, 0), (3, 1)])
+def test_select_nodes_for_a_camera_distance(distance, level):
+    octree = PointOctree(make_cloud(), max_depth=3)
+    actor = OctreePointsActor(octree=octree)
+
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(400, 300)
+    render_window.AddRenderer(renderer)
+
+    # with the default view angle of 30 degrees, a unit at the distance d
+    # covers 300 / (2 tan(15) d) = 560 / d pixels, so a node of the level 1
+    # (0.5 units) covers about 93 pixels at 3 units and is not refined
+    camera = renderer.GetActiveCamera()
+    camera.SetFocalPoint(0.5, 0.5, 0.5)
+    camera.SetPosition(0.5, 0.5, 0.5 + distance)
+
+    matrix = matrix_to_numpy(actor.GetMatrix())
+    levels, _, _ = octree.select_nodes(
+        actor._get_frustum_planes(renderer),
+        actor._get_pixels_per_unit_function(renderer, matrix),
+    )
+    assert (levels == level).all()
+
+    assert actor.update_lod(renderer)
+    assert actor.GetMapper().GetInput().GetNumberOfPoints() > 0
+    assert not actor.update_lod(renderer)
+    render_window.Finalize()
@@ -0,0 +1,85 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from vtkat.poly_data import LinesData
+from vtkat.utils import (
+    hash_sources,
+    load_poly_data_cache,
+    save_poly_data_cache,
+    set_polydata_colors,
+    set_polydata_property,
+)
+
+
+def make_lines_data():
+    lines = np.arange(60, dtype=np.float32).reshape(10, 6)
+    data = LinesData(lines)
+    set_polydata_colors(data, (255, 0, 0))
+    set_polydata_property(data, 7, "entity_index")
+    return data
+
+
+def test_round_trip(tmp_path):
+    data = make_lines_data()
+    path = tmp_path / "lines.vtkatpd"
+
+    save_poly_data_cache(path, data)
+    loaded = load_poly_data_cache(path)
+
+    assert loaded.GetNumberOfPoints() == data.GetNumberOfPoints()
+    assert loaded.GetNumberOfCells() == data.GetNumberOfCells()
+    np.testing.assert_array_equal(
+        vtk_to_numpy(loaded.GetPoints().GetData()),
+        vtk_to_numpy(data.GetPoints().GetData()),
+    )
+    np.testing.assert_array_equal(
+        vtk_to_numpy(loaded.GetLines().GetConnectivityArray()),
+        vtk_to_numpy(data.GetLines().GetConnectivityArray()),
+    )
+
+    cell_data = loaded.GetCellData()
+    assert cell_data.GetScalars().GetName() == "colors"
+    np.testing.assert_array_equal(vtk_to_numpy(cell_data.GetScalars())[0], (255, 0, 0))
+    properties = cell_data.GetArray("entity_index")
+    assert properties.GetDataType() == vtk.VTK_UNSIGNED_INT
+    assert set(vtk_to_numpy(properties)) == {7}
+
+
+def test_content_hash(tmp_path):
+    source = tmp_path / "model.txt"
+    source.write_text("first version")
+    path = tmp_path / "lines.vtkatpd"
+
+    save_poly_data_cache(path, make_lines_data(), hash_sources(source))
+    assert load_poly_data_cache(path, hash_sources(source)) is not None
+
+    source.write_text("second version")
+    assert load_poly_data_cache(path, hash_sources(source)) is None
+    # no hash given, the cache is always accepted
+    assert load_poly_data_cache(path) is not None
+
+
+def test_hash_sources_mixes_files_and_bytes(tmp_path):
+    source = tmp_path / "model.txt"
+    source.write_text("model")
+
+    assert hash_sources(source) == hash_sources(source)
+    assert hash_sources(source, b"options") != hash_sources(source)
+    assert hash_sources(b"a", b"b") != hash_sources(b"ab")
+    assert hash_sources(b"ab", b"") != hash_sources(b"a", b"b")
+    # a file hashes like its contents
+    assert hash_sources(source) == hash_sources(b"model")
+
+
+def test_invalid_files(tmp_path):
+    assert load_poly_data_cache(tmp_path / "missing.vtkatpd") is None
+
+    not_a_cache = tmp_path / "other.vtkatpd"
+    not_a_cache.write_bytes(b"something else entirely")
+    assert load_poly_data_cache(not_a_cache) is None
+
+    path = tmp_path / "lines.vtkatpd"
+    save_poly_data_cache(path, make_lines_data())
+    path.write_bytes(path.read_bytes()[:-16])
+    assert load_poly_data_cache(path) is None
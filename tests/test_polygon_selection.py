@@ -0,0 +1,139 @@
+import numpy as np
+import vtk
+
+import vtkat.pickers.cell_area_picker
+from vtkat.pickers import CellAreaPicker, points_in_polygon, project_to_display
+from vtkat.pickers.polygon_selection import polygon_raster
+from vtkat.utils import get_cells_centers
+
+
+def make_renderer():
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(400, 300)
+    render_window.AddRenderer(renderer)
+
+    camera = renderer.GetActiveCamera()
+    camera.SetPosition(1, 2, 5)
+    camera.SetFocalPoint(0, 0, 0)
+    renderer.ResetCameraClippingRange(-2, 2, -2, 2, -2, 2)
+    return renderer, render_window
+
+
+def make_sphere_actor():
+    source = vtk.vtkSphereSource()
+    source.SetThetaResolution(24)
+    source.SetPhiResolution(24)
+    source.Update()
+    data = vtk.vtkPolyData()
+    data.DeepCopy(source.GetOutput())
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    return actor
+
+
+def even_odd_rule(points, polygon):
+    inside = np.zeros(len(points), dtype=bool)
+    for start, end in zip(polygon, np.roll(polygon, -1, axis=0)):
+        crosses = (start[1] > points[:, 1]) != (end[1] > points[:, 1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = start[0] + (points[:, 1] - start[1]) * (end[0] - start[0]) / (
+                end[1] - start[1]
+            )
+        inside ^= crosses & (points[:, 0] < x)
+    return inside
+
+
+def test_polygon_raster_of_a_rectangle():
+    rectangle = np.array([(1, 1), (4, 1), (4, 3), (1, 3)], dtype=float)
+    expected = np.zeros((4, 5), dtype=bool)
+    expected[1:3, 1:4] = True
+    np.testing.assert_array_equal(polygon_raster(rectangle, 5, 4), expected)
+
+
+def test_points_in_polygon_matches_the_even_odd_rule():
+    # a star, that crosses itself
+    angles = np.arange(5) * 4 * np.pi / 5
+    polygon = 50 + 40 * np.column_stack([np.cos(angles), np.sin(angles)])
+
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 100, (5000, 2))
+    points = pixels + 0.5
+
+    inside = points_in_polygon(points, polygon)
+    np.testing.assert_array_equal(inside, even_odd_rule(points, polygon))
+    assert 0 < inside.sum() < len(points)
+
+    assert not points_in_polygon(points, polygon[:2]).any()
+
+
+def test_project_to_display_matches_vtk():
+    renderer, render_window = make_renderer()
+    transform = vtk.vtkTransform()
+    transform.Translate(0.5, 0, 0)
+    transform.RotateZ(30)
+    matrix = transform.GetMatrix()
+
+    points = np.random.default_rng(0).uniform(-1, 1, (20, 3))
+    display, visible = project_to_display(points, renderer, matrix)
+    assert visible.all()
+
+    for point, position in zip(points, display):
+        renderer.SetWorldPoint(*transform.TransformPoint(point), 1)
+        renderer.WorldToDisplay()
+        np.testing.assert_allclose(position, renderer.GetDisplayPoint()[:2])
+
+    # behind the camera
+    _, visible = project_to_display(np.array([(2, 4, 10)]), renderer)
+    assert not visible.any()
+    render_window.Finalize()
+
+
+def test_polygon_pick():
+    renderer, render_window = make_renderer()
+    actor = make_sphere_actor()
+    renderer.AddActor(actor)
+    data = actor.GetMapper().GetInput()
+
+    # the left half of the window
+    polygon = [(0, 0), (200, 0), (200, 300), (0, 300)]
+    picker = CellAreaPicker()
+    picker.polygon_pick(polygon, renderer)
+
+    display, _ = project_to_display(get_cells_centers(data), renderer)
+    expected = np.flatnonzero(display[:, 0] < 200)
+    np.testing.assert_array_equal(picker.get_picked()[actor], expected)
+
+    actor.VisibilityOff()
+    picker.polygon_pick(polygon, renderer)
+    assert picker.get_picked() == {}
+    render_window.Finalize()
+
+
+def test_polygon_pick_caches_the_centers(monkeypatch):
+    renderer, render_window = make_renderer()
+    actor = make_sphere_actor()
+    renderer.AddActor(actor)
+    data = actor.GetMapper().GetInput()
+
+    computed = []
+    monkeypatch.setattr(
+        vtkat.pickers.cell_area_picker,
+        "get_cells_centers",
+        lambda data: computed.append(data) or get_cells_centers(data),
+    )
+
+    picker = CellAreaPicker()
+    polygon = [(0, 0), (400, 0), (400, 300), (0, 300)]
+    for _ in range(3):
+        picker.polygon_pick(polygon, renderer)
+    assert len(computed) == 1
+
+    data.Modified()
+    picker.polygon_pick(polygon, renderer)
+    assert len(computed) == 2
+    render_window.Finalize()
@@ -0,0 +1,73 @@
+from time import monotonic
+
+import numpy as np
+from PyQt5.QtCore import QCoreApplication
+
+from vtkat.poly_data import LinesData
+from vtkat.render_widgets import ProgressiveLoader
+
+# the chunks are loaded by the event loop
+app = QCoreApplication.instance() or QCoreApplication([])
+
+
+def make_chunks(number_of_chunks=50, lines_per_chunk=10):
+    for index in range(number_of_chunks):
+        lines = np.arange(6 * lines_per_chunk, dtype=np.float32)
+        yield lines.reshape(-1, 6) + 1000 * index
+
+
+def process_events(loader, timeout=2):
+    start = monotonic()
+    while loader.is_running and monotonic() - start < timeout:
+        QCoreApplication.processEvents()
+
+
+def get_buffers(data):
+    return data._coords, data._connectivity, data._offsets
+
+
+def test_all_chunks_are_loaded():
+    data = LinesData()
+    renders, finished = [], []
+    loader = ProgressiveLoader(data, make_chunks(), lambda: renders.append(1))
+    loader.finished.connect(lambda: finished.append(1))
+    loader.start()
+    process_events(loader)
+
+    assert finished == [1]
+    assert loader.loaded_chunks == 50
+    assert data.GetNumberOfCells() == 500
+    assert len(renders) > 0
+    for buffer in get_buffers(data):
+        assert buffer.capacity == len(buffer)
+
+
+def test_cancel_in_the_middle_of_a_load():
+    data = LinesData()
+    chunks = make_chunks()
+    renders, cancelled = [], []
+    loader = ProgressiveLoader(data, chunks, lambda: renders.append(1))
+    loader.cancelled.connect(lambda: cancelled.append(1))
+
+    def chunk_loaded(number_of_chunks):
+        if number_of_chunks == 7:
+            loader.cancel()
+
+    loader.chunk_loaded.connect(chunk_loaded)
+    loader.start()
+    process_events(loader)
+
+    assert cancelled == [1]
+    assert not loader.is_running
+    assert loader.loaded_chunks == 7
+    assert len(renders) == 1
+
+    # the partial data is finalized and the generator is closed
+    assert data.GetNumberOfCells() == 70
+    for buffer in get_buffers(data):
+        assert buffer.capacity == len(buffer)
+    assert next(chunks, None) is None
+
+    # a second cancel does nothing
+    loader.cancel()
+    assert cancelled == [1]
@@ -0,0 +1,64 @@
+import numpy as np
+import vtk
+
+from vtkat.utils import ScalarField, SelectionHighlighter
+
+
+def make_actor():
+    source = vtk.vtkPlaneSource()
+    source.SetResolution(4, 5)
+    source.Update()
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(source.GetOutput())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    return actor
+
+
+def test_steps_and_range():
+    actor = make_actor()
+    steps = np.arange(60, dtype=np.float32).reshape(3, 20)
+    field = ScalarField(actor, steps=steps)
+
+    assert field.set_step(0)
+    assert field.get_range() == (0.0, 19.0)
+    np.testing.assert_array_equal(field.get_values(), steps[0])
+
+    # the range is cached, so a step with the same range does not change it
+    assert not field.set_values(steps[0][::-1])
+    assert field.set_step(2)
+    assert actor.GetMapper().GetScalarRange() == (40.0, 59.0)
+    assert field.compute_global_range() == (0.0, 59.0)
+
+
+def test_fixed_range():
+    field = ScalarField(make_actor(), steps=np.random.rand(2, 20))
+    field.set_step(0)
+
+    assert field.set_range((-1, 1))
+    assert not field.set_step(1)
+    assert field.get_range() == (-1, 1)
+
+
+def test_highlight_replaces_field_colors():
+    actor = make_actor()
+    mapper = actor.GetMapper()
+    field = ScalarField(actor, name="stress", steps=np.random.rand(2, 20))
+    highlighter = SelectionHighlighter(actor)
+
+    field.set_step(0)
+    assert mapper.GetScalarMode() == vtk.VTK_SCALAR_MODE_USE_CELL_FIELD_DATA
+
+    highlighter.highlight([1, 2])
+    assert mapper.GetScalarMode() == vtk.VTK_SCALAR_MODE_USE_CELL_DATA
+    assert mapper.GetColorMode() == vtk.VTK_COLOR_MODE_DIRECT_SCALARS
+
+    # the next step shows the field again, and highlighting shows the selection
+    field.set_step(1)
+    assert mapper.GetScalarMode() == vtk.VTK_SCALAR_MODE_USE_CELL_FIELD_DATA
+    assert mapper.GetArrayName() == "stress"
+
+    highlighter.highlight([1, 2])
+    assert mapper.GetScalarMode() == vtk.VTK_SCALAR_MODE_USE_CELL_DATA
+    np.testing.assert_array_equal(highlighter.get_highlighted(), [1, 2])
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+import vtk
+
+from vtkat.pickers import (
+    as_selection,
+    combine_selections,
+    mask_to_selection,
+    selection_difference,
+    selection_intersection,
+    selection_to_mask,
+    selection_toggle,
+    selection_union,
+)
+from vtkat.pickers.selection import boxes_in_area_pick
+from vtkat.utils import get_cells_bounds, get_cells_centers
+
+
+def make_area_pick(parallel: bool):
+    renderer = vtk.vtkRenderer()
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(400, 300)
+    render_window.AddRenderer(renderer)
+
+    camera = renderer.GetActiveCamera()
+    camera.SetPosition(3, 4, 30)
+    camera.SetFocalPoint(0, 0, 0)
+    camera.SetParallelProjection(parallel)
+    camera.SetParallelScale(8)
+    renderer.ResetCameraClippingRange(-20, 20, -20, 20, -20, 20)
+
+    picker = vtk.vtkAreaPicker()
+    picker.AreaPick(120, 80, 260, 190, renderer)
+    return picker
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_boxes_in_area_pick_matches_vtk(parallel):
+    picker = make_area_pick(parallel)
+
+    rng = np.random.default_rng(0)
+    mins = rng.uniform(-15, 15, (2000, 3))
+    maxs = mins + rng.uniform(0, 3, (2000, 3))
+    bounds = np.column_stack([mins, maxs])[:, [0, 3, 1, 4, 2, 5]]
+
+    extractor = vtk.vtkExtractSelectedFrustum()
+    extractor.SetFrustum(picker.GetFrustum())
+    expected = [bool(extractor.OverallBoundsTest(box.tolist())) for box in bounds]
+
+    result = boxes_in_area_pick(bounds, picker)
+    np.testing.assert_array_equal(result, expected)
+    assert 0 < result.sum() < len(bounds)
+
+
+def test_get_cells_bounds_matches_vtk():
+    source = vtk.vtkSphereSource()
+    source.Update()
+    data = source.GetOutput()
+
+    expected = np.empty((data.GetNumberOfCells(), 6))
+    cell_bounds = [0.0] * 6
+    for i in range(data.GetNumberOfCells()):
+        data.GetCellBounds(i, cell_bounds)
+        expected[i] = cell_bounds
+
+    np.testing.assert_allclose(get_cells_bounds(data), expected)
+
+
+def test_selection_operations():
+    a = as_selection([5, 1, 3, 3])
+    b = as_selection([3, 4])
+
+    np.testing.assert_array_equal(a, [1, 3, 5])
+    assert a.dtype == np.int64
+    assert not a.flags.writeable
+
+    np.testing.assert_array_equal(selection_union(a, b), [1, 3, 4, 5])
+    np.testing.assert_array_equal(selection_intersection(a, b), [3])
+    np.testing.assert_array_equal(selection_difference(a, b), [1, 5])
+    np.testing.assert_array_equal(selection_toggle(a, b), [1, 4, 5])
+
+
+def test_selection_masks():
+    selection = as_selection([0, 2, 5])
+    mask = selection_to_mask(selection, 6)
+
+    np.testing.assert_array_equal(mask, [1, 0, 1, 0, 0, 1])
+    np.testing.assert_array_equal(mask_to_selection(mask), selection)
+
+
+def test_combine_selections():
+    first, second = object(), object()
+    current = {first: as_selection([1, 2]), second: as_selection([7])}
+    new = {first: as_selection([2])}
+
+    result = combine_selections(current, new, "difference")
+    assert result.keys() == {first, second}
+    np.testing.assert_array_equal(result[first], [1])
+
+    result = combine_selections(current, new, "replace")
+    assert result.keys() == {first}
+
+
+def test_cells_with_empty_cells_last():
+    points = vtk.vtkPoints()
+    for point in [(0, 0, 0), (1, 2, 0), (4, 1, 3), (5, 5, 5)]:
+        points.InsertNextPoint(point)
+
+    lines = vtk.vtkCellArray()
+    lines.InsertNextCell(0)
+    lines.InsertNextCell(2, [0, 1])
+    lines.InsertNextCell(3, [1, 2, 3])
+    lines.InsertNextCell(0)
+    lines.InsertNextCell(0)
+
+    data = vtk.vtkPolyData()
+    data.SetPoints(points)
+    data.SetLines(lines)
+
+    bounds = get_cells_bounds(data)
+    assert np.isnan(bounds[[0, 3, 4]]).all()
+    np.testing.assert_array_equal(bounds[1], (0, 1, 0, 2, 0, 0))
+    np.testing.assert_array_equal(bounds[2], (1, 5, 1, 5, 0, 5))
+
+    centers = get_cells_centers(data)
+    assert np.isnan(centers[[0, 3, 4]]).all()
+    np.testing.assert_allclose(centers[1], (0.5, 1, 0))
+    np.testing.assert_allclose(centers[2], (10 / 3, 8 / 3, 8 / 3))
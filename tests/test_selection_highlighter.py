@@ -0,0 +1,87 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from vtkat.utils import SelectionHighlighter
+
+
+def make_actor(colors=None):
+    source = vtk.vtkPlaneSource()
+    source.SetResolution(4, 5)
+    source.Update()
+    data = source.GetOutput()
+
+    if colors is not None:
+        array = numpy_to_vtk(colors, deep=True)
+        array.SetName("colors")
+        data.GetCellData().SetScalars(array)
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    return actor
+
+
+def get_colors(actor):
+    return vtk_to_numpy(actor.GetMapper().GetInput().GetCellData().GetScalars())
+
+
+def get_mask(actor):
+    cell_data = actor.GetMapper().GetInput().GetCellData()
+    return vtk_to_numpy(cell_data.GetArray("selected"))
+
+
+def test_highlight_replace_and_clear():
+    original = np.random.default_rng(0).integers(0, 200, (20, 3), dtype=np.uint8)
+    actor = make_actor(original)
+    highlighter = SelectionHighlighter(actor, color=(255, 0, 255))
+
+    highlighter.highlight([3, 1, 3])
+    np.testing.assert_array_equal(highlighter.get_highlighted(), [1, 3])
+    expected = original.copy()
+    expected[[1, 3]] = (255, 0, 255)
+    np.testing.assert_array_equal(get_colors(actor), expected)
+    np.testing.assert_array_equal(np.flatnonzero(get_mask(actor)), [1, 3])
+
+    # the second highlight replaces the first one
+    highlighter.highlight([3, 5])
+    expected = original.copy()
+    expected[[3, 5]] = (255, 0, 255)
+    np.testing.assert_array_equal(get_colors(actor), expected)
+    np.testing.assert_array_equal(np.flatnonzero(get_mask(actor)), [3, 5])
+
+    highlighter.add([7])
+    highlighter.remove([3])
+    np.testing.assert_array_equal(highlighter.get_highlighted(), [5, 7])
+
+    highlighter.clear()
+    np.testing.assert_array_equal(get_colors(actor), original)
+    assert not get_mask(actor).any()
+    assert len(highlighter.get_highlighted()) == 0
+
+
+def test_highlight_without_colors_uses_the_actor_color():
+    actor = make_actor()
+    actor.GetProperty().SetColor(0, 1, 0)
+    highlighter = SelectionHighlighter(actor)
+
+    highlighter.highlight([0, 19, 25])
+    np.testing.assert_array_equal(highlighter.get_highlighted(), [0, 19])
+    assert tuple(get_colors(actor)[0]) == (255, 50, 50)
+
+    highlighter.clear()
+    np.testing.assert_array_equal(get_colors(actor), [(0, 255, 0)] * 20)
+
+
+def test_replaced_data_drops_the_selection():
+    actor = make_actor(np.zeros((20, 3), dtype=np.uint8))
+    highlighter = SelectionHighlighter(actor)
+    highlighter.highlight([1, 2])
+
+    new_actor = make_actor(np.zeros((20, 3), dtype=np.uint8))
+    actor.GetMapper().SetInputData(new_actor.GetMapper().GetInput())
+    highlighter.highlight([4])
+
+    np.testing.assert_array_equal(highlighter.get_highlighted(), [4])
+    np.testing.assert_array_equal(np.flatnonzero(get_colors(actor).any(axis=1)), [4])
@@ -1,4 +1,6 @@
 from .ghost_actor import GhostActor
 from .lines_actor import LinesActor
+from .octree_points_actor import OctreePointsActor
 from .round_points_actor import RoundPointsActor
+from .selection_shape_actor import SelectionShapeActor
 from .square_points_actor import SquarePointsActor
@@ -2,8 +2,19 @@ import vtk
 
 
 class GhostActor(vtk.vtkActor):
-    def make_ghost(self):
+    def make_ghost(self, overlay_layer=None):
+        """
+        Makes the actor appear in front of everything. If an overlay layer
+        is given, the actor is moved from the scene to the overlay (and
+        only kept there), where it is drawn in front without offsetting
+        its depth.
+        """
         self.GetProperty().LightingOff()
+
+        if overlay_layer is not None:
+            overlay_layer.add_actor(self)
+            return
+
         offset = -66000
         mapper = self.GetMapper()
         mapper.SetResolveCoincidentTopologyToPolygonOffset()
@@ -4,14 +4,38 @@ from vtkat.poly_data import LinesData
 
 
 class LinesActor(vtk.vtkActor):
-    def __init__(self, lines_list) -> None:
+    def __init__(
+        self,
+        lines_list,
+        data: LinesData | None = None,
+        keep_source: bool = True,
+        consolidate: bool = False,
+    ) -> None:
         super().__init__()
         self.lines_list = lines_list
+        self.consolidate = consolidate
+        self._prebuilt_data = data
 
         self.build()
 
+        if not keep_source:
+            self.release_source()
+
+    @classmethod
+    def from_chunks(
+        cls, chunks, size_hint: int = 0, consolidate: bool = False
+    ) -> "LinesActor":
+        data = LinesData.from_chunks(chunks, size_hint, consolidate)
+        return cls(data.lines_list, data=data, consolidate=consolidate)
+
     def build(self):
-        data = LinesData(self.lines_list)
+        if self._prebuilt_data is not None:
+            data, self._prebuilt_data = self._prebuilt_data, None
+        elif self.lines_list is None:
+            raise ValueError("The source of this actor was released")
+        else:
+            data = LinesData(self.lines_list, consolidate=self.consolidate)
+
         mapper = vtk.vtkPolyDataMapper()
         mapper.SetInputData(data)
         self.SetMapper(mapper)
@@ -20,6 +44,16 @@ class LinesActor(vtk.vtkActor):
     def set_width(self, width):
         self.GetProperty().SetLineWidth(width)
 
+    def release_source(self):
+        """
+        Drops the reference to the source list (here and in the poly data),
+        keeping only the vtk arrays. The actor can not be built again.
+        """
+        self.lines_list = None
+        data = self.GetMapper().GetInput()
+        if isinstance(data, LinesData):
+            data.release_source()
+
     def appear_in_front(self, cond: bool):
         # this offset is the Z position of the camera buffer.
         # if it is -66000 the object stays in front of everything.
@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import vtk
+
+from vtkat.poly_data import VerticesData
+from vtkat.utils import matrix_to_numpy
+from vtkat.utils.point_octree import PointOctree
+
+from .square_points_actor import SquarePointsActor
+
+
+class OctreePointsActor(SquarePointsActor):
+    """
+    Shows big point clouds (that may be memory mapped) with a level of
+    detail that follows the camera.
+
+    Before every render of its renderer (see `set_renderer`) only the
+    octree nodes inside the camera frustum are chosen, each one with
+    the density needed to fill the screen, within a point budget. The
+    points of the most recently used nodes are kept in a LRU cache, so
+    moving the camera does not read the same nodes again.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray | None = None,
+        octree: PointOctree | None = None,
+        point_budget: int = 1_000_000,
+        point_spacing: float = 2,
+        max_node_pixels: float = 128,
+        cache_size: int = 4_000_000,
+        cache_path: str | Path | None = None,
+    ) -> None:
+        if octree is None:
+            octree = PointOctree(points, cache_path=cache_path)
+        self.octree = octree
+
+        self.point_budget = point_budget
+        self.point_spacing = point_spacing
+        self.max_node_pixels = max_node_pixels
+
+        # maximum number of points kept in the node cache
+        self.cache_size = cache_size
+        self._node_cache = OrderedDict()
+        self._cached_points = 0
+
+        self._selection = None
+        self._data_mtime = None
+        self._renderer = None
+        self._observer = None
+
+        data = VerticesData()
+        # the lod points are not a source that could be built again
+        data.release_source()
+        super().__init__(None, data=data)
+        self.GetProperty().SetPointSize(2)
+
+    def set_renderer(self, renderer: vtk.vtkRenderer | None):
+        """
+        The level of detail is updated at the start of every render
+        of this renderer. It should be the one showing the actor.
+        """
+        if self._renderer is not None:
+            self._renderer.RemoveObserver(self._observer)
+            self._renderer = self._observer = None
+
+        if renderer is not None:
+            self._renderer = renderer
+            self._observer = renderer.AddObserver("StartEvent", self._renderer_started)
+
+    def update_lod(self, renderer: vtk.vtkRenderer) -> bool:
+        """
+        Chooses the points shown for the camera of the renderer.
+        Returns True if they changed.
+        """
+        width, height = renderer.GetSize()
+        if width == 0 or height == 0:
+            return False
+
+        matrix = matrix_to_numpy(self.GetMatrix())
+        planes = self._get_frustum_planes(renderer) @ matrix
+        pixels_per_unit = self._get_pixels_per_unit_function(renderer, matrix)
+
+        levels, indices, strides = self.octree.select_nodes(
+            planes,
+            pixels_per_unit,
+            self.max_node_pixels,
+            self.point_spacing,
+            self.point_budget,
+        )
+
+        data = self.GetMapper().GetInput()
+        selection = np.concatenate([levels, indices, strides]).tobytes()
+        if selection == self._selection and data.GetMTime() == self._data_mtime:
+            return False
+
+        chunks = [
+            self._get_node_points(level, index, stride)
+            for level, index, stride in zip(levels, indices, strides)
+        ]
+        points = np.concatenate(chunks) if chunks else np.empty((0, 3), np.float32)
+
+        data.clear_chunks()
+        data.reserve(len(points))
+        data.append_chunk(points)
+
+        self._selection = selection
+        self._data_mtime = data.GetMTime()
+        return True
+
+    def clear_cache(self):
+        self._node_cache.clear()
+        self._cached_points = 0
+
+    def _renderer_started(self, obj, event):
+        if self.GetVisibility():
+            self.update_lod(obj)
+
+    def _get_node_points(self, level, index, stride):
+        key = (level, index, stride)
+        if key in self._node_cache:
+            self._node_cache.move_to_end(key)
+            return self._node_cache[key]
+
+        points = np.ascontiguousarray(
+            self.octree.get_node_points(level, index, stride), dtype=np.float32
+        )
+        self._node_cache[key] = points
+        self._cached_points += len(points)
+
+        while self._cached_points > self.cache_size and len(self._node_cache) > 1:
+            _, removed = self._node_cache.popitem(last=False)
+            self._cached_points -= len(removed)
+        return points
+
+    def _get_frustum_planes(self, renderer: vtk.vtkRenderer) -> np.ndarray:
+        planes = [0.0] * 24
+        camera = renderer.GetActiveCamera()
+        camera.GetFrustumPlanes(renderer.GetTiledAspectRatio(), planes)
+
+        # The near and far planes come from the clipping range, that is
+        # computed from the points currently loaded, so they are ignored.
+        return np.array(planes).reshape(6, 4)[:4]
+
+    def _get_pixels_per_unit_function(self, renderer, matrix):
+        camera = renderer.GetActiveCamera()
+        _, height = renderer.GetSize()
+
+        # the node sizes are in the actor coordinates
+        scale = abs(np.linalg.det(matrix[:3, :3])) ** (1 / 3)
+
+        if camera.GetParallelProjection():
+            pixels = scale * height / (2 * camera.GetParallelScale())
+            return lambda centers: np.full(len(centers), pixels)
+
+        eye = np.array(camera.GetPosition())
+        direction = np.array(camera.GetDirectionOfProjection())
+        view_height = 2 * np.tan(np.radians(camera.GetViewAngle()) / 2)
+
+        def pixels_per_unit(centers):
+            world_centers = centers @ matrix[:3, :3].T + matrix[:3, 3]
+            depth = (world_centers - eye) @ direction
+            # nodes around the camera are always refined
+            depth = np.maximum(depth, 1e-9)
+            return scale * height / (view_height * depth)
+
+        return pixels_per_unit
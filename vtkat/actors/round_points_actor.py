@@ -2,6 +2,6 @@ from .square_points_actor import SquarePointsActor
 
 
 class RoundPointsActor(SquarePointsActor):
-    def __init__(self, points) -> None:
-        super().__init__(points)
+    def __init__(self, points, data=None, keep_source=True) -> None:
+        super().__init__(points, data, keep_source)
         self.GetProperty().RenderPointsAsSpheresOn()
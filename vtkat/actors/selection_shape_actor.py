@@ -0,0 +1,62 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk
+
+
+class SelectionShapeActor(vtk.vtkActor2D):
+    """
+    The outline of a selection (a box or a lasso) drawn in display
+    coordinates, usually in an overlay layer. Convex shapes (like boxes)
+    may also be filled with a translucent color.
+    """
+
+    def __init__(
+        self, color: tuple = (255, 0, 0, 255), fill_opacity: float = 0
+    ) -> None:
+        super().__init__()
+        self.color = color
+        self.fill_opacity = fill_opacity
+
+        self._data = vtk.vtkPolyData()
+        mapper = vtk.vtkPolyDataMapper2D()
+        mapper.SetInputData(self._data)
+        mapper.SetColorModeToDirectScalars()
+        mapper.SetScalarModeToUseCellData()
+        self.SetMapper(mapper)
+        self.GetProperty().SetLineWidth(2)
+
+    def set_polygon(self, polygon):
+        """
+        Sets the (n, 2) display coordinates of the closed shape.
+        """
+        polygon = np.asarray(polygon, dtype=np.float32).reshape(-1, 2)
+        size = len(polygon)
+        if size == 0:
+            self._data.Initialize()
+            return
+
+        coords = np.zeros((size, 3), dtype=np.float32)
+        coords[:, :2] = polygon
+        points = vtk.vtkPoints()
+        points.SetData(numpy_to_vtk(coords, deep=True))
+
+        # the outline is closed by repeating the first point
+        outline = vtk.vtkCellArray()
+        outline.InsertNextCell(size + 1, [*range(size), 0])
+
+        fill = vtk.vtkCellArray()
+        if self.fill_opacity > 0 and size >= 3:
+            fill.InsertNextCell(size, list(range(size)))
+
+        # the cells are ordered as lines and then polygons
+        red, green, blue, alpha = self.color
+        fill_alpha = int(255 * self.fill_opacity)
+        colors = [(red, green, blue, alpha)]
+        colors += [(red, green, blue, fill_alpha)] * fill.GetNumberOfCells()
+        cell_colors = numpy_to_vtk(np.array(colors, dtype=np.uint8), deep=True)
+
+        self._data.SetPoints(points)
+        self._data.SetLines(outline)
+        self._data.SetPolys(fill)
+        self._data.GetCellData().SetScalars(cell_colors)
+        self._data.Modified()
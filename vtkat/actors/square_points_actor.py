@@ -4,13 +4,30 @@ from vtkat.poly_data import VerticesData
 
 
 class SquarePointsActor(vtk.vtkActor):
-    def __init__(self, points_list) -> None:
+    def __init__(
+        self, points_list, data: VerticesData | None = None, keep_source: bool = True
+    ) -> None:
         super().__init__()
         self.points_list = points_list
+        self._prebuilt_data = data
         self.build()
 
+        if not keep_source:
+            self.release_source()
+
+    @classmethod
+    def from_chunks(cls, chunks, size_hint: int = 0) -> "SquarePointsActor":
+        data = VerticesData.from_chunks(chunks, size_hint)
+        return cls(data.points_list, data=data)
+
     def build(self):
-        data = VerticesData(self.points_list)
+        if self._prebuilt_data is not None:
+            data, self._prebuilt_data = self._prebuilt_data, None
+        elif self.points_list is None:
+            raise ValueError("The source of this actor was released")
+        else:
+            data = VerticesData(self.points_list)
+
         mapper = vtk.vtkPolyDataMapper()
         mapper.SetInputData(data)
         self.SetMapper(mapper)
@@ -21,6 +38,16 @@ class SquarePointsActor(vtk.vtkActor):
     def set_size(self, size):
         self.GetProperty().SetPointSize(size)
 
+    def release_source(self):
+        """
+        Drops the reference to the source list (here and in the poly data),
+        keeping only the vtk arrays. The actor can not be built again.
+        """
+        self.points_list = None
+        data = self.GetMapper().GetInput()
+        if isinstance(data, VerticesData):
+            data.release_source()
+
     def appear_in_front(self, cond: bool):
         # this offset is the Z position of the camera buffer.
         # if it is -66000 the object stays in front of everything.
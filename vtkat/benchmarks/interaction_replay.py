@@ -0,0 +1,396 @@
+"""
+Records the mouse events of an interactor and replays them headlessly,
+measuring how long the interactor style takes to handle every event.
+
+Run `python -m vtkat.benchmarks.interaction_replay --help` to replay a
+recorded (or synthetic) event stream over a synthetic scene.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from time import perf_counter, sleep
+
+import numpy as np
+import vtk
+
+from vtkat.actors import LinesActor
+from vtkat.interactor_styles import (
+    ArcballCameraInteractorStyle,
+    BoxSelectionInteractorStyle,
+    LassoSelectionInteractorStyle,
+)
+from vtkat.render_widgets.overlay_layer import OverlayLayer
+from vtkat.utils import SceneBoundsTracker
+
+RECORDED_EVENTS = (
+    "LeftButtonPressEvent",
+    "LeftButtonReleaseEvent",
+    "MiddleButtonPressEvent",
+    "MiddleButtonReleaseEvent",
+    "RightButtonPressEvent",
+    "RightButtonReleaseEvent",
+    "MouseMoveEvent",
+    "MouseWheelForwardEvent",
+    "MouseWheelBackwardEvent",
+)
+
+INTERACTOR_STYLES = {
+    "arcball": ArcballCameraInteractorStyle,
+    "box": BoxSelectionInteractorStyle,
+    "lasso": LassoSelectionInteractorStyle,
+}
+
+
+class EventRecorder:
+    """
+    Records the mouse events received by an interactor, with their
+    positions, modifier keys and timing, to be replayed later.
+    """
+
+    def __init__(self, interactor: vtk.vtkRenderWindowInteractor) -> None:
+        self.interactor = interactor
+        self.events = []
+        self._observers = []
+        self._start_time = 0
+
+    def start(self):
+        if self._observers:
+            return
+
+        self.events = []
+        self._start_time = perf_counter()
+        for event in RECORDED_EVENTS:
+            # high priority, so the event is recorded before being handled
+            observer = self.interactor.AddObserver(event, self._record, 100.0)
+            self._observers.append(observer)
+
+    def stop(self):
+        for observer in self._observers:
+            self.interactor.RemoveObserver(observer)
+        self._observers.clear()
+
+    def save(self, path: str | Path):
+        save_events(path, self.events)
+
+    def _record(self, obj, event):
+        x, y = self.interactor.GetEventPosition()
+        width, height = self.interactor.GetSize()
+        self.events.append(
+            dict(
+                time=perf_counter() - self._start_time,
+                event=event,
+                position=(x, y),
+                size=(width, height),
+                control=bool(self.interactor.GetControlKey()),
+                shift=bool(self.interactor.GetShiftKey()),
+            )
+        )
+
+
+class ReplayReport:
+    """
+    Latencies (in seconds) and number of renders of every replayed event.
+    """
+
+    def __init__(self, events: list, latencies, renders, wall_time: float) -> None:
+        self.events = [event["event"] for event in events]
+        self.latencies = np.asarray(latencies, dtype=float)
+        self.renders = np.asarray(renders, dtype=int)
+        self.wall_time = wall_time
+
+    def get_percentiles(self, event: str | None = None, percentiles=(50, 90, 99)):
+        latencies = self._get_latencies(event)
+        if len(latencies) == 0:
+            return dict.fromkeys(percentiles, np.nan)
+        values = np.percentile(latencies, percentiles)
+        return dict(zip(percentiles, values))
+
+    def get_render_count(self, event: str | None = None) -> int:
+        if event is None:
+            return int(self.renders.sum())
+        mask = np.array([name == event for name in self.events], dtype=bool)
+        return int(self.renders[mask].sum())
+
+    def to_dict(self) -> dict:
+        result = dict(
+            events=len(self.events),
+            renders=self.get_render_count(),
+            wall_time=self.wall_time,
+            latency=self._summarize(None),
+            by_event=dict(),
+        )
+        for event in sorted(set(self.events)):
+            result["by_event"][event] = self._summarize(event)
+        return result
+
+    def summary(self) -> str:
+        lines = [
+            f"{len(self.events)} events, {self.get_render_count()} renders, "
+            f"{self.wall_time:.3f} s total",
+            f"{'event':<28}{'count':>7}{'renders':>9}"
+            f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for event in sorted(set(self.events)) + [None]:
+            info = self._summarize(event)
+            lines.append(
+                f"{event or 'all':<28}{info['count']:>7}{info['renders']:>9}"
+                f"{info['p50'] * 1000:>10.2f}{info['p90'] * 1000:>10.2f}"
+                f"{info['p99'] * 1000:>10.2f}{info['max'] * 1000:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def _get_latencies(self, event):
+        if event is None:
+            return self.latencies
+        mask = np.array([name == event for name in self.events], dtype=bool)
+        return self.latencies[mask]
+
+    def _summarize(self, event):
+        latencies = self._get_latencies(event)
+        p50, p90, p99 = self.get_percentiles(event).values()
+        return dict(
+            count=len(latencies),
+            renders=self.get_render_count(event),
+            p50=float(p50),
+            p90=float(p90),
+            p99=float(p99),
+            max=float(latencies.max()) if len(latencies) else np.nan,
+        )
+
+
+def save_events(path: str | Path, events: list):
+    with open(path, "w") as file:
+        for event in events:
+            file.write(json.dumps(event) + "\n")
+
+
+def load_events(path: str | Path) -> list:
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def replay_events(interactor, events: list, realtime: bool = False) -> ReplayReport:
+    """
+    Sends the events to the interactor (or to the interactor of a render
+    widget) and measures the time each one takes to be handled.
+
+    Positions are scaled if the recording window had another size. If
+    `realtime` is set, the original interval between events is kept.
+    """
+    if hasattr(interactor, "render_interactor"):
+        interactor = interactor.render_interactor
+
+    render_window = interactor.GetRenderWindow()
+    render_count = [0]
+
+    def count_render(obj, event):
+        render_count[0] += 1
+
+    observer = render_window.AddObserver("StartEvent", count_render)
+
+    width, height = interactor.GetSize()
+    latencies = []
+    renders = []
+    start_time = perf_counter()
+
+    try:
+        for event in events:
+            if realtime:
+                delay = event["time"] - (perf_counter() - start_time)
+                if delay > 0:
+                    sleep(delay)
+
+            x, y = event["position"]
+            recorded_width, recorded_height = event.get("size", (width, height))
+            x = round(x * width / max(recorded_width, 1))
+            y = round(y * height / max(recorded_height, 1))
+
+            interactor.SetEventInformation(
+                x, y, int(event.get("control", 0)), int(event.get("shift", 0))
+            )
+            render_count[0] = 0
+            event_start = perf_counter()
+            interactor.InvokeEvent(event["event"])
+            latencies.append(perf_counter() - event_start)
+            renders.append(render_count[0])
+    finally:
+        render_window.RemoveObserver(observer)
+
+    wall_time = perf_counter() - start_time
+    return ReplayReport(events, latencies, renders, wall_time)
+
+
+def make_offscreen_interactor(
+    renderer: vtk.vtkRenderer | None = None,
+    interactor_style: vtk.vtkInteractorStyle | None = None,
+    size=(800, 600),
+) -> vtk.vtkRenderWindowInteractor:
+    """
+    An interactor with an offscreen render window, that can receive
+    replayed events without a display or a Qt application. The style
+    gets an overlay layer and a bounds tracker, as in the render widgets.
+    """
+    if renderer is None:
+        renderer = vtk.vtkRenderer()
+
+    if interactor_style is None:
+        interactor_style = ArcballCameraInteractorStyle()
+
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(*size)
+    render_window.AddRenderer(renderer)
+
+    interactor = vtk.vtkGenericRenderWindowInteractor()
+    interactor.SetRenderWindow(render_window)
+    interactor.SetInteractorStyle(interactor_style)
+    interactor.Initialize()
+    interactor_style.SetDefaultRenderer(renderer)
+
+    if isinstance(interactor_style, ArcballCameraInteractorStyle):
+        interactor_style.set_overlay_layer(OverlayLayer(renderer))
+        interactor_style.set_scene_bounds_tracker(SceneBoundsTracker(renderer))
+
+    render_window.Render()
+    return interactor
+
+
+def make_synthetic_scene(
+    renderer: vtk.vtkRenderer,
+    number_of_actors: int = 100,
+    lines_per_actor: int = 1000,
+    seed: int = 0,
+):
+    """
+    Fills the renderer with actors of random line segments.
+    """
+    rng = np.random.default_rng(seed)
+    actors = []
+    for _ in range(number_of_actors):
+        center = rng.uniform(-50, 50, 3)
+        start = center + rng.normal(0, 5, (lines_per_actor, 3))
+        end = start + rng.normal(0, 1, (lines_per_actor, 3))
+        actor = LinesActor(list(zip(start.tolist(), end.tolist())))
+        renderer.AddActor(actor)
+        actors.append(actor)
+
+    renderer.ResetCamera()
+    return actors
+
+
+def make_synthetic_events(size=(800, 600), steps: int = 60) -> list:
+    """
+    A right button rotation, a sequence of wheel zooms and a left button
+    drag (a box or lasso selection, depending on the interactor style).
+    """
+    width, height = size
+    events = []
+    time = 0
+
+    def add(event, x, y):
+        nonlocal time
+        time += 1 / 60
+        events.append(
+            dict(
+                time=time,
+                event=event,
+                position=(int(x), int(y)),
+                size=(width, height),
+                control=False,
+                shift=False,
+            )
+        )
+
+    angles = np.linspace(0, 2 * np.pi, steps)
+    path_x = width / 2 + width / 4 * np.cos(angles)
+    path_y = height / 2 + height / 4 * np.sin(angles)
+
+    add("RightButtonPressEvent", path_x[0], path_y[0])
+    for x, y in zip(path_x, path_y):
+        add("MouseMoveEvent", x, y)
+    add("RightButtonReleaseEvent", path_x[-1], path_y[-1])
+
+    for i in range(steps // 4):
+        event = "MouseWheelForwardEvent" if i % 2 else "MouseWheelBackwardEvent"
+        add(event, width / 2, height / 2)
+
+    add("LeftButtonPressEvent", path_x[0], path_y[0])
+    for x, y in zip(path_x, path_y):
+        add("MouseMoveEvent", x, y)
+    add("LeftButtonReleaseEvent", path_x[-1], path_y[-1])
+
+    return events
+
+
+def record_events(path: str | Path, number_of_actors: int, lines_per_actor: int):
+    """
+    Opens a render widget with the synthetic scene and records the
+    events until the window is closed.
+    """
+    from PyQt5.QtWidgets import QApplication
+
+    from vtkat.render_widgets import CommonRenderWidget
+
+    app = QApplication.instance() or QApplication([])
+    widget = CommonRenderWidget()
+    make_synthetic_scene(widget.renderer, number_of_actors, lines_per_actor)
+
+    recorder = EventRecorder(widget.render_interactor)
+    recorder.start()
+    widget.resize(800, 600)
+    widget.show()
+    app.exec_()
+    recorder.stop()
+    recorder.save(path)
+    return recorder.events
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Replays mouse events over a synthetic scene "
+        "and reports the latency of every kind of event."
+    )
+    parser.add_argument(
+        "events",
+        nargs="?",
+        help="events file (json lines). A synthetic stream is used if omitted.",
+    )
+    parser.add_argument("--record", action="store_true", help="record the events file")
+    parser.add_argument("--style", choices=INTERACTOR_STYLES, default="arcball")
+    parser.add_argument("--actors", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=1000, help="lines per actor")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--json", help="also save the report to this file")
+    args = parser.parse_args(args)
+
+    if args.record:
+        if args.events is None:
+            parser.error("an events file is needed to record")
+        record_events(args.events, args.actors, args.lines)
+        return
+
+    size = (args.width, args.height)
+    if args.events is None:
+        events = make_synthetic_events(size)
+    else:
+        events = load_events(args.events)
+
+    renderer = vtk.vtkRenderer()
+    make_synthetic_scene(renderer, args.actors, args.lines)
+    interactor = make_offscreen_interactor(
+        renderer, INTERACTOR_STYLES[args.style](), size
+    )
+
+    report = replay_events(interactor, events, realtime=args.realtime)
+    print(report.summary())
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report.to_dict(), file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Compares LinesData built with one cell per segment and with the segment
+chains consolidated in polylines, and the consolidated data with its cell
+ids stored in 32 bits (the default while they fit) and in 64 bits,
+reporting the memory, the build time and the render time of all of them.
+
+Run `python -m vtkat.benchmarks.lines_consolidation --help` for the
+size of the synthetic chains.
+"""
+
+import argparse
+import json
+from time import perf_counter
+
+import numpy as np
+import vtk
+
+from vtkat.poly_data import LinesData
+
+
+def make_synthetic_chains(
+    number_of_chains: int = 1000, segments_per_chain: int = 1000, seed: int = 0
+) -> np.ndarray:
+    """
+    Returns a (n, 6) array of random walks, like trajectories or
+    beams, where every segment starts at the end of the previous one.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 1, (number_of_chains, segments_per_chain + 1, 3))
+    steps[:, 0] = rng.uniform(-500, 500, (number_of_chains, 3))
+    points = np.cumsum(steps, axis=1, dtype=np.float32)
+
+    lines = np.concatenate([points[:, :-1], points[:, 1:]], axis=2)
+    return lines.reshape(-1, 6)
+
+
+def measure_lines_data(
+    lines: np.ndarray,
+    consolidate: bool,
+    size=(800, 600),
+    renders: int = 10,
+    ids_64_bits: bool = False,
+) -> dict:
+    start = perf_counter()
+    data = LinesData(lines, keep_source=False, consolidate=consolidate)
+    if ids_64_bits:
+        _use_64_bit_ids(data)
+    build_time = perf_counter() - start
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(data)
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+
+    renderer = vtk.vtkRenderer()
+    renderer.AddActor(actor)
+    render_window = vtk.vtkRenderWindow()
+    render_window.SetOffScreenRendering(True)
+    render_window.SetSize(*size)
+    render_window.AddRenderer(renderer)
+    renderer.ResetCamera()
+
+    # the first render uploads the buffers to the gpu
+    start = perf_counter()
+    render_window.Render()
+    first_render_time = perf_counter() - start
+
+    camera = renderer.GetActiveCamera()
+    render_times = []
+    for _ in range(renders):
+        camera.Azimuth(360 / renders)
+        start = perf_counter()
+        render_window.Render()
+        render_times.append(perf_counter() - start)
+
+    lines_array = data.GetLines()
+    result = dict(
+        consolidate=consolidate,
+        cells=data.GetNumberOfCells(),
+        points=data.GetNumberOfPoints(),
+        segments=data.get_number_of_segments(),
+        cell_storage_bits=64 if lines_array.IsStorage64Bit() else 32,
+        memory=1024 * data.GetActualMemorySize(),
+        build_time=build_time,
+        first_render_time=first_render_time,
+        render_time=float(np.median(render_times)),
+    )
+
+    render_window.Finalize()
+    return result
+
+
+def _use_64_bit_ids(data: LinesData):
+    # what _ensure_ids_fit does once the ids no longer fit in 32 bits
+    data._connectivity = data._connectivity.astype(np.int64)
+    data._offsets = data._offsets.astype(np.int64)
+    data._update_arrays()
+
+
+def _get_name(result: dict) -> str:
+    name = "consolidated" if result["consolidate"] else "segments"
+    return f"{name} {result['cell_storage_bits']} bits"
+
+
+def summary(results: list[dict]) -> str:
+    keys = (
+        "cells",
+        "points",
+        "cell_storage_bits",
+        "memory",
+        "build_time",
+        "first_render_time",
+        "render_time",
+    )
+    lines = [f"{'':>24}" + "".join(f"{key:>18}" for key in keys)]
+    for result in results:
+        row = "".join(_format_value(result[key]) for key in keys)
+        lines.append(f"{_get_name(result):>24}{row}")
+
+    # every result compared to the one before it
+    lines.append(f"{'ratio to the row above':>24}")
+    for previous, result in zip(results, results[1:]):
+        ratios = "".join(
+            _format_value(result[key] / previous[key]) if previous[key] else ""
+            for key in keys
+        )
+        lines.append(f"{_get_name(result):>24}{ratios}")
+    return "\n".join(lines)
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        return f"{value:>18.4f}"
+    return f"{value:>18}"
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Compares the memory and render time of segment "
+        "chains stored as separate lines and as polylines, with 32 "
+        "and 64 bit cell ids."
+    )
+    parser.add_argument("--chains", type=int, default=1000)
+    parser.add_argument("--segments", type=int, default=1000, help="per chain")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--renders", type=int, default=10)
+    parser.add_argument("--json", help="also save the results to this file")
+    args = parser.parse_args(args)
+
+    lines = make_synthetic_chains(args.chains, args.segments)
+    size = (args.width, args.height)
+    results = [
+        measure_lines_data(lines, consolidate, size, args.renders, ids_64_bits)
+        for consolidate, ids_64_bits in ((False, False), (True, False), (True, True))
+    ]
+    print(summary(results))
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
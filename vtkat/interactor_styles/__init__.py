@@ -1,2 +1,3 @@
 from .arcball_camera_style import ArcballCameraInteractorStyle
 from .box_selection_style import BoxSelectionInteractorStyle
+from .lasso_selection_style import LassoSelectionInteractorStyle
@@ -1,3 +1,5 @@
+from time import perf_counter
+
 import numpy as np
 import vtk
 
@@ -22,6 +24,17 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         # cor = center of rotation
         self.cor_actor = self._make_default_cor_actor()
+        self.overlay_layer = None
+        self.scene_bounds = None
+        self.adaptive_quality = None
+
+        self.hover_picker = None
+        self.hover_callback = None
+        self.hover_rate = 30
+        self._hovered = (None, -1)
+        self._last_hover_time = 0
+        self._hover_timer = None
+
         self._create_observers()
 
     def set_default_center_of_rotation(self, center):
@@ -30,6 +43,59 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
     def set_cor_actor(self, actor):
         self.cor_actor = actor
 
+    def set_overlay_layer(self, overlay_layer):
+        """
+        If an overlay layer is given, the center of rotation marker (and
+        the shapes of the selection styles) are drawn there, so showing or
+        hiding them does not render the scene.
+        """
+        self.overlay_layer = overlay_layer
+
+    def set_scene_bounds_tracker(self, scene_bounds):
+        """
+        If a SceneBoundsTracker is given, the clipping range is computed
+        from its cached bounds, instead of querying every prop.
+        """
+        self.scene_bounds = scene_bounds
+
+    def set_adaptive_quality(self, adaptive_quality):
+        """
+        Lowers the render quality while rotating, panning or zooming,
+        see `vtkat.render_widgets.AdaptiveQuality`.
+        """
+        self.adaptive_quality = adaptive_quality
+
+    def _start_interaction(self):
+        if self.adaptive_quality is not None:
+            self.adaptive_quality.start_interaction()
+
+    def _end_interaction(self):
+        if self.adaptive_quality is not None:
+            self.adaptive_quality.end_interaction()
+
+    def set_hover_picking(self, hover_picker, callback, rate: float = 30):
+        """
+        Picks the cell under the cursor on mouse moves, at most `rate`
+        times per second and never while rotating or panning. The callback
+        receives the prop and the cell id, only when they change.
+        If the picker is None, hover picking is disabled.
+        """
+        self.hover_picker = hover_picker
+        self.hover_callback = callback
+        self.hover_rate = rate
+        self._hovered = (None, -1)
+
+    def _get_visible_prop_bounds(self, renderer):
+        if self.scene_bounds is not None and self.scene_bounds.renderer is renderer:
+            return self.scene_bounds.get_bounds()
+        return renderer.ComputeVisiblePropBounds()
+
+    def _reset_clipping_range(self, renderer):
+        if self.scene_bounds is not None:
+            self.scene_bounds.reset_clipping_range(renderer)
+        else:
+            renderer.ResetCameraClippingRange()
+
     def _create_observers(self):
         self.AddObserver("LeftButtonPressEvent", self._left_button_press_event)
         self.AddObserver("LeftButtonReleaseEvent", self._left_button_release_event)
@@ -42,6 +108,7 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
         self.AddObserver(
             "MiddleButtonReleaseEvent", self._click_mid_button_release_event
         )
+        self.AddObserver("TimerEvent", self._timer_event)
 
     def _left_button_press_event(self, obj, event):
         # Implemented to stop the superclass movement
@@ -54,6 +121,7 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
     def _right_button_press_event(self, obj, event):
         self.is_right_clicked = True
         self.is_rotating = True
+        self._start_interaction()
 
         cursor = self.GetInteractor().GetEventPosition()
         self.FindPokedRenderer(cursor[0], cursor[1])
@@ -75,7 +143,7 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
             self.center_of_rotation = self.default_center_of_rotation
 
         else:
-            x0, x1, y0, y1, z0, z1 = renderer.ComputeVisiblePropBounds()
+            x0, x1, y0, y1, z0, z1 = self._get_visible_prop_bounds(renderer)
             self.center_of_rotation = [(x0 + x1) / 2, (y0 + y1) / 2, (z0 + z1) / 2]
 
         dx, dy, dz = np.array(camera.GetPosition()) - np.array(camera.GetFocalPoint())
@@ -85,25 +153,38 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
         self.cor_actor.SetScale(
             (distance_factor / 3.5, distance_factor / 3.5, distance_factor / 3.5)
         )
-        renderer.AddActor(self.cor_actor)
+
+        if self.overlay_layer is not None:
+            self.overlay_layer.add_actor(self.cor_actor)
+            self.overlay_layer.render()
+        else:
+            renderer.AddActor(self.cor_actor)
 
     def _right_button_release_event(self, obj, event):
         self.is_right_clicked = False
         self.is_rotating = False
-        renderer = self.GetDefaultRenderer() or self.GetCurrentRenderer()
-        renderer.RemoveActor(self.cor_actor)
-        self.GetInteractor().Render()
+        self._end_interaction()
+
+        if self.overlay_layer is not None:
+            self.overlay_layer.remove_actor(self.cor_actor)
+            self.overlay_layer.render()
+        else:
+            renderer = self.GetDefaultRenderer() or self.GetCurrentRenderer()
+            renderer.RemoveActor(self.cor_actor)
+            self.GetInteractor().Render()
         self.EndDolly()
 
     def _click_mid_button_press_event(self, obj, event):
         self.is_mid_clicked = True
         self.is_panning = True
+        self._start_interaction()
         int_pos = self.GetInteractor().GetEventPosition()
         self.FindPokedRenderer(int_pos[0], int_pos[1])
 
     def _click_mid_button_release_event(self, obj, event):
         self.is_mid_clicked = False
         self.is_panning = False
+        self._end_interaction()
 
     def _mouse_move_event(self, obj, event):
         if self.is_rotating:
@@ -113,6 +194,46 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
             self.Pan()
 
         self.OnMouseMove()
+        self._hover()
+
+    def _timer_event(self, obj, event):
+        interactor = self.GetInteractor()
+        if (self._hover_timer is None) or (
+            interactor.GetTimerEventId() != self._hover_timer
+        ):
+            self.OnTimer()
+            return
+
+        self._hover_timer = None
+        self._hover()
+
+    def _hover(self):
+        if self.hover_picker is None:
+            return
+
+        if self.is_rotating or self.is_panning or self.is_left_clicked:
+            return
+
+        # the last position is picked later, when the rate allows it
+        interval = 1 / self.hover_rate
+        elapsed = perf_counter() - self._last_hover_time
+        if elapsed < interval:
+            if self._hover_timer is None:
+                delay = max(int(1000 * (interval - elapsed)), 1)
+                timer = self.GetInteractor().CreateOneShotTimer(delay)
+                # zero means that the interactor can not create timers
+                self._hover_timer = timer or None
+            return
+
+        self._last_hover_time = perf_counter()
+        x, y = self.GetInteractor().GetEventPosition()
+        hovered = self.hover_picker.pick(x, y)
+        if hovered == self._hovered:
+            return
+
+        self._hovered = hovered
+        if self.hover_callback is not None:
+            self.hover_callback(*hovered)
 
     def _mouse_wheel_forward_event(self, obj, event):
         int_pos = self.GetInteractor().GetEventPosition()
@@ -127,7 +248,9 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         factor = motion_factor * 0.2 * mouse_motion_factor
 
+        self._start_interaction()
         self.dolly(1.1**factor)
+        self._end_interaction()
 
         self.ReleaseFocus()
 
@@ -144,7 +267,9 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         factor = motion_factor * -0.2 * mouse_motion_factor
 
+        self._start_interaction()
         self.dolly(1.1**factor)
+        self._end_interaction()
 
         self.ReleaseFocus()
 
@@ -168,7 +293,7 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         camera.OrthogonalizeViewUp()
 
-        renderer.ResetCameraClippingRange()
+        self._reset_clipping_range(renderer)
 
         if rwi.GetLightFollowCamera():
             renderer.UpdateLightsGeometryToFollowCamera()
@@ -241,7 +366,7 @@ class ArcballCameraInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
         else:
             camera.Dolly(factor)
             if self.GetAutoAdjustCameraClippingRange():
-                renderer.ResetCameraClippingRange()
+                self._reset_clipping_range(renderer)
 
         if self.GetInteractor().GetLightFollowCamera():
             renderer.UpdateLightsGeometryToFollowCamera()
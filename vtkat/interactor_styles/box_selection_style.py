@@ -1,6 +1,8 @@
 import numpy as np
 import vtk
 
+from vtkat.actors import SelectionShapeActor
+
 from .arcball_camera_style import ArcballCameraInteractorStyle
 
 
@@ -13,6 +15,7 @@ class BoxSelectionInteractorStyle(ArcballCameraInteractorStyle):
         self._mouse_position = (0, 0)
         self._saved_pixels = vtk.vtkUnsignedCharArray()
         self.selection_color = (255, 0, 0, 255)
+        self._box_actor = None
 
     def _left_button_press_event(self, obj, event):
         super()._left_button_press_event(obj, event)
@@ -31,6 +34,12 @@ class BoxSelectionInteractorStyle(ArcballCameraInteractorStyle):
     def start_selection(self):
         self.is_selecting = True
 
+        # the box is drawn in the overlay, over the last scene image
+        if self.overlay_layer is not None:
+            self._box_actor = SelectionShapeActor(self.selection_color, 0.25)
+            self.overlay_layer.add_actor(self._box_actor)
+            return
+
         size = self.GetInteractor().GetSize()
         render_window = self.GetInteractor().GetRenderWindow()
         render_window.Render()
@@ -49,6 +58,13 @@ class BoxSelectionInteractorStyle(ArcballCameraInteractorStyle):
         min_x, max_x = np.clip([min_x, max_x], 0, size[0])
         min_y, max_y = np.clip([min_y, max_y], 0, size[1])
 
+        if self._box_actor is not None:
+            self._box_actor.set_polygon(
+                [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+            )
+            self.overlay_layer.render()
+            return
+
         # Copy the saved screen state and draw over it
         selected_pixels = vtk.vtkUnsignedCharArray()
         selected_pixels.DeepCopy(self._saved_pixels)
@@ -66,5 +82,12 @@ class BoxSelectionInteractorStyle(ArcballCameraInteractorStyle):
 
     def stop_selection(self):
         self.is_selecting = False
+
+        if self._box_actor is not None:
+            self.overlay_layer.remove_actor(self._box_actor)
+            self._box_actor = None
+            self.overlay_layer.render()
+            return
+
         render_window = self.GetInteractor().GetRenderWindow()
         render_window.Render()
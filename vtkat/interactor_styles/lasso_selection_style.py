@@ -0,0 +1,116 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from vtkat.actors import SelectionShapeActor
+
+from .arcball_camera_style import ArcballCameraInteractorStyle
+
+
+class LassoSelectionInteractorStyle(ArcballCameraInteractorStyle):
+    """
+    Interactor style that draws a free form polygon while the left button
+    is pressed. The polygon can be given to the `polygon_pick` method of
+    the pickers once the button is released.
+    """
+
+    def __init__(self) -> None:
+        ArcballCameraInteractorStyle.__init__(self)
+
+        self.is_selecting = False
+        self.selection_polygon = []
+        self.selection_color = (255, 0, 0, 255)
+
+        # points closer than this (in pixels) to the
+        # last one are not added to the polygon
+        self.min_point_distance = 3
+        self._saved_pixels = None
+        self._lasso_actor = None
+
+    def _left_button_press_event(self, obj, event):
+        super()._left_button_press_event(obj, event)
+        self.start_selection()
+
+    def _left_button_release_event(self, obj, event):
+        super()._left_button_release_event(obj, event)
+        self.stop_selection()
+
+    def _mouse_move_event(self, obj, event):
+        super()._mouse_move_event(obj, event)
+        self.update_selection()
+
+    def get_selection_polygon(self) -> np.ndarray:
+        return np.array(self.selection_polygon, dtype=float).reshape(-1, 2)
+
+    def start_selection(self):
+        self.is_selecting = True
+        self.selection_polygon = [self.GetInteractor().GetEventPosition()]
+
+        # the lasso is drawn in the overlay, over the last scene image
+        if self.overlay_layer is not None:
+            self._lasso_actor = SelectionShapeActor(self.selection_color)
+            self.overlay_layer.add_actor(self._lasso_actor)
+            return
+
+        width, height = self.GetInteractor().GetSize()
+        render_window = self.GetInteractor().GetRenderWindow()
+        render_window.Render()
+        # Save the current screen state
+        pixels = vtk.vtkUnsignedCharArray()
+        render_window.GetRGBACharPixelData(0, 0, width - 1, height - 1, 0, pixels)
+        self._saved_pixels = vtk_to_numpy(pixels).reshape(height, width, 4).copy()
+
+    def update_selection(self):
+        if not self.is_selecting:
+            return
+
+        position = self.GetInteractor().GetEventPosition()
+        last_x, last_y = self.selection_polygon[-1]
+        distance = max(abs(position[0] - last_x), abs(position[1] - last_y))
+        if distance < self.min_point_distance:
+            return
+        self.selection_polygon.append(position)
+
+        if self._lasso_actor is not None:
+            self._lasso_actor.set_polygon(self.get_selection_polygon())
+            self.overlay_layer.render()
+            return
+
+        # Copy the saved screen state and draw over it
+        height, width, _ = self._saved_pixels.shape
+        pixels = self._saved_pixels.copy()
+        x, y = self._rasterize_outline(self.get_selection_polygon())
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        pixels[y[inside], x[inside]] = self.selection_color
+
+        render_window = self.GetInteractor().GetRenderWindow()
+        render_window.SetRGBACharPixelData(
+            0, 0, width - 1, height - 1, numpy_to_vtk(pixels.reshape(-1, 4)), 0
+        )
+        render_window.Frame()
+
+    def stop_selection(self):
+        self.is_selecting = False
+        self._saved_pixels = None
+
+        if self._lasso_actor is not None:
+            self.overlay_layer.remove_actor(self._lasso_actor)
+            self._lasso_actor = None
+            self.overlay_layer.render()
+            return
+
+        render_window = self.GetInteractor().GetRenderWindow()
+        render_window.Render()
+
+    def _rasterize_outline(self, polygon: np.ndarray):
+        start = polygon
+        end = np.roll(polygon, -1, axis=0)
+        lengths = np.maximum(np.abs(end - start).max(axis=1).astype(int), 1)
+
+        # samples every edge once per pixel
+        edge = np.repeat(np.arange(len(polygon)), lengths)
+        first_sample = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        t = (np.arange(len(edge)) - first_sample) / lengths[edge]
+        points = start[edge] + (end[edge] - start[edge]) * t[:, None]
+        points = np.round(points).astype(int)
+        return points[:, 0], points[:, 1]
@@ -1,2 +1,15 @@
 from .cell_area_picker import CellAreaPicker
 from .cell_property_area_picker import CellPropertyAreaPicker
+from .hover_picker import HoverPicker
+from .polygon_selection import points_in_polygon, project_to_display
+from .selection import (
+    as_selection,
+    combine_selections,
+    empty_selection,
+    mask_to_selection,
+    selection_difference,
+    selection_intersection,
+    selection_to_mask,
+    selection_toggle,
+    selection_union,
+)
@@ -1,21 +1,55 @@
+import numpy as np
 import vtk
 
+from vtkat.poly_data import LinesData
+from vtkat.utils import get_cells_bounds, get_cells_centers
+
+from .polygon_selection import points_in_polygon, project_to_display
+from .selection import as_selection, boxes_in_area_pick, mask_to_selection
+
 
 class CellAreaPicker(vtk.vtkPropPicker):
+    """
+    Picks the cells of every actor under the cursor, inside a
+    rectangular area or inside a polygon drawn on the screen.
+
+    The results are given by `get_picked` as a dict that maps every
+    picked actor to a sorted int64 array with the ids of its cells.
+
+    Actors of LinesData are picked by segment, so consolidated polylines
+    are not picked as a whole, and `get_picked_segments` gives the picked
+    segments of them (the cells are the ones that contain any of them).
+    """
+
     def __init__(self) -> None:
         super().__init__()
         self._picked_cells = []
         self._picked_actors = []
         self._picked = dict()
+        self._picked_segments = dict()
 
         self._area_picker = vtk.vtkAreaPicker()
         self._cell_picker = vtk.vtkCellPicker()
         self._cell_picker.SetTolerance(0.01)
 
+        # (data, modified time) -> (data, cells centers), only of the
+        # data seen in the last polygon pick, so removed data is released
+        self._centers_cache = dict()
+        # the same for the segments points of LinesData
+        self._segments_cache = dict()
+
     def pick(self, x: float, y: float, z: float, renderer: vtk.vtkRenderer):
-        self._picked.clear()
+        self._clear()
         self._cell_picker.Pick(x, y, z, renderer)
-        self._picked[self._cell_picker.GetActor()] = [self._cell_picker.GetCellId()]
+        actor = self._cell_picker.GetActor()
+        cell = self._cell_picker.GetCellId()
+        self._picked[actor] = as_selection([cell])
+
+        data = self._get_lines_data(actor)
+        if data is not None and cell >= 0:
+            # the sub id is the segment of the polyline that was hit
+            segment = data.get_segment(cell, self._cell_picker.GetSubId())
+            self._picked_segments[actor] = as_selection([segment])
 
         # # select a small area around the mouse click
         # delta = 10
@@ -28,10 +62,9 @@ class CellAreaPicker(vtk.vtkPropPicker):
     def area_pick(
         self, x0: float, y0: float, x1: float, y1: float, renderer: vtk.vtkRenderer
     ):
-        self._picked.clear()
+        self._clear()
+        last_segments, self._segments_cache = self._segments_cache, dict()
         self._area_picker.AreaPick(x0, y0, x1, y1, renderer)
-        extractor = vtk.vtkExtractSelectedFrustum()
-        extractor.SetFrustum(self._area_picker.GetFrustum())
 
         for actor in self._area_picker.GetProp3Ds():
             if not isinstance(actor, vtk.vtkActor):
@@ -41,13 +74,89 @@ class CellAreaPicker(vtk.vtkPropPicker):
             if data is None:
                 continue
 
-            cells = []
-            for i in range(data.GetNumberOfCells()):
-                bounds = [0, 0, 0, 0, 0, 0]
-                data.GetCellBounds(i, bounds)
-                if extractor.OverallBoundsTest(bounds):
-                    cells.append(i)
-            self._picked[actor] = cells
+            if isinstance(data, LinesData):
+                points = self._get_segments_points(data, last_segments)
+                bounds = np.column_stack([points.min(axis=1), points.max(axis=1)])[
+                    :, [0, 3, 1, 4, 2, 5]
+                ]
+                inside = boxes_in_area_pick(bounds, self._area_picker)
+                self._set_picked_segments(actor, data, mask_to_selection(inside))
+                continue
+
+            bounds = get_cells_bounds(data)
+            inside = boxes_in_area_pick(bounds, self._area_picker)
+            self._picked[actor] = mask_to_selection(inside)
+
+    def polygon_pick(self, polygon, renderer: vtk.vtkRenderer):
+        """
+        Picks the cells of the visible actors whose centers
+        are inside the polygon, given in display coordinates.
+        """
+        self._clear()
+        last_centers, self._centers_cache = self._centers_cache, dict()
+        last_segments, self._segments_cache = self._segments_cache, dict()
 
-    def get_picked(self):
+        for actor in renderer.GetActors():
+            if not (actor.GetVisibility() and actor.GetPickable()):
+                continue
+
+            data: vtk.vtkPolyData = actor.GetMapper().GetInput()
+            if data is None:
+                continue
+
+            if isinstance(data, LinesData):
+                centers = self._get_segments_points(data, last_segments).mean(axis=1)
+            else:
+                centers = self._get_cells_centers(data, last_centers)
+
+            display, visible = project_to_display(centers, renderer, actor.GetMatrix())
+            inside = visible & points_in_polygon(display, polygon)
+            if not inside.any():
+                continue
+
+            if isinstance(data, LinesData):
+                self._set_picked_segments(actor, data, mask_to_selection(inside))
+            else:
+                self._picked[actor] = mask_to_selection(inside)
+
+    def _clear(self):
+        self._picked.clear()
+        self._picked_segments.clear()
+
+    def _set_picked_segments(self, actor, data: LinesData, segments: np.ndarray):
+        cells, _ = data.get_segments_cells(segments)
+        self._picked[actor] = as_selection(cells)
+        self._picked_segments[actor] = segments
+
+    def _get_lines_data(self, actor) -> LinesData | None:
+        if actor is None:
+            return None
+        data = actor.GetMapper().GetInput()
+        return data if isinstance(data, LinesData) else None
+
+    def _get_segments_points(self, data: LinesData, last_segments) -> np.ndarray:
+        key = (data.__this__, data.GetMTime())
+        cached = self._segments_cache.get(key, last_segments.get(key))
+        if cached is None:
+            cached = (data, data.get_segments_points())
+        self._segments_cache[key] = cached
+        return cached[1]
+
+    def _get_cells_centers(self, data: vtk.vtkDataSet, last_centers) -> np.ndarray:
+        # the python wrappers of vtk data are not hashable
+        key = (data.__this__, data.GetMTime())
+        cached = self._centers_cache.get(key, last_centers.get(key))
+        if cached is None:
+            cached = (data, get_cells_centers(data))
+        self._centers_cache[key] = cached
+        return cached[1]
+
+    def get_picked(self) -> dict[vtk.vtkActor, np.ndarray]:
         return dict(self._picked)
+
+    def get_picked_segments(self) -> dict[vtk.vtkActor, np.ndarray]:
+        """
+        Maps every picked actor of LinesData to a sorted int64
+        array with the indices of its picked segments.
+        """
+        return dict(self._picked_segments)
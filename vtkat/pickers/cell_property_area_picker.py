@@ -1,22 +1,40 @@
+import numpy as np
 import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from vtkat.utils import get_cells_bounds, get_cells_centers
+
+from .polygon_selection import points_in_polygon, project_to_display
+from .selection import as_selection, boxes_in_area_pick, empty_selection
 
 
 class CellPropertyAreaPicker(vtk.vtkPropPicker):
+    """
+    Picks the values of a cell property of a single actor.
+
+    The results are given by `get_picked` as a sorted int64 array
+    with the property values of the picked cells.
+    """
+
     def __init__(self, property_name: str, desired_actor: vtk.vtkActor) -> None:
         super().__init__()
 
         self.property_name = property_name
         self.desired_actor = desired_actor
-        self._picked = set()
+        self._picked = empty_selection()
 
         self._cell_picker = vtk.vtkCellPicker()
         self._area_picker = vtk.vtkAreaPicker()
         self._cell_picker.SetTolerance(0.005)
 
+        # (data, modified time) of the cached cells centers
+        self._centers_key = None
+        self._centers = None
+
     def pick(self, x: float, y: float, z: float, renderer: vtk.vtkRenderer):
         # maybe a behaviour like the one implemented in CellAreaPicker
         # would fit nicely here
-        self._picked.clear()
+        self._picked = empty_selection()
         self._cell_picker.Pick(x, y, z, renderer)
 
         if self.desired_actor != self._cell_picker.GetActor():
@@ -32,16 +50,14 @@ class CellPropertyAreaPicker(vtk.vtkPropPicker):
 
         cell = self._cell_picker.GetCellId()
         property_val = property_array.GetValue(cell)
-        self._picked.add(property_val)
+        self._picked = as_selection([property_val])
         return self.get_picked()
 
     def area_pick(
         self, x0: float, y0: float, x1: float, y1: float, renderer: vtk.vtkRenderer
     ):
-        self._picked.clear()
+        self._picked = empty_selection()
         self._area_picker.AreaPick(x0, y0, x1, y1, renderer)
-        extractor = vtk.vtkExtractSelectedFrustum()
-        extractor.SetFrustum(self._area_picker.GetFrustum())
 
         if self.desired_actor not in self._area_picker.GetProp3Ds():
             return self.get_picked()
@@ -53,24 +69,47 @@ class CellPropertyAreaPicker(vtk.vtkPropPicker):
         property_array = data.GetCellData().GetArray(self.property_name)
         if property_array is None:
             return self.get_picked()
-    
-        if property_array.GetNumberOfValues() < data.GetNumberOfCells():
+
+        n_cells = data.GetNumberOfCells()
+        if property_array.GetNumberOfValues() < n_cells:
+            return self.get_picked()
+
+        property_values = vtk_to_numpy(property_array)[:n_cells]
+        inside = boxes_in_area_pick(get_cells_bounds(data), self._area_picker)
+        self._picked = as_selection(property_values[inside])
+        return self.get_picked()
+
+    def polygon_pick(self, polygon, renderer: vtk.vtkRenderer):
+        """
+        Picks the property values of the cells whose centers are
+        inside the polygon, given in display coordinates.
+        """
+        self._picked = empty_selection()
+
+        data: vtk.vtkPolyData = self.desired_actor.GetMapper().GetInput()
+        if data is None:
+            return self.get_picked()
+
+        property_array = data.GetCellData().GetArray(self.property_name)
+        if property_array is None:
             return self.get_picked()
 
-        for cell in range(data.GetNumberOfCells()):
-            property_val = property_array.GetValue(cell)
+        n_cells = data.GetNumberOfCells()
+        if property_array.GetNumberOfValues() < n_cells:
+            return self.get_picked()
 
-            # if the property was already picked
-            # we don't even need to check if the cell
-            # is inside the selection box
-            if property_val in self._picked:
-                continue
+        if self._centers_key != (data, data.GetMTime()):
+            self._centers = get_cells_centers(data)
+            self._centers_key = (data, data.GetMTime())
 
-            bounds = [0, 0, 0, 0, 0, 0]
-            data.GetCellBounds(cell, bounds)
-            if extractor.OverallBoundsTest(bounds):
-                self._picked.add(property_val)
+        display, visible = project_to_display(
+            self._centers, renderer, self.desired_actor.GetMatrix()
+        )
+        inside = visible & points_in_polygon(display, polygon)
+        property_values = vtk_to_numpy(property_array)[:n_cells]
+        self._picked = as_selection(property_values[inside])
         return self.get_picked()
 
-    def get_picked(self):
-        return set(self._picked)
+    def get_picked(self) -> np.ndarray:
+        # the selection is read-only, so it can be shared without copies
+        return self._picked
@@ -0,0 +1,116 @@
+import vtk
+
+
+class HoverPicker:
+    """
+    Picks the cell under the cursor fast enough to be called on mouse
+    moves, to highlight cells or show tooltips.
+
+    The scene is rendered once with the cell ids as colors (by a hardware
+    selector) and the id buffers are kept. Every pick just reads them,
+    until the scene is rendered again, the camera moves, props are added
+    or removed, or the window is resized. Renders of an overlay layer only
+    do not render the scene, so they keep the buffers.
+    """
+
+    def __init__(self, renderer: vtk.vtkRenderer) -> None:
+        self.renderer = renderer
+
+        self._selector = vtk.vtkHardwareSelector()
+        self._selector.SetRenderer(renderer)
+        self._selector.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS)
+
+        self._buffers_key = None
+        self._last_position = None
+        self._last_result = (None, -1)
+
+        renderer.AddObserver("StartEvent", self._scene_render_started)
+        renderer.GetViewProps().AddObserver("ModifiedEvent", self._view_props_modified)
+
+    def pick(self, x: int, y: int) -> tuple[vtk.vtkProp | None, int]:
+        """
+        Returns the prop and the id of the cell under the
+        display position, or (None, -1) if there is nothing.
+        """
+        if not self._is_cache_valid():
+            self._capture_buffers()
+
+        if (x, y) == self._last_position:
+            return self._last_result
+
+        width, height = self.renderer.GetRenderWindow().GetSize()
+        if not (0 <= x < width and 0 <= y < height):
+            result = (None, -1)
+        else:
+            result = self._read_buffers(x, y)
+
+        self._last_position = (x, y)
+        self._last_result = result
+        return result
+
+    def pick_property(self, x: int, y: int, property_name: str):
+        """
+        Returns the prop and the value of a cell data array for the
+        cell under the display position, or (None, None).
+        """
+        prop, cell = self.pick(x, y)
+        return prop, self.get_property(prop, cell, property_name)
+
+    def get_property(self, prop: vtk.vtkProp | None, cell: int, property_name: str):
+        if prop is None or cell < 0:
+            return None
+
+        data = prop.GetMapper().GetInput()
+        array = data.GetCellData().GetArray(property_name)
+        if array is None or cell >= array.GetNumberOfTuples():
+            return None
+        return array.GetValue(cell)
+
+    def invalidate(self):
+        self._buffers_key = None
+        self._last_position = None
+        self._last_result = (None, -1)
+
+    def _capture_buffers(self):
+        width, height = self.renderer.GetRenderWindow().GetSize()
+        self._selector.SetArea(0, 0, width - 1, height - 1)
+        if not self._selector.CaptureBuffers():
+            self.invalidate()
+            return
+
+        self._last_position = None
+        self._buffers_key = self._get_cache_key()
+
+    def _read_buffers(self, x, y):
+        selection = self._selector.GenerateSelection(x, y, x, y)
+        if selection is None or selection.GetNumberOfNodes() == 0:
+            return (None, -1)
+
+        node = selection.GetNode(0)
+        prop = node.GetProperties().Get(vtk.vtkSelectionNode.PROP())
+        cells = node.GetSelectionList()
+        if prop is None or cells is None or cells.GetNumberOfTuples() == 0:
+            return (None, -1)
+        return (prop, int(cells.GetValue(0)))
+
+    def _scene_render_started(self, obj, event):
+        # renders of the selector itself
+        if self.renderer.GetSelector() is not None:
+            return
+
+        self.invalidate()
+
+    def _view_props_modified(self, obj, event):
+        self.invalidate()
+
+    def _is_cache_valid(self):
+        if self._buffers_key is None:
+            return False
+        return self._buffers_key == self._get_cache_key()
+
+    def _get_cache_key(self):
+        render_window = self.renderer.GetRenderWindow()
+        return (
+            tuple(render_window.GetSize()),
+            self.renderer.GetActiveCamera().GetMTime(),
+        )
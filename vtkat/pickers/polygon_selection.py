@@ -0,0 +1,106 @@
+"""
+Screen space helpers used by the lasso (polygon) selection.
+"""
+
+import numpy as np
+import vtk
+
+from vtkat.utils import matrix_to_numpy
+
+
+def project_to_display(
+    coords: np.ndarray,
+    renderer: vtk.vtkRenderer,
+    matrix: vtk.vtkMatrix4x4 | None = None,
+):
+    """
+    Projects (n, 3) world coordinates to display coordinates with a single
+    matrix multiplication. The matrix of an actor may be given to project
+    its local coordinates.
+
+    Returns the (n, 2) display positions and a mask of the points between
+    the near and far clipping planes.
+    """
+    camera = renderer.GetActiveCamera()
+    aspect = renderer.GetTiledAspectRatio()
+    transform = camera.GetCompositeProjectionTransformMatrix(aspect, -1, 1)
+    transform = matrix_to_numpy(transform)
+    if matrix is not None:
+        transform = transform @ matrix_to_numpy(matrix)
+
+    view = coords @ transform[:, :3].T + transform[:, 3]
+    w = view[:, 3]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = view[:, :3] / w[:, None]
+
+    visible = (w > 0) & (np.abs(normalized[:, 2]) <= 1)
+
+    width, height = renderer.GetSize()
+    origin_x, origin_y = renderer.GetOrigin()
+    display = np.empty((len(coords), 2))
+    display[:, 0] = (normalized[:, 0] + 1) * width / 2 + origin_x
+    display[:, 1] = (normalized[:, 1] + 1) * height / 2 + origin_y
+    return display, visible
+
+
+def points_in_polygon(points: np.ndarray, polygon) -> np.ndarray:
+    """
+    Returns a mask of the (n, 2) points inside the polygon, using the
+    even-odd rule. The polygon is rasterized in its bounding box with
+    pixel resolution, so testing each point costs a single lookup.
+    """
+    polygon = np.asarray(polygon, dtype=float).reshape(-1, 2)
+    inside = np.zeros(len(points), dtype=bool)
+    if len(polygon) < 3:
+        return inside
+
+    x0, y0 = np.floor(polygon.min(axis=0)).astype(int)
+    x1, y1 = np.ceil(polygon.max(axis=0)).astype(int)
+    raster = polygon_raster(polygon - (x0, y0), x1 - x0, y1 - y0)
+
+    with np.errstate(invalid="ignore"):
+        columns = np.floor(points[:, 0]) - x0
+        rows = np.floor(points[:, 1]) - y0
+        candidates = (columns >= 0) & (columns < x1 - x0)
+        candidates &= (rows >= 0) & (rows < y1 - y0)
+
+    indexes = np.flatnonzero(candidates)
+    rows = rows[indexes].astype(int)
+    columns = columns[indexes].astype(int)
+    inside[indexes] = raster[rows, columns]
+    return inside
+
+
+def polygon_raster(polygon: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Rasterizes the polygon in a (height, width) boolean image, where a
+    pixel is filled if its center is inside the polygon.
+    """
+    start = polygon
+    end = np.roll(polygon, -1, axis=0)
+
+    # x position where every edge crosses the center of every row
+    row_y = np.arange(height)[:, None] + 0.5
+    crosses = (start[:, 1] > row_y) != (end[:, 1] > row_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1])
+        crossing_x = start[:, 0] + (row_y - start[:, 1]) * slope
+    crossing_x = np.where(crosses, crossing_x, np.inf)
+    crossing_x.sort(axis=1)
+
+    # every row crosses the polygon an even number of times,
+    # and the filled spans are between consecutive crossings
+    if crossing_x.shape[1] % 2:
+        crossing_x = crossing_x[:, :-1]
+    span_start = crossing_x[:, 0::2]
+    span_end = crossing_x[:, 1::2]
+    valid = np.isfinite(span_end)
+
+    rows = np.broadcast_to(np.arange(height)[:, None], span_start.shape)[valid]
+    first = np.clip(np.ceil(span_start[valid] - 0.5), 0, width).astype(int)
+    last = np.clip(np.ceil(span_end[valid] - 0.5), 0, width).astype(int)
+
+    changes = np.zeros((height, width + 1), dtype=np.int32)
+    np.add.at(changes, (rows, first), 1)
+    np.add.at(changes, (rows, last), -1)
+    return np.cumsum(changes[:, :-1], axis=1) > 0
@@ -0,0 +1,123 @@
+"""
+Helpers to work with the selections returned by the pickers.
+
+A selection is a sorted array of unique int64 ids (cells or property
+values). Selections of many actors are stored in a dict, mapping every
+actor to its own selection.
+"""
+
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+
+def as_selection(values) -> np.ndarray:
+    """
+    Converts any sequence of ids to a sorted, unique and read-only int64 array.
+    """
+    selection = np.unique(np.asarray(values, dtype=np.int64))
+    selection.flags.writeable = False
+    return selection
+
+
+def empty_selection() -> np.ndarray:
+    return as_selection([])
+
+
+def selection_union(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _read_only(np.union1d(a, b))
+
+
+def selection_intersection(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _read_only(np.intersect1d(a, b, assume_unique=True))
+
+
+def selection_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _read_only(np.setdiff1d(a, b, assume_unique=True))
+
+
+def selection_toggle(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _read_only(np.setxor1d(a, b, assume_unique=True))
+
+
+def selection_to_mask(selection: np.ndarray, size: int) -> np.ndarray:
+    mask = np.zeros(size, dtype=bool)
+    mask[selection[selection < size]] = True
+    return mask
+
+
+def mask_to_selection(mask: np.ndarray) -> np.ndarray:
+    return _read_only(np.flatnonzero(mask).astype(np.int64))
+
+
+_OPERATIONS = {
+    "replace": lambda a, b: b,
+    "union": selection_union,
+    "intersection": selection_intersection,
+    "difference": selection_difference,
+    "toggle": selection_toggle,
+}
+
+
+def combine_selections(current: dict, new: dict, operation: str = "union") -> dict:
+    """
+    Combines the selections of every actor, like the ones returned by
+    `CellAreaPicker.get_picked`. The operation may be "replace", "union",
+    "intersection", "difference" or "toggle". Actors that end up with
+    nothing selected are removed from the result.
+    """
+    if operation not in _OPERATIONS:
+        raise ValueError(f'Unknown selection operation "{operation}"')
+
+    function = _OPERATIONS[operation]
+    empty = empty_selection()
+    result = dict()
+    for actor in current.keys() | new.keys():
+        selection = function(current.get(actor, empty), new.get(actor, empty))
+        if len(selection):
+            result[actor] = selection
+    return result
+
+
+def boxes_in_area_pick(bounds: np.ndarray, area_picker: vtk.vtkAreaPicker):
+    """
+    Vectorized version of vtkExtractSelectedFrustum.OverallBoundsTest.
+    Returns a mask of the (n, 6) bounds that touch the frustum of the
+    last area pick.
+    """
+    frustum: vtk.vtkPlanes = area_picker.GetFrustum()
+    origins = vtk_to_numpy(frustum.GetPoints().GetData()).astype(np.float64)
+    normals = vtk_to_numpy(frustum.GetNormals()).astype(np.float64)
+
+    # make every normal point to the inside of the frustum
+    corners = vtk_to_numpy(area_picker.GetClipPoints().GetData())
+    inside_point = corners.mean(axis=0)
+    side = np.einsum("ij,ij->i", normals, inside_point - origins)
+    normals[side < 0] *= -1
+
+    mins = bounds[:, 0::2]
+    maxs = bounds[:, 1::2]
+
+    # A box is outside if its farthest corner along the normal of
+    # some plane is behind that plane, and it is entirely inside if
+    # its nearest corner is in front of every plane.
+    touching = np.ones(len(bounds), dtype=bool)
+    inside = np.ones(len(bounds), dtype=bool)
+    for origin, normal in zip(origins, normals):
+        farthest = np.where(normal > 0, maxs, mins)
+        nearest = np.where(normal > 0, mins, maxs)
+        touching &= (farthest - origin) @ normal >= 0
+        inside &= (nearest - origin) @ normal >= 0
+
+    # The few boxes crossing the frustum borders may still be outside
+    # of it, near its corners. Those are checked precisely by vtk.
+    extractor = vtk.vtkExtractSelectedFrustum()
+    extractor.SetFrustum(frustum)
+    for i in np.flatnonzero(touching & ~inside):
+        touching[i] = extractor.OverallBoundsTest(bounds[i].tolist())
+    return touching
+
+
+def _read_only(selection: np.ndarray) -> np.ndarray:
+    selection.flags.writeable = False
+    return selection
@@ -1,22 +1,237 @@
+from typing import Iterable
+
+import numpy as np
 import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from vtkat.utils import GrowingArray, make_cell_array, make_vtk_points
+
+# the cell arrays are stored in 32 bits while the ids fit
+_INT32_MAX = np.iinfo(np.int32).max
 
 
 class LinesData(vtk.vtkPolyData):
-    def __init__(self, lines_list) -> None:
+    """
+    This class describes a polydata composed by a set of line segments,
+    each one represented as (x0, y0, z0, x1, y1, z1).
+
+    Segments can also be appended in chunks with `append_chunk`, so big
+    models can be shown while they are still being loaded.
+
+    If `consolidate` is set, every segment that starts exactly where the
+    previous one ends (and has the same chain key, if `chain_keys` are
+    given) continues its cell as a polyline, so chains of segments (like
+    beams, pipes or trajectories) need a single cell and share their
+    points. The segments keep their order, so the segment i is the sub
+    cell `i - first_segment` of its polyline, see `get_segment`.
+    """
+
+    def __init__(
+        self,
+        lines_list: Iterable = (),
+        keep_source: bool = True,
+        consolidate: bool = False,
+        chain_keys: Iterable | None = None,
+    ) -> None:
         super().__init__()
 
         self.lines_list = lines_list
+        self.chain_keys = chain_keys
+        self.consolidate = consolidate
         self.build()
 
+        if not keep_source:
+            self.release_source()
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable, size_hint: int = 0, consolidate: bool = False
+    ) -> "LinesData":
+        """
+        Builds the data from an iterable of (n, 6) arrays without
+        ever holding the whole input in a python list.
+        """
+        data = cls(consolidate=consolidate)
+        data.reserve(size_hint)
+        for chunk in chunks:
+            data.append_chunk(chunk)
+        data.finish_chunks()
+        return data
+
     def build(self):
-        points = vtk.vtkPoints()
-        self.Allocate(len(self.lines_list))
+        if self.lines_list is None:
+            raise ValueError("The source lines of this data were released")
+
+        lines_list = self.lines_list
+        chain_keys = self.chain_keys
+        self.clear_chunks()
+        self.append_chunk(lines_list, chain_keys)
+        self.finish_chunks()
+        self.lines_list = lines_list
+        self.chain_keys = chain_keys
+
+    def release_source(self):
+        """
+        Drops the reference to the source lines, so they can be garbage
+        collected. The vtk arrays are kept, but `build` can not be
+        called anymore.
+        """
+        self.lines_list = None
+        self.chain_keys = None
+
+    def adopt(self, data: vtk.vtkPolyData):
+        """
+        Uses the points, lines and cell data of another poly data (like
+        one loaded from a cache) as the buffers of this one, without
+        copying them. Chunks can still be appended afterwards.
+        """
+        self.release_source()
+        lines = data.GetLines()
+        offsets = vtk_to_numpy(lines.GetOffsetsArray())
+        connectivity = vtk_to_numpy(lines.GetConnectivityArray())
+
+        self.clear_chunks()
+        if data.GetNumberOfPoints() > 0:
+            coords = vtk_to_numpy(data.GetPoints().GetData())
+            self._coords = GrowingArray.from_array(coords, 3, np.float32)
+        self._offsets = GrowingArray.from_array(offsets)
+        self._connectivity = GrowingArray.from_array(connectivity, dtype=offsets.dtype)
+        self._update_arrays()
+        self.GetCellData().ShallowCopy(data.GetCellData())
+
+    def get_number_of_segments(self) -> int:
+        # every cell has one point more than its segments
+        return len(self._connectivity) - (len(self._offsets) - 1)
+
+    def get_segment(self, cell: int, sub_id: int = 0) -> int:
+        """
+        Returns the index of the segment that is the sub cell
+        `sub_id` of the cell (like the sub id given by pickers).
+        """
+        return int(self._offsets.view[cell]) - cell + sub_id
+
+    def get_cells_segments(self, cells) -> np.ndarray:
+        """
+        Returns the indices of all segments of the given cells.
+        """
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1)
+        offsets = self._offsets.view
+        first = offsets[cells] - cells
+        counts = offsets[cells + 1] - offsets[cells] - 1
+
+        starts = np.repeat(first - np.cumsum(counts) + counts, counts)
+        return starts + np.arange(len(starts))
+
+    def get_segments_cells(self, segments) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the cell of every segment and its sub id in that cell.
+        """
+        segments = np.asarray(segments, dtype=np.int64).reshape(-1)
+        first = self._get_first_segments()
+        cells = np.searchsorted(first, segments, side="right") - 1
+        return cells, segments - first[cells]
+
+    def get_segments_points(self) -> np.ndarray:
+        """
+        Returns a (n_segments, 2, 3) array with the points of every segment.
+        """
+        cells, _ = self.get_segments_cells(np.arange(self.get_number_of_segments()))
+        starts = np.arange(len(cells)) + cells
+        connectivity = self._connectivity.view
+        points = self._coords.view
+        return np.stack(
+            [points[connectivity[starts]], points[connectivity[starts + 1]]], 1
+        )
+
+    def clear_chunks(self):
+        self._coords = GrowingArray(3, np.float32)
+        self._connectivity = GrowingArray(None, np.int32)
+        self._offsets = GrowingArray(None, np.int32)
+        self._offsets.extend([0])
+        self._last_key = None
+        self._update_arrays()
+
+    def reserve(self, number_of_lines: int):
+        self._coords.reserve(2 * number_of_lines)
+        self._connectivity.reserve(2 * number_of_lines)
+        self._offsets.reserve(number_of_lines + 1)
+
+    def append_chunk(self, lines, chain_keys=None):
+        """
+        Appends the segments. When consolidating, the first segments may
+        continue the last polyline of the previous chunks.
+        """
+        # the data is no longer described by the source lines only
+        self.lines_list = None
+        self.chain_keys = None
+
+        lines = np.asarray(lines, dtype=np.float32).reshape(-1, 6)
+        if len(lines) == 0:
+            return
+
+        if self.consolidate:
+            joined = self._find_joined_segments(lines, chain_keys)
+        else:
+            joined = np.zeros(len(lines), dtype=bool)
+
+        # joined segments only add their end point
+        points = lines.reshape(-1, 2, 3)[
+            np.column_stack([~joined, np.ones_like(joined)])
+        ]
+        first_point = len(self._coords)
+        last_point = first_point + len(points)
+        self._ensure_ids_fit(last_point)
+
+        # the last segment of every cell is followed by a new cell
+        ends = np.append(~joined[1:], True)
+        cell_ends = first_point + np.cumsum(1 + ~joined)[ends]
+        if joined[0]:
+            self._offsets.view[-1] = cell_ends[0]
+            cell_ends = cell_ends[1:]
+
+        self._coords.extend(points)
+        self._connectivity.extend(np.arange(first_point, last_point))
+        self._offsets.extend(cell_ends)
+        self._update_arrays()
+
+    def finish_chunks(self):
+        """
+        Releases the spare capacity left by the appended chunks.
+        """
+        self._coords.shrink_to_fit()
+        self._connectivity.shrink_to_fit()
+        self._offsets.shrink_to_fit()
+        self._update_arrays()
+
+    def _find_joined_segments(self, lines, chain_keys):
+        joined = np.empty(len(lines), dtype=bool)
+        joined[1:] = (lines[1:, :3] == lines[:-1, 3:]).all(axis=1)
+        # the last point is the end of the last polyline
+        joined[0] = (
+            len(self._coords) > 0 and (lines[0, :3] == self._coords.view[-1]).all()
+        )
+
+        if chain_keys is not None:
+            keys = np.asarray(chain_keys).reshape(-1)
+            joined[1:] &= keys[1:] == keys[:-1]
+            joined[0] &= self._last_key is not None and keys[0] == self._last_key
+            self._last_key = keys[-1]
+        else:
+            self._last_key = None
+
+        return joined
+
+    def _ensure_ids_fit(self, number_of_points: int):
+        if number_of_points <= _INT32_MAX or self._offsets.dtype == np.int64:
+            return
+        self._connectivity = self._connectivity.astype(np.int64)
+        self._offsets = self._offsets.astype(np.int64)
 
-        current_point = 0
-        for x0, y0, z0, x1, y1, z1 in self.lines_list:
-            points.InsertPoint(current_point, x0, y0, z0)
-            points.InsertPoint(current_point + 1, x1, y1, z1)
-            self.InsertNextCell(vtk.VTK_LINE, 2, [current_point, current_point + 1])
-            current_point += 2
+    def _get_first_segments(self) -> np.ndarray:
+        offsets = self._offsets.view[:-1]
+        return offsets - np.arange(len(offsets), dtype=offsets.dtype)
 
-        self.SetPoints(points)
+    def _update_arrays(self):
+        self.SetPoints(make_vtk_points(self._coords.view))
+        self.SetLines(make_cell_array(self._offsets.view, self._connectivity.view))
+        self.Modified()
@@ -1,23 +1,122 @@
+from typing import Iterable
+
+import numpy as np
 import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from vtkat.utils import GrowingArray, make_cell_array, make_vtk_points
 
 
 class VerticesData(vtk.vtkPolyData):
     """
     This class describes a polydata composed by a set of points.
+
+    Points can also be appended in chunks with `append_chunk`, so big
+    models can be shown while they are still being loaded.
     """
 
-    def __init__(self, points_list: list[tuple[int, int, int]]) -> None:
+    def __init__(
+        self,
+        points_list: Iterable[tuple[int, int, int]] = (),
+        keep_source: bool = True,
+    ) -> None:
         super().__init__()
 
         self.points_list = points_list
         self.build()
 
+        if not keep_source:
+            self.release_source()
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable, size_hint: int = 0) -> "VerticesData":
+        """
+        Builds the data from an iterable of (n, 3) arrays without
+        ever holding the whole input in a python list.
+        """
+        data = cls()
+        data.reserve(size_hint)
+        for chunk in chunks:
+            data.append_chunk(chunk)
+        data.finish_chunks()
+        return data
+
     def build(self):
-        points = vtk.vtkPoints()
-        self.Allocate(len(self.points_list))
+        if self.points_list is None:
+            raise ValueError("The source points of this data were released")
+
+        points_list = self.points_list
+        self.clear_chunks()
+        self.append_chunk(points_list)
+        self.finish_chunks()
+        self.points_list = points_list
+
+    def release_source(self):
+        """
+        Drops the reference to the source points, so they can be garbage
+        collected. The vtk arrays are kept, but `build` can not be
+        called anymore.
+        """
+        self.points_list = None
+
+    def adopt(self, data: vtk.vtkPolyData):
+        """
+        Uses the points, vertices and cell data of another poly data (like
+        one loaded from a cache) as the buffers of this one, without
+        copying them. Chunks can still be appended afterwards.
+        """
+        self.release_source()
+        verts = data.GetVerts()
+        offsets = vtk_to_numpy(verts.GetOffsetsArray())
+        connectivity = vtk_to_numpy(verts.GetConnectivityArray())
+
+        self.clear_chunks()
+        if data.GetNumberOfPoints() > 0:
+            coords = vtk_to_numpy(data.GetPoints().GetData())
+            self._coords = GrowingArray.from_array(coords, 3, np.float32)
+        self._offsets = GrowingArray.from_array(offsets, dtype=np.int64)
+        self._connectivity = GrowingArray.from_array(connectivity, dtype=np.int64)
+        self._update_arrays()
+        self.GetCellData().ShallowCopy(data.GetCellData())
+
+    def clear_chunks(self):
+        self._coords = GrowingArray(3, np.float32)
+        self._connectivity = GrowingArray(None, np.int64)
+        self._offsets = GrowingArray(None, np.int64)
+        self._offsets.extend([0])
+        self._update_arrays()
+
+    def reserve(self, number_of_points: int):
+        self._coords.reserve(number_of_points)
+        self._connectivity.reserve(number_of_points)
+        self._offsets.reserve(number_of_points + 1)
+
+    def append_chunk(self, points):
+        # the data is no longer described by the source points only
+        self.points_list = None
+
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        if len(points) == 0:
+            return
+
+        first_point = len(self._coords)
+        last_point = first_point + len(points)
+
+        self._coords.extend(points)
+        self._connectivity.extend(np.arange(first_point, last_point))
+        self._offsets.extend(np.arange(first_point + 1, last_point + 1))
+        self._update_arrays()
 
-        for i, (x, y, z) in enumerate(self.points_list):
-            points.InsertNextPoint(x, y, z)
-            self.InsertNextCell(vtk.VTK_VERTEX, 1, [i])
+    def finish_chunks(self):
+        """
+        Releases the spare capacity left by the appended chunks.
+        """
+        self._coords.shrink_to_fit()
+        self._connectivity.shrink_to_fit()
+        self._offsets.shrink_to_fit()
+        self._update_arrays()
 
-        self.SetPoints(points)
+    def _update_arrays(self):
+        self.SetPoints(make_vtk_points(self._coords.view))
+        self.SetVerts(make_cell_array(self._offsets.view, self._connectivity.view))
+        self.Modified()
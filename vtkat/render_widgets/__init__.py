@@ -1,2 +1,5 @@
+from .adaptive_quality import AdaptiveQuality
 from .animated_render_widget import AnimatedRenderWidget
+from .background_builder import BackgroundBuilder
 from .common_render_widget import CommonRenderWidget
+from .progressive_loader import ProgressiveLoader
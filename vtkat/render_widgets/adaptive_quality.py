@@ -0,0 +1,182 @@
+from collections import deque
+from time import perf_counter
+
+import vtk
+from PyQt5.QtCore import QObject, QTimer
+
+
+class AdaptiveQuality(QObject):
+    """
+    Lowers the render quality while the camera is moved, so big scenes
+    keep a target frame time, and renders again at full quality when
+    the interaction ends.
+
+    The time of every render of the window is measured. While interacting,
+    each frame slower than the target goes one step down the ladder below,
+    and a few frames much faster than it go one step back up:
+        1. no anti-aliasing (FXAA and multisampling);
+        2. points and lines drawn flat instead of as spheres and tubes;
+        3. no depth peeling, ambient occlusion or shadows.
+    """
+
+    MAX_LEVEL = 3
+
+    def __init__(
+        self,
+        render_window: vtk.vtkRenderWindow,
+        target_frame_time: float = 1 / 30,
+        settle_ms: int = 250,
+        history_size: int = 120,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+
+        self.render_window = render_window
+        self.target_frame_time = target_frame_time
+        self.level = 0
+        self.is_interacting = False
+
+        self._frame_times = deque(maxlen=history_size)
+        self._frames_at_level = 0
+        self._render_start = None
+        self._saved_window = None
+        self._saved_renderers = dict()
+        self._saved_properties = dict()
+
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(settle_ms)
+        self._restore_timer.timeout.connect(self.restore)
+
+        self._observers = [
+            render_window.AddObserver("StartEvent", self._render_started),
+            render_window.AddObserver("EndEvent", self._render_ended),
+        ]
+
+    def get_frame_times(self) -> list[float]:
+        """
+        Duration (in seconds) of the last renders, oldest first.
+        """
+        return list(self._frame_times)
+
+    def start_interaction(self):
+        self._restore_timer.stop()
+        self.is_interacting = True
+
+    def end_interaction(self):
+        """
+        Full quality is restored after a short time without interaction,
+        so the wheel (that has no release) does not render it every step.
+        """
+        self.is_interacting = False
+        self._restore_timer.start()
+
+    def restore(self):
+        self._restore_timer.stop()
+        if self.level == 0:
+            return
+
+        self._set_level(0)
+        self.render_window.Render()
+
+    def close(self):
+        self._restore_timer.stop()
+        self._set_level(0)
+        for observer in self._observers:
+            self.render_window.RemoveObserver(observer)
+        self._observers.clear()
+
+    def _render_started(self, obj, event):
+        self._render_start = perf_counter()
+
+    def _render_ended(self, obj, event):
+        if self._render_start is None:
+            return
+
+        frame_time = perf_counter() - self._render_start
+        self._render_start = None
+        self._frame_times.append(frame_time)
+
+        if self.is_interacting:
+            self._adapt(frame_time)
+
+    def _adapt(self, frame_time: float):
+        self._frames_at_level += 1
+
+        if frame_time > self.target_frame_time:
+            if self.level < self.MAX_LEVEL:
+                self._set_level(self.level + 1)
+            return
+
+        # a few fast frames are needed to go up,
+        # so the quality does not flicker between levels
+        last_frames = list(self._frame_times)[-3:]
+        if (
+            self.level > 0
+            and self._frames_at_level >= 3
+            and max(last_frames) < self.target_frame_time / 2
+        ):
+            self._set_level(self.level - 1)
+
+    def _set_level(self, level: int):
+        if level == self.level:
+            return
+
+        self._restore_settings()
+        self.level = level
+        self._frames_at_level = 0
+
+        if level >= 1:
+            self._disable_antialiasing()
+        if level >= 2:
+            self._disable_imposters()
+        if level >= 3:
+            self._disable_effects()
+
+    def _disable_antialiasing(self):
+        self._saved_window = self.render_window.GetMultiSamples()
+        self.render_window.SetMultiSamples(0)
+
+        for renderer in self.render_window.GetRenderers():
+            saved = self._saved_renderers.setdefault(renderer, dict())
+            saved["UseFXAA"] = renderer.GetUseFXAA()
+            renderer.UseFXAAOff()
+
+    def _disable_imposters(self):
+        for renderer in self.render_window.GetRenderers():
+            for actor in renderer.GetActors():
+                prop = actor.GetProperty()
+                if prop in self._saved_properties:
+                    continue
+
+                self._saved_properties[prop] = (
+                    prop.GetRenderPointsAsSpheres(),
+                    prop.GetRenderLinesAsTubes(),
+                )
+                prop.RenderPointsAsSpheresOff()
+                prop.RenderLinesAsTubesOff()
+
+    def _disable_effects(self):
+        for renderer in self.render_window.GetRenderers():
+            saved = self._saved_renderers.setdefault(renderer, dict())
+            saved["UseDepthPeeling"] = renderer.GetUseDepthPeeling()
+            saved["UseSSAO"] = renderer.GetUseSSAO()
+            saved["UseShadows"] = renderer.GetUseShadows()
+            renderer.UseDepthPeelingOff()
+            renderer.UseSSAOOff()
+            renderer.UseShadowsOff()
+
+    def _restore_settings(self):
+        if self._saved_window is not None:
+            self.render_window.SetMultiSamples(self._saved_window)
+            self._saved_window = None
+
+        for renderer, saved in self._saved_renderers.items():
+            for name, value in saved.items():
+                getattr(renderer, "Set" + name)(value)
+        self._saved_renderers.clear()
+
+        for prop, (spheres, tubes) in self._saved_properties.items():
+            prop.SetRenderPointsAsSpheres(spheres)
+            prop.SetRenderLinesAsTubes(tubes)
+        self._saved_properties.clear()
@@ -1,6 +1,8 @@
 from threading import Lock
 from time import time
 
+from vtkat.utils import HarmonicDeformation
+
 from .common_render_widget import CommonRenderWidget
 
 
@@ -14,6 +16,7 @@ class AnimatedRenderWidget(CommonRenderWidget):
         self._animation_last_time = 0
         self._animation_total_frames = 30
         self._animation_fps = 30
+        self.deformation = None
         self._animation_timer = self.render_interactor.CreateRepeatingTimer(500)
         self.render_interactor.AddObserver("TimerEvent", self._animation_callback)
 
@@ -24,6 +27,9 @@ class AnimatedRenderWidget(CommonRenderWidget):
         if isinstance(frames, int):
             self._animation_total_frames = frames
 
+        if self.deformation is not None:
+            self.deformation.set_number_of_frames(self._animation_total_frames)
+
         if self.playing_animation:
             return
 
@@ -37,6 +43,11 @@ class AnimatedRenderWidget(CommonRenderWidget):
             return
 
         self.playing_animation = False
+
+        if self.deformation is not None:
+            # the points and scalars go back to their original values
+            self.deformation.reset()
+            self.update()
     
     def toggle_animation(self):
         if self.playing_animation:
@@ -71,7 +82,28 @@ class AnimatedRenderWidget(CommonRenderWidget):
             self.update_animation(self._animation_frame)
             self._animation_last_time = time()
 
-    def update_animation(self, frame: int):
-        raise NotImplementedError(
-            'The function "update_animation" was not implemented!'
+    def set_deformation(self, target, displacement, scale=1.0) -> HarmonicDeformation:
+        """
+        Animates the displacement field over the target actor (or poly data)
+        without the need to implement "update_animation". The returned object
+        may also animate scalar arrays with "add_scalars".
+        """
+        self.deformation = HarmonicDeformation(
+            target, displacement, scale, self._animation_total_frames
         )
+        return self.deformation
+
+    def clear_deformation(self):
+        if self.deformation is None:
+            return
+        self.deformation.reset()
+        self.deformation = None
+
+    def update_animation(self, frame: int):
+        if self.deformation is None:
+            raise NotImplementedError(
+                'The function "update_animation" was not implemented!'
+            )
+
+        self.deformation.apply(frame)
+        self.update()
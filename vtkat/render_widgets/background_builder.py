@@ -0,0 +1,106 @@
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Hashable
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class BackgroundBuilder(QObject):
+    """
+    Builds geometry (LinesData, VerticesData, cell arrays...) in a pool of
+    worker threads, so the interface does not freeze while big results
+    are loaded.
+
+    The finished result is handed to the main thread through a Qt signal,
+    where the `on_ready` callback should only attach it to a mapper or
+    actor and render. The result must not be modified by the worker after
+    it is returned.
+
+    Every build has a key. Submitting a new build with the same key
+    supersedes the previous one: it is cancelled if it did not start
+    yet, otherwise its result is discarded when it finishes.
+    """
+
+    # emitted with the key and the exception of every failed build
+    build_failed = pyqtSignal(object, object)
+    _build_done = pyqtSignal(object, object, object, object)
+
+    def __init__(self, max_workers: int | None = None, parent=None) -> None:
+        super().__init__(parent)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="vtkat-builder"
+        )
+        self._current = dict()
+        self._lock = Lock()
+        self._build_done.connect(self._handle_build_done)
+
+    def submit(
+        self,
+        key: Hashable,
+        function: Callable,
+        *args,
+        on_ready: Callable | None = None,
+        on_error: Callable | None = None,
+        **kwargs,
+    ) -> Future:
+        with self._lock:
+            previous = self._current.get(key)
+            if previous is not None:
+                previous.cancel()
+
+            future = self._executor.submit(function, *args, **kwargs)
+            self._current[key] = future
+
+        # this callback runs in the worker thread, the
+        # signal delivers the result to the main thread
+        future.add_done_callback(
+            lambda future: self._emit_build_done(key, future, on_ready, on_error)
+        )
+        return future
+
+    def cancel(self, key: Hashable):
+        with self._lock:
+            future = self._current.pop(key, None)
+        if future is not None:
+            future.cancel()
+
+    def is_current(self, key: Hashable, future: Future) -> bool:
+        with self._lock:
+            return self._current.get(key) is future
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            for future in self._current.values():
+                future.cancel()
+            self._current.clear()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _emit_build_done(self, key, future: Future, on_ready, on_error):
+        if future.cancelled():
+            return
+        self._build_done.emit(key, future, on_ready, on_error)
+
+    def _handle_build_done(self, key, future: Future, on_ready, on_error):
+        with self._lock:
+            if self._current.get(key) is not future:
+                # superseded by a newer build
+                return
+            del self._current[key]
+
+        # Exceptions raised inside a Qt slot abort the application,
+        # so they are given to the excepthook (that prints them).
+        try:
+            exception = future.exception()
+            if exception is not None:
+                self.build_failed.emit(key, exception)
+                if on_error is None:
+                    raise exception
+                on_error(exception)
+
+            elif on_ready is not None:
+                on_ready(future.result())
+
+        except Exception:
+            sys.excepthook(*sys.exc_info())
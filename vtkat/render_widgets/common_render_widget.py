@@ -8,6 +8,13 @@ from pathlib import Path
 
 from vtkat import VTKAT_DIR
 from vtkat.interactor_styles import ArcballCameraInteractorStyle
+from vtkat.pickers import HoverPicker
+from vtkat.utils import MemoryBudget, SceneBoundsTracker, get_renderer_memory_usage
+
+from .adaptive_quality import AdaptiveQuality
+from .background_builder import BackgroundBuilder
+from .overlay_layer import OverlayLayer
+from .progressive_loader import ProgressiveLoader
 
 
 class CommonRenderWidget(QFrame):
@@ -21,6 +28,8 @@ class CommonRenderWidget(QFrame):
     left_released = pyqtSignal(int, int)
     right_clicked = pyqtSignal(int, int)
     right_released = pyqtSignal(int, int)
+    hovered_cell_changed = pyqtSignal(object, int)
+    hovered_property_changed = pyqtSignal(object, object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -32,8 +41,27 @@ class CommonRenderWidget(QFrame):
         self.render_interactor.Initialize()
         self.render_interactor.GetRenderWindow().AddRenderer(self.renderer)
         self.render_interactor.SetInteractorStyle(self.interactor_style)
+
+        # props that change often (markers, highlights, ghosts) are drawn
+        # in the overlay, without rendering the whole scene again
+        self.overlay = OverlayLayer(self.renderer)
+        self.overlay_renderer = self.overlay.renderer
+        self.interactor_style.set_overlay_layer(self.overlay)
+
+        # the visible bounds are cached, so interactions do
+        # not query every prop on each mouse move
+        self.scene_bounds = SceneBoundsTracker(self.renderer)
+        self.interactor_style.set_scene_bounds_tracker(self.scene_bounds)
         self.renderer.ResetCamera()
 
+        # created only when the first background build is requested
+        self.background_builder = None
+        self.memory_budget = None
+        self.adaptive_quality = None
+        self.hover_picker = None
+        self._hover_property_name = None
+        self._hovered_property = (None, None)
+
         self.render_interactor.AddObserver(
             "LeftButtonPressEvent", self.left_click_press_event
         )
@@ -62,6 +90,149 @@ class CommonRenderWidget(QFrame):
         if ren_win is not None:
             ren_win.Render()
 
+    def update_overlay(self):
+        """
+        Renders only the overlay layer, over a cached image of the scene.
+        Use `update` instead if anything in the scene has changed.
+        """
+        self.overlay.render()
+
+    def add_overlay_actor(self, actor: vtk.vtkProp):
+        self.overlay.add_actor(actor)
+
+    def remove_overlay_actor(self, actor: vtk.vtkProp):
+        self.overlay.remove_actor(actor)
+
+    def load_progressively(
+        self, target, chunks, every_n_chunks=8, every_ms=100
+    ) -> ProgressiveLoader:
+        """
+        Appends the chunks to the target data (or actor) without blocking
+        the interface, rendering the partial model as it grows.
+        Call `cancel` in the returned loader to stop it.
+        """
+
+        def render_partial():
+            self.scene_bounds.reset_clipping_range()
+            self.update()
+
+        loader = ProgressiveLoader(
+            target,
+            chunks,
+            render_partial,
+            every_n_chunks=every_n_chunks,
+            every_ms=every_ms,
+            parent=self,
+        )
+        loader.start()
+        return loader
+
+    def build_in_background(
+        self, key, function, *args, on_ready=None, on_error=None, **kwargs
+    ):
+        """
+        Calls `function(*args, **kwargs)` in a worker thread and gives its
+        result to `on_ready` in the main thread, followed by a render.
+        If it fails, the exception is given to `on_error` instead (or
+        printed, if there is none).
+        A new build with the same key supersedes the previous one.
+        """
+        if self.background_builder is None:
+            self.background_builder = BackgroundBuilder(parent=self)
+
+        def attach(result):
+            if on_ready is not None:
+                on_ready(result)
+            self.update()
+
+        return self.background_builder.submit(
+            key, function, *args, on_ready=attach, on_error=on_error, **kwargs
+        )
+
+    def get_memory_usage(self) -> dict:
+        """
+        Memory (in bytes) used by the actors of the widget, in total
+        and for every actor, counting vtk arrays and python inputs.
+        """
+        return get_renderer_memory_usage(self.renderer)
+
+    def set_memory_budget(self, max_bytes: int | None, spill_dir=None):
+        """
+        Evicts the data of hidden actors when more than `max_bytes` are
+        used. It is restored when the actors are shown again.
+        If None is given, the budget is removed.
+        """
+        if self.memory_budget is not None:
+            self.memory_budget.close()
+            self.memory_budget = None
+
+        if max_bytes is None:
+            return
+
+        self.memory_budget = MemoryBudget(self.renderer, max_bytes, spill_dir)
+        self.memory_budget.enforce()
+
+    def set_adaptive_quality(self, target_frame_time: float | None = 1 / 30):
+        """
+        Lowers the render quality while the camera is moved, whenever the
+        frames take longer than `target_frame_time` (in seconds), and
+        renders at full quality when it stops.
+        If None is given, the scene is always rendered at full quality.
+        """
+        if self.adaptive_quality is not None:
+            self.adaptive_quality.close()
+            self.adaptive_quality = None
+        self.interactor_style.set_adaptive_quality(None)
+
+        if target_frame_time is None:
+            return
+
+        self.adaptive_quality = AdaptiveQuality(
+            self.render_interactor.GetRenderWindow(), target_frame_time, parent=self
+        )
+        self.interactor_style.set_adaptive_quality(self.adaptive_quality)
+
+    def get_frame_times(self) -> list[float]:
+        """
+        Duration (in seconds) of the last renders, measured
+        only while the adaptive quality is enabled.
+        """
+        if self.adaptive_quality is None:
+            return []
+        return self.adaptive_quality.get_frame_times()
+
+    def enable_hover_picking(self, rate: float = 30, property_name: str | None = None):
+        """
+        Emits `hovered_cell_changed` with the prop and the cell under the
+        cursor when they change, picking at most `rate` times per second.
+        If a property name is given, `hovered_property_changed` is also
+        emitted with the prop and the value of that cell data array.
+        """
+        if self.hover_picker is None:
+            self.hover_picker = HoverPicker(self.renderer)
+
+        self._hover_property_name = property_name
+        self._hovered_property = (None, None)
+        self.interactor_style.set_hover_picking(
+            self.hover_picker, self._hovered_cell_changed, rate
+        )
+
+    def disable_hover_picking(self):
+        self.interactor_style.set_hover_picking(None, None)
+
+    def _hovered_cell_changed(self, prop, cell):
+        self.hovered_cell_changed.emit(prop, cell)
+
+        if self._hover_property_name is None:
+            return
+
+        value = self.hover_picker.get_property(prop, cell, self._hover_property_name)
+        if (prop, value) == self._hovered_property:
+            return
+
+        self._hovered_property = (prop, value)
+        self.hovered_property_changed.emit(prop, value)
+
     def left_click_press_event(self, obj, event):
         x, y, *_ = self.render_interactor.GetEventPosition()
         self.left_clicked.emit(x, y)
@@ -122,7 +293,7 @@ class CommonRenderWidget(QFrame):
         axes_actor.GetZAxisShaftProperty().LightingOff()
         axes_actor.GetXAxisTipProperty().LightingOff()
         axes_actor.GetYAxisTipProperty().LightingOff()
-        axes_actor.GetZAxisTipProperty().LightingOff()     
+        axes_actor.GetZAxisTipProperty().LightingOff()
 
         x_property = axes_actor.GetXAxisCaptionActor2D().GetCaptionTextProperty()
         y_property = axes_actor.GetYAxisCaptionActor2D().GetCaptionTextProperty()
@@ -276,7 +447,7 @@ class CommonRenderWidget(QFrame):
         self.renderer.GetActiveCamera().SetPosition(position)
         self.renderer.GetActiveCamera().SetViewUp(view_up)
         self.renderer.GetActiveCamera().SetParallelProjection(True)
-        self.renderer.ResetCamera(*self.renderer.ComputeVisiblePropBounds())
+        self.renderer.ResetCamera(*self.scene_bounds.get_bounds())
         self.update()
 
     def set_top_view(self):
@@ -323,9 +494,9 @@ class CommonRenderWidget(QFrame):
 
     def copy_camera_from(self, other):
         if isinstance(other, CommonRenderWidget):
-            other_camera = other.renderer.GetActiveCamera() 
+            other_camera = other.renderer.GetActiveCamera()
         elif isinstance(other, vtk.vtkRenderer):
-            other_camera = other.GetActiveCamera() 
+            other_camera = other.GetActiveCamera()
         else:
             return
 
@@ -0,0 +1,157 @@
+import vtk
+
+
+class OverlayLayer:
+    """
+    A renderer drawn over the scene renderer, in a second layer of the
+    same render window and sharing its camera.
+
+    The props in the overlay always appear in front of the scene. Every
+    time the scene is rendered, its image is kept, so when only the overlay
+    changes `render` draws it over that image, without rendering the
+    scene again.
+
+    The image is read from the final frame when the overlay is empty, or
+    right after the scene renderer draws, before the overlay. With
+    multisampling the edges of the overlay would not blend with the scene
+    like in a full render, so the whole window is always rendered then.
+    """
+
+    def __init__(self, scene_renderer: vtk.vtkRenderer) -> None:
+        self.scene_renderer = scene_renderer
+
+        self.renderer = vtk.vtkRenderer()
+        self.renderer.SetLayer(1)
+        self.renderer.InteractiveOff()
+        self.renderer.SetActiveCamera(scene_renderer.GetActiveCamera())
+
+        render_window = scene_renderer.GetRenderWindow()
+        render_window.SetNumberOfLayers(max(2, render_window.GetNumberOfLayers()))
+        render_window.AddRenderer(self.renderer)
+
+        # the arrays are reused, so no memory is allocated every frame
+        self._color_cache = vtk.vtkUnsignedCharArray()
+        self._depth_cache = vtk.vtkFloatArray()
+        self._has_depth = False
+        self._cache_key = None
+        self._overlay_only = False
+        self._scene_rendered = False
+
+        scene_renderer.AddObserver("EndEvent", self._scene_render_ended)
+        render_window.AddObserver("EndEvent", self._window_render_ended)
+        scene_renderer.GetViewProps().AddObserver(
+            "ModifiedEvent", self._view_props_modified
+        )
+        self.renderer.AddObserver("StartEvent", self._overlay_render_started)
+
+    def add_actor(self, actor: vtk.vtkProp):
+        """
+        Adds the actor to the overlay, removing it from
+        any other renderer (like the scene) it was in.
+        """
+        for i in reversed(range(actor.GetNumberOfConsumers())):
+            consumer = actor.GetConsumer(i)
+            if isinstance(consumer, vtk.vtkRenderer) and consumer != self.renderer:
+                consumer.RemoveViewProp(actor)
+        self.renderer.AddActor(actor)
+
+    def remove_actor(self, actor: vtk.vtkProp):
+        self.renderer.RemoveActor(actor)
+
+    def set_depth_test(self, cond: bool):
+        """
+        If enabled the overlay props are hidden behind the scene geometry,
+        otherwise they are always drawn in front of it.
+        """
+        self.renderer.SetPreserveDepthBuffer(cond)
+
+    def invalidate(self):
+        self._cache_key = None
+
+    def render(self):
+        """
+        Renders only the overlay, on top of the last image of the scene.
+        If that image is outdated the whole window is rendered.
+        """
+        render_window = self.scene_renderer.GetRenderWindow()
+        if self._is_multisampled() or not self._is_cache_valid():
+            render_window.Render()
+            return
+
+        self._overlay_only = True
+        self.scene_renderer.DrawOff()
+        try:
+            render_window.Render()
+        finally:
+            self.scene_renderer.DrawOn()
+            self._overlay_only = False
+
+    def _scene_render_ended(self, obj, event):
+        # the passes of a hardware selector are not shown
+        if obj.GetSelector() is not None:
+            return
+
+        if self._is_multisampled():
+            self.invalidate()
+            return
+        self._scene_rendered = True
+
+        # the overlay was not drawn yet, so the back buffer has only the scene
+        if self.renderer.VisibleActorCount() > 0:
+            self._capture_scene(front=0)
+
+    def _window_render_ended(self, obj, event):
+        if not self._scene_rendered:
+            return
+        self._scene_rendered = False
+
+        # nothing was drawn over the scene, so the final image is the scene
+        if self.renderer.VisibleActorCount() == 0:
+            self._capture_scene(front=1)
+
+    def _capture_scene(self, front: int):
+        # The depth is only needed if the overlay is depth tested.
+        render_window = self.scene_renderer.GetRenderWindow()
+        width, height = render_window.GetSize()
+        render_window.GetPixelData(
+            0, 0, width - 1, height - 1, front, self._color_cache, 0
+        )
+
+        self._has_depth = bool(self.renderer.GetPreserveDepthBuffer())
+        if self._has_depth:
+            render_window.GetZbufferData(0, 0, width - 1, height - 1, self._depth_cache)
+
+        self._cache_key = self._get_cache_key()
+
+    def _view_props_modified(self, obj, event):
+        self.invalidate()
+
+    def _overlay_render_started(self, obj, event):
+        if not self._overlay_only:
+            return
+
+        render_window = self.scene_renderer.GetRenderWindow()
+        width, height = render_window.GetSize()
+        render_window.SetPixelData(0, 0, width - 1, height - 1, self._color_cache, 0, 0)
+        if self._has_depth:
+            render_window.SetZbufferData(0, 0, width - 1, height - 1, self._depth_cache)
+
+    def _is_multisampled(self):
+        return self.scene_renderer.GetRenderWindow().GetMultiSamples() > 0
+
+    def _is_cache_valid(self):
+        if self._cache_key is None:
+            return False
+
+        if self.renderer.GetPreserveDepthBuffer() and not self._has_depth:
+            return False
+        return self._cache_key == self._get_cache_key()
+
+    def _get_cache_key(self):
+        # Changes in the props themselves are not tracked here, the
+        # scene must be rendered again (not only the overlay) after them.
+        render_window = self.scene_renderer.GetRenderWindow()
+        return (
+            tuple(render_window.GetSize()),
+            self.scene_renderer.GetActiveCamera().GetMTime(),
+        )
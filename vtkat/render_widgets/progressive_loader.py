@@ -0,0 +1,124 @@
+from time import perf_counter
+from typing import Callable, Iterable
+
+import vtk
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class ProgressiveLoader(QObject):
+    """
+    Feeds chunks of geometry to a LinesData/VerticesData (or to an actor
+    that renders one) from inside the Qt event loop, rendering the partial
+    result every few chunks or milliseconds.
+
+    The chunks are consumed in small time slices, so the window stays
+    responsive while the model is streamed in. The loading can be stopped
+    at any time with `cancel`, which keeps the chunks loaded so far.
+    """
+
+    chunk_loaded = pyqtSignal(int)
+    finished = pyqtSignal()
+    cancelled = pyqtSignal()
+
+    def __init__(
+        self,
+        target,
+        chunks: Iterable,
+        render_callback: Callable | None = None,
+        every_n_chunks: int = 8,
+        every_ms: float = 100,
+        time_slice_ms: float = 15,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+
+        if isinstance(target, vtk.vtkActor):
+            target = target.GetMapper().GetInput()
+
+        self.data = target
+        self.render_callback = render_callback
+        self.every_n_chunks = every_n_chunks
+        self.every_ms = every_ms
+        self.time_slice_ms = time_slice_ms
+
+        self.loaded_chunks = 0
+        self.is_running = False
+
+        self._chunks = iter(chunks)
+        self._chunks_since_render = 0
+        self._last_render_time = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._load_slice)
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._last_render_time = perf_counter()
+        self._timer.start()
+
+    def cancel(self):
+        if not self.is_running:
+            return
+
+        self._stop()
+        # lets generators release their files
+        if hasattr(self._chunks, "close"):
+            self._chunks.close()
+        # the partial data must not keep the spare capacity of the chunks
+        self.data.finish_chunks()
+        self._render()
+        self.cancelled.emit()
+
+    def _load_slice(self):
+        slice_end = perf_counter() + self.time_slice_ms / 1000
+
+        while perf_counter() < slice_end:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._finish()
+                return
+
+            self.data.append_chunk(chunk)
+            self.loaded_chunks += 1
+            self._chunks_since_render += 1
+            self.chunk_loaded.emit(self.loaded_chunks)
+
+            # the chunk_loaded signal may have cancelled the loading
+            if not self.is_running:
+                return
+
+            if self._should_render():
+                self._render()
+                return
+
+        if self._should_render():
+            self._render()
+
+    def _should_render(self):
+        if self._chunks_since_render == 0:
+            return False
+
+        elapsed_ms = (perf_counter() - self._last_render_time) * 1000
+        return (self._chunks_since_render >= self.every_n_chunks) or (
+            elapsed_ms >= self.every_ms
+        )
+
+    def _finish(self):
+        self._stop()
+        self.data.finish_chunks()
+        self._render()
+        self.finished.emit()
+
+    def _stop(self):
+        self.is_running = False
+        self._timer.stop()
+
+    def _render(self):
+        self._chunks_since_render = 0
+        self._last_render_time = perf_counter()
+        if self.render_callback is not None:
+            self.render_callback()
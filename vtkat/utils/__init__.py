@@ -1 +1,14 @@
+from .growing_array import GrowingArray
+from .harmonic_deformation import HarmonicDeformation
+from .memory import (
+    MemoryBudget,
+    estimate_python_size,
+    get_actor_memory_usage,
+    get_renderer_memory_usage,
+)
+from .point_octree import PointOctree
+from .poly_data_cache import hash_sources, load_poly_data_cache, save_poly_data_cache
 from .poly_data_utils import *
+from .scalar_field import ScalarField
+from .scene_bounds import SceneBoundsTracker
+from .selection_highlighter import SelectionHighlighter
@@ -0,0 +1,98 @@
+import numpy as np
+
+
+class GrowingArray:
+    """
+    A numpy buffer that can be appended to with amortized resizing.
+
+    The capacity grows geometrically, so appending many small chunks costs
+    about the same as allocating the final array at once. The filled part
+    of the buffer is always available through `view`, which can be wrapped
+    as a vtk array without copying.
+    """
+
+    def __init__(
+        self, width: int | None = None, dtype=np.float32, growth_factor: float = 1.5
+    ) -> None:
+        self.width = width
+        self.dtype = np.dtype(dtype)
+        self.growth_factor = growth_factor
+        self._size = 0
+        self._data = np.empty(self._shape(0), dtype=self.dtype)
+
+    @classmethod
+    def from_array(
+        cls, values, width: int | None = None, dtype=None, growth_factor: float = 1.5
+    ) -> "GrowingArray":
+        """
+        Wraps the filled values as a full buffer, without copying
+        them if they already have the given dtype.
+        """
+        values = np.asarray(values, dtype=dtype)
+        array = cls(width, values.dtype, growth_factor)
+        array._data = values.reshape(array._shape(-1))
+        array._size = len(array._data)
+        return array
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return len(self._data)
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._data[: self._size]
+
+    def reserve(self, capacity: int):
+        if capacity <= self.capacity:
+            return
+
+        data = np.empty(self._shape(capacity), dtype=self.dtype)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+    def extend(self, values) -> int:
+        """
+        Appends the values to the end of the buffer and
+        returns the index where they were written.
+        """
+
+        values = np.asarray(values).reshape(self._shape(-1))
+        start = self._size
+        end = start + len(values)
+
+        if end > self.capacity:
+            self.reserve(max(end, int(self.capacity * self.growth_factor) + 1))
+
+        self._data[start:end] = values
+        self._size = end
+        return start
+
+    def astype(self, dtype) -> "GrowingArray":
+        """
+        Returns a copy of the array with another dtype and the same capacity.
+        """
+        converted = GrowingArray(self.width, dtype, self.growth_factor)
+        converted.reserve(self.capacity)
+        converted._data[: self._size] = self.view
+        converted._size = self._size
+        return converted
+
+    def truncate(self, size: int):
+        self._size = min(max(size, 0), self._size)
+
+    def clear(self):
+        self._size = 0
+        self._data = np.empty(self._shape(0), dtype=self.dtype)
+
+    def shrink_to_fit(self):
+        if self.capacity == self._size:
+            return
+        self._data = self._data[: self._size].copy()
+
+    def _shape(self, length: int):
+        if self.width is None:
+            return (length,)
+        return (length, self.width)
@@ -0,0 +1,150 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+
+class HarmonicDeformation:
+    """
+    Animates a displacement field (real or complex) over the points of a
+    poly data, like a vibration mode shape.
+
+    For every frame the points are set to
+        base + scale * Re(displacement * e^(i * phase))
+    writing directly into the existing points buffer. The phase factors
+    of all frames are computed once, so a frame allocates no memory.
+
+    If the points of the data are replaced or modified by something else
+    (for example when it is rebuilt, or replaced in the actor given as
+    target), the base points are read again in the next frame.
+    """
+
+    def __init__(
+        self,
+        target: vtk.vtkPolyData | vtk.vtkActor,
+        displacement: np.ndarray,
+        scale: float = 1.0,
+        number_of_frames: int = 30,
+    ) -> None:
+        self.actor = target if isinstance(target, vtk.vtkActor) else None
+        self.data: vtk.vtkPolyData = self._get_target_data(target)
+        self._real = None
+        self._read_base_points()
+
+        displacement = np.asarray(displacement).reshape(self._coords.shape)
+        self._real = displacement.real.astype(self._coords.dtype)
+        self._imag = None
+        if np.iscomplexobj(displacement) and displacement.imag.any():
+            self._imag = displacement.imag.astype(self._coords.dtype)
+
+        self._scalars = []
+        self.scale = scale
+        self.number_of_frames = number_of_frames
+        self._update_phase_factors()
+
+    def set_scale(self, scale: float):
+        self.scale = scale
+
+    def set_number_of_frames(self, number_of_frames: int):
+        if number_of_frames == self.number_of_frames:
+            return
+        self.number_of_frames = number_of_frames
+        self._update_phase_factors()
+
+    def add_scalars(self, values: np.ndarray, array: vtk.vtkDataArray):
+        """
+        Animates the values of a point or cell data array in the same
+        way, as Re(values * e^(i * phase)). Its current values are put
+        back by `reset`.
+        """
+        target = vtk_to_numpy(array)
+        values = np.asarray(values).reshape(target.shape)
+        imag = values.imag.astype(target.dtype) if np.iscomplexobj(values) else None
+        self._scalars.append(
+            (
+                array,
+                target,
+                values.real.astype(target.dtype),
+                imag,
+                np.empty_like(target),
+                target.copy(),
+            )
+        )
+
+    def apply(self, frame: int):
+        if self._are_points_modified():
+            self._read_base_points()
+
+        frame = frame % self.number_of_frames
+        cos_factor = self._cos[frame]
+        sin_factor = self._sin[frame]
+
+        np.multiply(self._real, self.scale * cos_factor, out=self._coords)
+        self._coords += self._base
+        if self._imag is not None:
+            np.multiply(self._imag, -self.scale * sin_factor, out=self._work)
+            self._coords += self._work
+        self._points.Modified()
+        self._points_key = self._get_points_key()
+
+        for array, target, real, imag, work, _ in self._scalars:
+            np.multiply(real, cos_factor, out=target)
+            if imag is not None:
+                np.multiply(imag, -sin_factor, out=work)
+                target += work
+            array.Modified()
+
+    def reset(self):
+        """
+        Puts the points back in their undeformed position
+        and the animated scalars back to their original values.
+        """
+        if self._are_points_modified():
+            # they were not deformed since then
+            self._read_base_points()
+        else:
+            self._coords[:] = self._base
+            self._points.Modified()
+            self._points_key = self._get_points_key()
+
+        for array, target, _, _, _, original in self._scalars:
+            target[:] = original
+            array.Modified()
+
+    def _get_target_data(self, target) -> vtk.vtkPolyData:
+        if isinstance(target, vtk.vtkActor):
+            return target.GetMapper().GetInput()
+        return target
+
+    def _are_points_modified(self) -> bool:
+        if self.actor is not None:
+            data = self._get_target_data(self.actor)
+            if data.__this__ != self.data.__this__:
+                self.data = data
+                return True
+        # the key is updated after every change made here
+        return self._get_points_key() != self._points_key
+
+    def _get_points_key(self):
+        points = self.data.GetPoints()
+        array = points.GetData()
+        return (points.__this__, array.__this__, array.GetMTime())
+
+    def _read_base_points(self):
+        points = self.data.GetPoints()
+        coords = vtk_to_numpy(points.GetData())
+        if self._real is not None and coords.shape != self._real.shape:
+            raise ValueError(
+                "The deformed data now has another number of points "
+                "than the displacement field"
+            )
+
+        self._points = points
+        self._coords = coords
+        self._base = coords.copy()
+        self._work = np.empty_like(coords)
+        self._points_key = self._get_points_key()
+
+    def _update_phase_factors(self):
+        phases = 2 * np.pi * np.arange(self.number_of_frames) / self.number_of_frames
+        self._cos = np.cos(phases)
+        self._sin = np.sin(phases)
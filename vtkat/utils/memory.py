@@ -0,0 +1,346 @@
+import shutil
+import sys
+import tempfile
+import weakref
+from itertools import count, islice
+from pathlib import Path
+from time import monotonic
+from typing import Callable
+
+import numpy as np
+import vtk
+
+from .poly_data_cache import load_poly_data_cache, save_poly_data_cache
+
+# attributes where the actors and poly data keep their python inputs
+_SOURCE_ATTRIBUTES = ("lines_list", "points_list")
+
+
+def estimate_python_size(obj, samples: int = 16) -> int:
+    """
+    Estimates the memory (in bytes) used by a python object and its
+    contents. The size of long sequences is extrapolated from their
+    first items, so lists of millions of tuples are cheap to measure.
+    """
+    if obj is None:
+        return 0
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes if obj.base is None else 0
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray)):
+        return size
+
+    if isinstance(obj, dict):
+        obj = list(obj.keys()) + list(obj.values())
+
+    if not isinstance(obj, (list, tuple, set, frozenset)) or len(obj) == 0:
+        return size
+
+    first_items = list(islice(obj, samples))
+    items_size = sum(estimate_python_size(item, samples) for item in first_items)
+    return size + items_size * len(obj) // len(first_items)
+
+
+def get_actor_memory_usage(actor: vtk.vtkProp) -> dict:
+    """
+    Returns the memory (in bytes) used by the vtk arrays of the actor
+    input and by the python inputs kept by the actor and its data.
+    """
+    data = _get_actor_data(actor)
+    vtk_size = 1024 * data.GetActualMemorySize() if data is not None else 0
+
+    python_size = 0
+    for source in _get_sources(actor, data):
+        python_size += estimate_python_size(source)
+
+    return dict(vtk=vtk_size, python=python_size, total=vtk_size + python_size)
+
+
+def get_renderer_memory_usage(renderer: vtk.vtkRenderer) -> dict:
+    """
+    Returns the memory (in bytes) used by all actors of the renderer, in
+    total and for every actor. Data shared by actors is counted once.
+    """
+    counted = set()
+    actors = dict()
+    total = dict(vtk=0, python=0, total=0)
+
+    for prop in renderer.GetViewProps():
+        data = _get_actor_data(prop)
+        # the python wrappers of vtk data are not hashable
+        if data is None or data.__this__ in counted:
+            continue
+        counted.add(data.__this__)
+
+        usage = get_actor_memory_usage(prop)
+        actors[prop] = usage
+        for key, value in usage.items():
+            total[key] += value
+
+    total["actors"] = actors
+    return total
+
+
+class MemoryBudget:
+    """
+    Limits the memory used by the actors of a renderer.
+
+    When the budget is exceeded, the poly data of hidden actors is evicted,
+    the least recently hidden first. The data object is kept (so the
+    mapper and any observer stay valid), but its arrays are released.
+    It is restored as soon as the actor becomes visible again:
+        - by a loader given with `set_loader`, if any;
+        - by building it again, if it still keeps its source list (the
+          cell arrays, like colors, are kept in memory meanwhile);
+        - otherwise from a temporary cache file written on eviction.
+    """
+
+    def __init__(
+        self,
+        renderer: vtk.vtkRenderer,
+        max_bytes: int,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        self.renderer = renderer
+        self.max_bytes = max_bytes
+
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._own_spill_dir = None
+        self._file_counter = count()
+
+        self._loaders = dict()
+        self._observers = dict()
+        self._hidden_since = dict()
+        self._evicted = dict()
+        self._spilled = dict()
+        self._cell_data = dict()
+        self._usage = dict()
+
+        self._props_observer = renderer.GetViewProps().AddObserver(
+            "ModifiedEvent", self._view_props_modified
+        )
+        self._sync_actors()
+
+    def set_max_bytes(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.enforce()
+
+    def set_loader(self, actor: vtk.vtkActor, loader: Callable | None):
+        """
+        The loader is called with the actor and must return a poly data,
+        that is copied to the evicted data when the actor is shown again.
+        """
+        if loader is None:
+            self._loaders.pop(actor, None)
+        else:
+            self._loaders[actor] = loader
+
+    def is_evicted(self, actor: vtk.vtkActor) -> bool:
+        return actor in self._evicted
+
+    def enforce(self) -> int:
+        """
+        Evicts hidden actors until the memory used is within the budget.
+        Returns the number of bytes released.
+        """
+        total, actors = self._get_renderer_usage()
+        exceeding = total - self.max_bytes
+        released = 0
+
+        candidates = sorted(self._hidden_since.items(), key=lambda item: item[1])
+        for actor, _ in candidates:
+            if released >= exceeding:
+                break
+            if actor in self._evicted or actor not in actors:
+                continue
+            released += actors[actor]["vtk"]
+            self.evict(actor)
+
+        return released
+
+    def evict(self, actor: vtk.vtkActor):
+        data = _get_actor_data(actor)
+        if data is None or actor in self._evicted:
+            return
+
+        if actor in self._loaders:
+            path = None
+        elif self._can_rebuild(data):
+            # the cell arrays can not be built again with the geometry
+            path = None
+            cell_data = vtk.vtkCellData()
+            cell_data.ShallowCopy(data.GetCellData())
+            self._cell_data[actor] = cell_data
+        elif not isinstance(data, vtk.vtkPolyData):
+            return
+        elif self._is_spilled(actor, data):
+            # restored from this file and not modified since then
+            path, _ = self._spilled[actor]
+        else:
+            path = self._get_spill_dir() / f"{next(self._file_counter)}.vtkatpd"
+            save_poly_data_cache(path, data)
+
+        data.Initialize()
+        if hasattr(data, "clear_chunks"):
+            # releases the buffers shared with the vtk arrays
+            data.clear_chunks()
+        self._evicted[actor] = path
+
+    def restore(self, actor: vtk.vtkActor):
+        if actor not in self._evicted:
+            return
+
+        path = self._evicted.pop(actor)
+        data = _get_actor_data(actor)
+
+        if actor in self._loaders:
+            _copy_poly_data(data, self._loaders[actor](actor))
+        elif path is None:
+            data.build()
+            cell_data = self._cell_data.pop(actor, None)
+            if cell_data is not None:
+                data.GetCellData().ShallowCopy(cell_data)
+                data.Modified()
+        else:
+            # the memory mapped file stays open while the
+            # arrays exist, so it is only removed at close
+            _copy_poly_data(data, load_poly_data_cache(path))
+            self._spilled[actor] = (path, data.GetMTime())
+
+    def close(self):
+        """
+        Restores every evicted actor, removes the
+        observers and deletes the temporary files.
+        """
+        for actor in list(self._evicted):
+            self.restore(actor)
+
+        for actor in list(self._observers):
+            self._unwatch(actor)
+
+        self.renderer.GetViewProps().RemoveObserver(self._props_observer)
+
+        if self._own_spill_dir is not None:
+            self._own_spill_dir()
+
+    def _get_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="vtkat-"))
+            self._own_spill_dir = weakref.finalize(
+                self, shutil.rmtree, self._spill_dir, ignore_errors=True
+            )
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        return self._spill_dir
+
+    def _is_spilled(self, actor, data):
+        if actor not in self._spilled:
+            return False
+        _, mtime = self._spilled[actor]
+        return data.GetMTime() == mtime
+
+    def _can_rebuild(self, data):
+        if not hasattr(data, "build"):
+            return False
+        return any(
+            getattr(data, attribute, None) is not None
+            for attribute in _SOURCE_ATTRIBUTES
+        )
+
+    def _get_renderer_usage(self) -> tuple[int, dict]:
+        # like get_renderer_memory_usage, but only the
+        # actors whose data changed are measured again
+        counted = set()
+        actors = dict()
+        total = 0
+
+        for actor in self._observers:
+            data = _get_actor_data(actor)
+            if data is None or data.__this__ in counted:
+                continue
+            counted.add(data.__this__)
+
+            actors[actor] = self._get_actor_usage(actor, data)
+            total += actors[actor]["total"]
+
+        return total, actors
+
+    def _get_actor_usage(self, actor, data) -> dict:
+        key = (data.__this__, data.GetMTime())
+        cached = self._usage.get(actor)
+        if cached is None or cached[0] != key:
+            cached = (key, get_actor_memory_usage(actor))
+            self._usage[actor] = cached
+        return cached[1]
+
+    def _view_props_modified(self, obj, event):
+        self._sync_actors()
+        self.enforce()
+
+    def _sync_actors(self):
+        current = set(
+            prop
+            for prop in self.renderer.GetViewProps()
+            if isinstance(prop, vtk.vtkActor)
+        )
+
+        for actor in [actor for actor in self._observers if actor not in current]:
+            self.restore(actor)
+            self._unwatch(actor)
+
+        for actor in current:
+            if actor not in self._observers:
+                self._watch(actor)
+
+    def _watch(self, actor: vtk.vtkActor):
+        def visibility_changed(obj, event):
+            self._visibility_changed(actor)
+
+        self._observers[actor] = actor.AddObserver("ModifiedEvent", visibility_changed)
+        if not actor.GetVisibility():
+            self._hidden_since[actor] = monotonic()
+
+    def _unwatch(self, actor: vtk.vtkActor):
+        observer = self._observers.pop(actor, None)
+        if observer is not None:
+            actor.RemoveObserver(observer)
+        self._hidden_since.pop(actor, None)
+        self._loaders.pop(actor, None)
+        self._spilled.pop(actor, None)
+        self._usage.pop(actor, None)
+
+    def _visibility_changed(self, actor: vtk.vtkActor):
+        if actor.GetVisibility():
+            self._hidden_since.pop(actor, None)
+            self.restore(actor)
+
+        elif actor not in self._hidden_since:
+            self._hidden_since[actor] = monotonic()
+            self.enforce()
+
+
+def _get_actor_data(actor: vtk.vtkProp):
+    mapper = actor.GetMapper() if hasattr(actor, "GetMapper") else None
+    if mapper is None or not hasattr(mapper, "GetInput"):
+        return None
+    return mapper.GetInput()
+
+
+def _copy_poly_data(data: vtk.vtkPolyData, loaded: vtk.vtkPolyData):
+    if hasattr(data, "adopt"):
+        # the chunked classes also need their own buffers back
+        data.adopt(loaded)
+    else:
+        data.ShallowCopy(loaded)
+    data.Modified()
+
+
+def _get_sources(actor, data):
+    sources = dict()
+    for obj in (actor, data):
+        for attribute in _SOURCE_ATTRIBUTES:
+            source = getattr(obj, attribute, None)
+            if source is not None:
+                sources[id(source)] = source
+    return sources.values()
@@ -0,0 +1,284 @@
+from pathlib import Path
+
+import numpy as np
+
+_CHUNK_SIZE = 1 << 22
+
+
+class PointOctree:
+    """
+    Octree over a point cloud, used to show it at multiple resolutions.
+
+    The points are sorted by their Morton code at the deepest level, so
+    the points of every node (at any level) are contiguous in the sorted
+    array, and taking every k-th point of a node gives an evenly spread
+    subsample of it. For every level only the node keys, starts and
+    counts are kept.
+
+    The input may be a memory mapped array. If a `cache_path` is given,
+    the sorted points are written there (as a .npy file) and memory
+    mapped, so the whole cloud is never kept in memory.
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        max_depth: int | None = None,
+        leaf_size: int = 4096,
+        cache_path: str | Path | None = None,
+    ) -> None:
+        number_of_points = len(points)
+        if max_depth is None:
+            # scanned clouds are mostly surfaces, where
+            # the occupied nodes grow 4 times per level
+            ratio = max(number_of_points / leaf_size, 1)
+            max_depth = int(np.ceil(np.log(ratio) / np.log(4)))
+        self.max_depth = int(np.clip(max_depth, 1, 21))
+
+        self.origin, self.size = self._compute_cube(points)
+        codes = self._compute_codes(points)
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+
+        self.points = self._reorder_points(points, order, cache_path)
+        del order
+
+        self.keys = [None] * (self.max_depth + 1)
+        self.starts = [None] * (self.max_depth + 1)
+        self.counts = [None] * (self.max_depth + 1)
+        self._build_levels(codes)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def get_bounds(self) -> tuple:
+        return self._bounds
+
+    def get_node_size(self, level: int) -> float:
+        return self.size / (1 << level)
+
+    def get_node_boxes(self, level: int, indices=None) -> np.ndarray:
+        """
+        Returns a (n, 6) array with (x0, y0, z0, x1, y1, z1) for
+        the nodes of the level.
+        """
+        keys = self.keys[level] if indices is None else self.keys[level][indices]
+        node_size = self.get_node_size(level)
+        minimums = self.origin + _decode_morton(keys) * node_size
+        return np.hstack([minimums, minimums + node_size])
+
+    def get_node_points(self, level: int, index: int, stride: int = 1):
+        start = self.starts[level][index]
+        count = self.counts[level][index]
+        return self.points[start : start + count : stride]
+
+    def get_children(self, level: int, indices: np.ndarray):
+        """
+        Returns the indices of the children (at level + 1) of the given
+        nodes, and for each child the position of its parent in `indices`.
+        """
+        child_keys = self.keys[level + 1]
+        first_keys = self.keys[level][indices] << np.uint64(3)
+        first = np.searchsorted(child_keys, first_keys)
+        last = np.searchsorted(child_keys, first_keys + np.uint64(8))
+        number_of_children = last - first
+
+        parents = np.repeat(np.arange(len(indices)), number_of_children)
+        offsets = np.arange(len(parents)) - np.repeat(
+            np.cumsum(number_of_children) - number_of_children, number_of_children
+        )
+        return first[parents] + offsets, parents
+
+    def select_nodes(
+        self,
+        planes: np.ndarray,
+        pixels_per_unit,
+        max_node_pixels: float = 128,
+        point_spacing: float = 2,
+        point_budget: int = 1_000_000,
+    ):
+        """
+        Chooses the nodes to show and how many of their points.
+
+        Nodes outside any of the planes (given as (a, b, c, d), inside
+        where ax + by + cz + d >= 0) are skipped. Nodes bigger than
+        `max_node_pixels` on the screen are replaced by their children.
+        `pixels_per_unit` is called with the node centers and must return
+        how many pixels a unit of length covers at each one.
+
+        Every chosen node shows one point every `point_spacing` pixels
+        (but at most all of its points), and the strides are increased
+        until the total fits in the point budget.
+
+        Returns the levels, indices and strides of the chosen nodes.
+        """
+        levels, indices, pixels, counts = [], [], [], []
+        current = np.arange(len(self.keys[0]))
+
+        for level in range(self.max_depth + 1):
+            boxes = self.get_node_boxes(level, current)
+            current = current[_boxes_inside_planes(boxes, planes)]
+            if len(current) == 0:
+                break
+
+            boxes = self.get_node_boxes(level, current)
+            centers = (boxes[:, :3] + boxes[:, 3:]) / 2
+            node_pixels = self.get_node_size(level) * pixels_per_unit(centers)
+
+            refine = node_pixels > max_node_pixels
+            if level == self.max_depth:
+                refine[:] = False
+
+            levels.append(np.full(np.count_nonzero(~refine), level))
+            indices.append(current[~refine])
+            pixels.append(node_pixels[~refine])
+            counts.append(self.counts[level][current[~refine]])
+
+            if not refine.any():
+                break
+            current, _ = self.get_children(level, current[refine])
+
+        if not levels:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+
+        levels = np.concatenate(levels)
+        indices = np.concatenate(indices)
+        pixels = np.concatenate(pixels)
+        counts = np.concatenate(counts)
+
+        # the node covers about (pixels / spacing)² points of the screen
+        wanted = np.clip((pixels / point_spacing) ** 2, 1, None)
+        strides = 2 ** np.ceil(np.log2(np.maximum(counts / wanted, 1))).astype(np.int64)
+
+        while True:
+            total = np.sum(-(-counts // strides))
+            if total <= point_budget or (strides >= counts).all():
+                break
+            strides *= 2
+
+        return levels, indices, strides
+
+    def _compute_cube(self, points):
+        if len(points) == 0:
+            self._bounds = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            return np.zeros(3), 1.0
+
+        minimums = np.full(3, np.inf)
+        maximums = np.full(3, -np.inf)
+        for start in range(0, len(points), _CHUNK_SIZE):
+            chunk = np.asarray(points[start : start + _CHUNK_SIZE], dtype=np.float64)
+            minimums = np.minimum(minimums, chunk.min(axis=0))
+            maximums = np.maximum(maximums, chunk.max(axis=0))
+
+        self._bounds = tuple(np.column_stack([minimums, maximums]).ravel().tolist())
+        size = float((maximums - minimums).max())
+        # a little margin, so the points in the upper faces fit in the cube
+        size = size * (1 + 1e-6) if size > 0 else 1.0
+        return minimums, size
+
+    def _compute_codes(self, points):
+        resolution = 1 << self.max_depth
+        codes = np.empty(len(points), dtype=np.uint64)
+        for start in range(0, len(points), _CHUNK_SIZE):
+            chunk = np.asarray(points[start : start + _CHUNK_SIZE], dtype=np.float64)
+            cells = ((chunk - self.origin) * (resolution / self.size)).astype(np.int64)
+            np.clip(cells, 0, resolution - 1, out=cells)
+            codes[start : start + len(chunk)] = _encode_morton(cells.astype(np.uint64))
+        return codes
+
+    def _reorder_points(self, points, order, cache_path):
+        if cache_path is None:
+            reordered = np.empty((len(points), 3), dtype=np.float32)
+        else:
+            reordered = np.lib.format.open_memmap(
+                cache_path, mode="w+", dtype=np.float32, shape=(len(points), 3)
+            )
+
+        for start in range(0, len(points), _CHUNK_SIZE):
+            indices = order[start : start + _CHUNK_SIZE]
+            # sorted indices read the memory mapped input sequentially
+            sorting = np.argsort(indices)
+            values = np.asarray(points[indices[sorting]], dtype=np.float32)
+            reordered[start + sorting] = values
+
+        if cache_path is not None:
+            reordered.flush()
+            reordered = np.load(cache_path, mmap_mode="r")
+        return reordered
+
+    def _build_levels(self, codes):
+        keys = codes
+        starts = counts = None
+
+        for level in range(self.max_depth, -1, -1):
+            if level < self.max_depth:
+                keys = keys >> np.uint64(3)
+
+            # every node is a run of equal keys
+            first = np.flatnonzero(np.diff(keys)) + 1
+            first = np.concatenate([[0], first]) if len(keys) else first
+
+            if counts is None:
+                counts = np.diff(np.append(first, len(keys)))
+                starts = first
+            else:
+                counts = np.add.reduceat(counts, first) if len(first) else counts
+                starts = starts[first]
+            keys = keys[first]
+
+            self.keys[level] = keys
+            self.starts[level] = starts
+            self.counts[level] = counts
+
+
+def _boxes_inside_planes(boxes: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    # a box is outside of a plane if its farthest corner
+    # in the direction of the plane normal is outside
+    inside = np.ones(len(boxes), dtype=bool)
+    for a, b, c, d in planes:
+        x = boxes[:, 3] if a >= 0 else boxes[:, 0]
+        y = boxes[:, 4] if b >= 0 else boxes[:, 1]
+        z = boxes[:, 5] if c >= 0 else boxes[:, 2]
+        inside &= a * x + b * y + c * z + d >= 0
+    return inside
+
+
+def _encode_morton(cells: np.ndarray) -> np.ndarray:
+    return (
+        _spread_bits(cells[:, 0])
+        | (_spread_bits(cells[:, 1]) << np.uint64(1))
+        | (_spread_bits(cells[:, 2]) << np.uint64(2))
+    )
+
+
+def _decode_morton(keys: np.ndarray) -> np.ndarray:
+    keys = np.asarray(keys, dtype=np.uint64)
+    return np.column_stack(
+        [
+            _compact_bits(keys),
+            _compact_bits(keys >> np.uint64(1)),
+            _compact_bits(keys >> np.uint64(2)),
+        ]
+    ).astype(np.float64)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    # puts two zeros between every bit of a 21 bits integer
+    x = values & np.uint64(0x1FFFFF)
+    x = (x | (x << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return x
+
+
+def _compact_bits(values: np.ndarray) -> np.ndarray:
+    x = values & np.uint64(0x1249249249249249)
+    x = (x | (x >> np.uint64(2))) & np.uint64(0x10C30C30C30C30C3)
+    x = (x | (x >> np.uint64(4))) & np.uint64(0x100F00F00F00F00F)
+    x = (x | (x >> np.uint64(8))) & np.uint64(0x1F0000FF0000FF)
+    x = (x | (x >> np.uint64(16))) & np.uint64(0x1F00000000FFFF)
+    x = (x | (x >> np.uint64(32))) & np.uint64(0x1FFFFF)
+    return x
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from .poly_data_utils import make_cell_array, make_vtk_points
+
+# File layout:
+#   8 bytes  magic
+#   8 bytes  header size (little endian uint64)
+#   n bytes  json header
+#   the raw arrays, each one starting at a 64 bytes aligned offset
+_MAGIC = b"VTKATPD\x01"
+_ALIGNMENT = 64
+_CELL_TYPES = ("verts", "lines", "polys", "strips")
+
+
+def hash_sources(*sources: str | Path | bytes) -> str:
+    """
+    Hashes the contents of files (given by their paths) and raw bytes.
+    The result can be used to check if a cache is still valid.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for source in sources:
+        # every source starts with its size, so the
+        # sources can not be split in other ways
+        if isinstance(source, bytes):
+            hasher.update(struct.pack("<Q", len(source)))
+            hasher.update(source)
+            continue
+
+        with open(source, "rb") as file:
+            hasher.update(struct.pack("<Q", os.fstat(file.fileno()).st_size))
+            while chunk := file.read(1 << 20):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def save_poly_data_cache(
+    path: str | Path, data: vtk.vtkPolyData, content_hash: str = ""
+):
+    """
+    Writes the points, cells and cell data arrays of a polydata in a
+    binary format that can be loaded back by memory mapping the file.
+    """
+    path = Path(path)
+    arrays = []
+
+    points = data.GetPoints()
+    if points is not None:
+        arrays.append(("points", "points", vtk_to_numpy(points.GetData()), None))
+
+    for cell_type in _CELL_TYPES:
+        cells: vtk.vtkCellArray = getattr(data, f"Get{cell_type.capitalize()}")()
+        if cells is None or cells.GetNumberOfCells() == 0:
+            continue
+        offsets = vtk_to_numpy(cells.GetOffsetsArray())
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+        arrays.append((cell_type, "offsets", offsets, None))
+        arrays.append((cell_type, "connectivity", connectivity, None))
+
+    cell_data = data.GetCellData()
+    for i in range(cell_data.GetNumberOfArrays()):
+        array = cell_data.GetArray(i)
+        if array is None or not array.GetName():
+            continue
+        values = vtk_to_numpy(array)
+        arrays.append(("cell_data", array.GetName(), values, array.GetDataType()))
+
+    scalars = cell_data.GetScalars()
+    header = dict(
+        content_hash=content_hash,
+        active_scalars=scalars.GetName() if scalars is not None else None,
+        arrays=[],
+    )
+
+    # The header size depends on the offsets it stores, so the
+    # offsets are computed relative to the end of a padded header.
+    offset = 0
+    for kind, name, values, vtk_type in arrays:
+        offset = _align(offset)
+        header["arrays"].append(
+            dict(
+                kind=kind,
+                name=name,
+                dtype=values.dtype.str,
+                shape=list(values.shape),
+                offset=offset,
+                vtk_type=vtk_type,
+            )
+        )
+        offset += values.nbytes
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(len(_MAGIC) + 8 + len(header_bytes))
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(struct.pack("<Q", len(header_bytes)))
+        file.write(header_bytes)
+
+        for entry, (_, _, values, _) in zip(header["arrays"], arrays):
+            file.seek(data_start + entry["offset"])
+            file.write(memoryview(np.ascontiguousarray(values)).cast("B"))
+
+    os.replace(tmp_path, path)
+
+
+def load_poly_data_cache(
+    path: str | Path, content_hash: str | None = None
+) -> vtk.vtkPolyData | None:
+    """
+    Loads a file written by `save_poly_data_cache` without copying its
+    contents, the vtk arrays point directly to the memory mapped file.
+
+    Returns None if the file does not exist, is not a valid cache or
+    if its content hash differs from the one given.
+    """
+    header = _read_header(path)
+    if header is None:
+        return None
+
+    header, data_start = header
+    if (content_hash is not None) and (header["content_hash"] != content_hash):
+        return None
+
+    # copy on write, so vtk can still modify the arrays in memory
+    buffer = np.memmap(path, dtype=np.uint8, mode="c")
+    arrays = dict()
+    for entry in header["arrays"]:
+        dtype = np.dtype(entry["dtype"])
+        start = data_start + entry["offset"]
+        size = int(np.prod(entry["shape"])) * dtype.itemsize
+        if start + size > len(buffer):
+            # truncated file
+            return None
+        values = buffer[start : start + size].view(dtype).reshape(entry["shape"])
+        arrays[entry["kind"], entry["name"]] = (values, entry["vtk_type"])
+
+    data = vtk.vtkPolyData()
+
+    if ("points", "points") in arrays:
+        coords, _ = arrays["points", "points"]
+        data.SetPoints(make_vtk_points(coords))
+
+    for cell_type in _CELL_TYPES:
+        if (cell_type, "offsets") not in arrays:
+            continue
+        offsets, _ = arrays[cell_type, "offsets"]
+        connectivity, _ = arrays[cell_type, "connectivity"]
+        cells = make_cell_array(offsets, connectivity)
+        getattr(data, f"Set{cell_type.capitalize()}")(cells)
+
+    cell_data = data.GetCellData()
+    for (kind, name), (values, vtk_type) in arrays.items():
+        if kind != "cell_data":
+            continue
+        array = numpy_to_vtk(values, deep=False, array_type=vtk_type)
+        array.SetName(name)
+        if name == header["active_scalars"]:
+            cell_data.SetScalars(array)
+        else:
+            cell_data.AddArray(array)
+
+    return data
+
+
+def _read_header(path: str | Path):
+    try:
+        with open(path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                return None
+            (header_size,) = struct.unpack("<Q", file.read(8))
+            header = json.loads(file.read(header_size).decode("utf-8"))
+    except (OSError, ValueError, struct.error):
+        return None
+
+    data_start = _align(len(_MAGIC) + 8 + header_size)
+    return header, data_start
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
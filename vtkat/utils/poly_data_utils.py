@@ -1,4 +1,6 @@
+import numpy as np
 import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 
 def set_polydata_colors(data: vtk.vtkPolyData, color: tuple):
@@ -22,3 +24,139 @@ def set_polydata_property(
     cell_identifier.SetNumberOfTuples(n_cells)
     cell_identifier.Fill(property_data)
     data.GetCellData().AddArray(cell_identifier)
+
+
+def get_cells_bounds(data: vtk.vtkDataSet) -> np.ndarray:
+    """
+    Returns a (n_cells, 6) array with the bounds of every cell,
+    in the same order used by vtk (x0, x1, y0, y1, z0, z1).
+    Empty cells get nan bounds.
+    """
+    n_cells = data.GetNumberOfCells()
+    bounds = np.full((n_cells, 6), np.nan)
+
+    if not isinstance(data, vtk.vtkPolyData):
+        cell_bounds = [0, 0, 0, 0, 0, 0]
+        for i in range(n_cells):
+            data.GetCellBounds(i, cell_bounds)
+            bounds[i] = cell_bounds
+        return bounds
+
+    if data.GetPoints() is None:
+        return bounds
+
+    coords = vtk_to_numpy(data.GetPoints().GetData())
+
+    # polydata cells are numbered as verts, lines, polys and strips
+    first_cell = 0
+    for cells in _get_poly_data_cell_arrays(data):
+        size = cells.GetNumberOfCells()
+        if size == 0:
+            continue
+
+        offsets = vtk_to_numpy(cells.GetOffsetsArray())
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+        filled = offsets[1:] > offsets[:-1]
+        if not filled.any():
+            first_cell += size
+            continue
+
+        # only the filled cells are reduced, as the empty
+        # ones have no points to start their reductions
+        cell_coords = coords[connectivity[: offsets[-1]]]
+        starts = offsets[:-1][filled]
+        block = bounds[first_cell : first_cell + size]
+        block[filled, 0::2] = np.minimum.reduceat(cell_coords, starts, axis=0)
+        block[filled, 1::2] = np.maximum.reduceat(cell_coords, starts, axis=0)
+        first_cell += size
+
+    return bounds
+
+
+def get_cells_centers(data: vtk.vtkDataSet) -> np.ndarray:
+    """
+    Returns a (n_cells, 3) array with the mean position of the points of
+    every cell. Empty cells get nan centers.
+    """
+    n_cells = data.GetNumberOfCells()
+    centers = np.full((n_cells, 3), np.nan)
+
+    if not isinstance(data, vtk.vtkPolyData):
+        cell_centers = vtk.vtkCellCenters()
+        cell_centers.SetInputData(data)
+        cell_centers.Update()
+        output = cell_centers.GetOutput().GetPoints().GetData()
+        return vtk_to_numpy(output).astype(float)
+
+    if data.GetPoints() is None:
+        return centers
+
+    coords = vtk_to_numpy(data.GetPoints().GetData())
+
+    first_cell = 0
+    for cells in _get_poly_data_cell_arrays(data):
+        size = cells.GetNumberOfCells()
+        if size == 0:
+            continue
+
+        offsets = vtk_to_numpy(cells.GetOffsetsArray())
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+        counts = np.diff(offsets)
+        filled = counts > 0
+        if not filled.any():
+            first_cell += size
+            continue
+
+        cell_coords = coords[connectivity[: offsets[-1]]]
+        starts = offsets[:-1][filled]
+        sums = np.add.reduceat(cell_coords, starts, axis=0, dtype=float)
+        block = centers[first_cell : first_cell + size]
+        block[filled] = sums / counts[filled, None]
+        first_cell += size
+
+    return centers
+
+
+def make_vtk_points(coords: np.ndarray) -> vtk.vtkPoints:
+    """
+    Wraps a (n, 3) numpy array as vtkPoints without copying it.
+    The array must be kept alive while the points are in use.
+    """
+    points = vtk.vtkPoints()
+    points.SetData(numpy_to_vtk(coords, deep=False))
+    return points
+
+
+def make_cell_array(offsets: np.ndarray, connectivity: np.ndarray) -> vtk.vtkCellArray:
+    """
+    Wraps offsets and connectivity buffers as a vtkCellArray without copying them.
+    Both buffers must have the same dtype, either int32 or int64.
+    """
+    cells = vtk.vtkCellArray()
+    cells.SetData(_make_id_array(offsets), _make_id_array(connectivity))
+    return cells
+
+
+def matrix_to_numpy(matrix: vtk.vtkMatrix4x4) -> np.ndarray:
+    """
+    Returns the elements of a vtkMatrix4x4 as a (4, 4) numpy array.
+    """
+    return np.array([[matrix.GetElement(i, j) for j in range(4)] for i in range(4)])
+
+
+def _get_poly_data_cell_arrays(data: vtk.vtkPolyData):
+    return (data.GetVerts(), data.GetLines(), data.GetPolys(), data.GetStrips())
+
+
+def _make_id_array(values: np.ndarray) -> vtk.vtkDataArray:
+    if values.dtype == np.int32:
+        array = vtk.vtkTypeInt32Array()
+    else:
+        values = values.astype(np.int64, copy=False)
+        array = vtk.vtkTypeInt64Array()
+
+    values = np.ascontiguousarray(values)
+    array.SetVoidArray(values, len(values), 1)
+    # keeps the buffer alive while vtk uses it
+    array._numpy_reference = values
+    return array
@@ -0,0 +1,193 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk
+
+
+class ScalarField:
+    """
+    Colors an actor by a scalar field that changes over time (like stress
+    or pressure results) on a fixed geometry.
+
+    The float array is attached to the cell (or point) data only once.
+    Each time step copies the new values into the same buffer, and the
+    colors are mapped by the lookup table of the mapper. The scalar range
+    is cached, so the mapper and the lookup table (and any colorbar using
+    it) are only modified when the range actually changes.
+
+    The steps can be any (n_steps, n_values) array, including a memory
+    mapped one, like `np.load(path, mmap_mode="r")`. Only the current step
+    is read from the disk.
+
+    The mapper can only color by one array, so this can not be shown
+    together with a SelectionHighlighter, that colors the cells directly.
+    Whichever was used last sets the colors: highlighting replaces the
+    field colors, and the next `update` (or time step) brings them back.
+    """
+
+    def __init__(
+        self,
+        actor: vtk.vtkActor,
+        name: str = "scalars",
+        association: str = "cell",
+        steps: np.ndarray | None = None,
+        lookup_table: vtk.vtkScalarsToColors | None = None,
+        dtype=np.float32,
+    ) -> None:
+        if association not in ("cell", "point"):
+            raise ValueError('The association must be "cell" or "point"')
+
+        self.actor = actor
+        self.name = name
+        self.association = association
+        self.steps = steps
+        self.current_step = None
+
+        if lookup_table is None:
+            lookup_table = vtk.vtkLookupTable()
+            lookup_table.SetHueRange(2 / 3, 0)
+            lookup_table.Build()
+        self.lookup_table = lookup_table
+
+        self._dtype = dtype
+        self._data = None
+        self._array = None
+        self._values = None
+        self._range = None
+        self._fixed_range = None
+
+    def get_values(self) -> np.ndarray:
+        """
+        The buffer of the attached array. If it is modified directly,
+        call `update` after it.
+        """
+        self._attach()
+        return self._values
+
+    def get_range(self) -> tuple:
+        return self._range
+
+    def get_number_of_steps(self) -> int:
+        if self.steps is None:
+            return 0
+        return len(self.steps)
+
+    def set_step(self, step: int) -> bool:
+        """
+        Shows the given time step. Returns True if the scalar range
+        changed (and therefore the colorbar).
+        """
+        if self.steps is None:
+            raise ValueError("No time steps were given to the scalar field")
+
+        self.current_step = step
+        return self.set_values(self.steps[step])
+
+    def set_values(self, values: np.ndarray) -> bool:
+        """
+        Copies the values into the attached array. Returns True
+        if the scalar range changed (and therefore the colorbar).
+        """
+        self._attach()
+        np.copyto(self._values, values, casting="same_kind")
+        return self.update()
+
+    def set_range(self, scalar_range: tuple | None) -> bool:
+        """
+        Keeps the colors mapped in a fixed range. If None is given the
+        range of the current values is used, updated every time step.
+        """
+        self._fixed_range = None if scalar_range is None else tuple(scalar_range)
+        if self._values is None:
+            return False
+        return self._update_range()
+
+    def compute_global_range(self) -> tuple:
+        """
+        The range of the values in all steps. It goes through
+        the whole array, so it may be slow for memory mapped steps.
+        """
+        if self.steps is None:
+            return self._compute_range()
+        return (float(np.nanmin(self.steps)), float(np.nanmax(self.steps)))
+
+    def update(self) -> bool:
+        """
+        Notifies vtk that the values were changed. Returns True
+        if the scalar range changed (and therefore the colorbar).
+        """
+        self._array.Modified()
+        self._configure_mapper()
+        return self._update_range()
+
+    def _update_range(self) -> bool:
+        if self._fixed_range is not None:
+            scalar_range = self._fixed_range
+        else:
+            scalar_range = self._compute_range()
+
+        if scalar_range == self._range:
+            return False
+
+        self._range = scalar_range
+        self.actor.GetMapper().SetScalarRange(scalar_range)
+        self.lookup_table.SetRange(scalar_range)
+        return True
+
+    def _compute_range(self) -> tuple:
+        if len(self._values) == 0:
+            return (0.0, 1.0)
+
+        scalar_range = (float(self._values.min()), float(self._values.max()))
+        if np.isnan(scalar_range).any():
+            scalar_range = (
+                float(np.nanmin(self._values)),
+                float(np.nanmax(self._values)),
+            )
+        return scalar_range
+
+    def _get_attributes(self, data: vtk.vtkDataSet) -> vtk.vtkDataSetAttributes:
+        if self.association == "cell":
+            return data.GetCellData()
+        return data.GetPointData()
+
+    def _get_size(self, data: vtk.vtkDataSet) -> int:
+        if self.association == "cell":
+            return data.GetNumberOfCells()
+        return data.GetNumberOfPoints()
+
+    def _is_attached(self):
+        data = self.actor.GetMapper().GetInput()
+        if data is None or data is not self._data:
+            return False
+
+        if self._get_size(data) != len(self._values):
+            return False
+        return self._get_attributes(data).GetArray(self.name) is self._array
+
+    def _attach(self):
+        if self._is_attached():
+            return
+
+        self._data = self.actor.GetMapper().GetInput()
+        attributes = self._get_attributes(self._data)
+
+        self._values = np.zeros(self._get_size(self._data), dtype=self._dtype)
+        self._array = numpy_to_vtk(self._values)
+        self._array.SetName(self.name)
+        attributes.AddArray(self._array)
+        self._range = None
+        self._configure_mapper()
+
+    def _configure_mapper(self):
+        # The array is not made the active scalars, so the colors of a
+        # selection highlight are kept in the data, just not shown.
+        mapper = self.actor.GetMapper()
+        mapper.SetLookupTable(self.lookup_table)
+        mapper.UseLookupTableScalarRangeOff()
+        mapper.SetColorModeToMapScalars()
+        if self.association == "cell":
+            mapper.SetScalarModeToUseCellFieldData()
+        else:
+            mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray(self.name)
+        mapper.ScalarVisibilityOn()
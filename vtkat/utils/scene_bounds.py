@@ -0,0 +1,170 @@
+import numpy as np
+import vtk
+
+_UNINITIALIZED_BOUNDS = (1.0, -1.0, 1.0, -1.0, 1.0, -1.0)
+
+
+class SceneBoundsTracker:
+    """
+    Keeps the union of the visible prop bounds of a renderer, like
+    `ComputeVisiblePropBounds`, without querying every prop each time.
+
+    The bounds of every prop are cached. Observers on the prop, its
+    mapper, the mapper input (data and source algorithm) and its points
+    mark the prop as outdated when they are modified, so only those
+    props are queried again.
+    Props added or removed are noticed through the view props collection.
+
+    Changes that fire no event (like editing the elements of an actor
+    user matrix, or a filter further up the pipeline) must be notified
+    with `invalidate`.
+    """
+
+    def __init__(self, renderer: vtk.vtkRenderer) -> None:
+        self.renderer = renderer
+
+        self._props = dict()
+        self._observers = dict()
+        self._outdated = set()
+        self._props_changed = True
+        self._bounds = None
+
+        # The collection MTime would be cheaper to compare, but its
+        # GetMTime also queries the MTime of every prop in it.
+        renderer.GetViewProps().AddObserver("ModifiedEvent", self._view_props_modified)
+
+    def get_bounds(self) -> tuple:
+        """
+        Same result as `renderer.ComputeVisiblePropBounds()`.
+        """
+        self._update()
+        return self._bounds
+
+    def get_center(self) -> tuple:
+        x0, x1, y0, y1, z0, z1 = self.get_bounds()
+        return ((x0 + x1) / 2, (y0 + y1) / 2, (z0 + z1) / 2)
+
+    def is_empty(self) -> bool:
+        bounds = self.get_bounds()
+        return bounds[0] > bounds[1]
+
+    def reset_clipping_range(self, renderer: vtk.vtkRenderer | None = None):
+        """
+        Same as `renderer.ResetCameraClippingRange()`, but using the
+        cached bounds. Nothing happens if there is nothing visible.
+        """
+        if renderer is None:
+            renderer = self.renderer
+
+        if renderer is not self.renderer:
+            renderer.ResetCameraClippingRange()
+            return
+
+        if not self.is_empty():
+            renderer.ResetCameraClippingRange(*self._bounds)
+
+    def invalidate(self, prop: vtk.vtkProp | None = None):
+        """
+        Queries the bounds of the prop again, or
+        of all props if none is given.
+        """
+        if prop is None:
+            self._outdated.update(self._props)
+        elif prop in self._props:
+            self._outdated.add(prop)
+        self._bounds = None
+
+    def _update(self):
+        if self._props_changed:
+            self._props_changed = False
+            self._sync_props()
+
+        if not self._outdated and self._bounds is not None:
+            return
+
+        outdated = self._outdated
+        self._outdated = set()
+        for prop in outdated:
+            self._props[prop] = self._compute_prop_bounds(prop)
+            self._watch(prop)
+
+        # modifications made by the pipeline updates
+        # are already included in the new bounds
+        self._outdated -= outdated
+
+        valid_bounds = [bounds for bounds in self._props.values() if bounds is not None]
+        if not valid_bounds:
+            self._bounds = _UNINITIALIZED_BOUNDS
+            return
+
+        bounds = np.array(valid_bounds)
+        minimums = bounds[:, 0::2].min(axis=0)
+        maximums = bounds[:, 1::2].max(axis=0)
+        self._bounds = tuple(np.column_stack([minimums, maximums]).ravel().tolist())
+
+    def _view_props_modified(self, obj, event):
+        self._props_changed = True
+
+    def _sync_props(self):
+        current = list(self.renderer.GetViewProps())
+        current_set = set(current)
+
+        for prop in [prop for prop in self._props if prop not in current_set]:
+            self._unwatch(prop)
+            del self._props[prop]
+            self._outdated.discard(prop)
+
+        for prop in current:
+            if prop not in self._props:
+                self._props[prop] = None
+                self._outdated.add(prop)
+
+        self._bounds = None
+
+    def _compute_prop_bounds(self, prop: vtk.vtkProp):
+        if not (prop.GetVisibility() and prop.GetUseBounds()):
+            return None
+
+        bounds = prop.GetBounds()
+        if bounds is None:
+            return None
+
+        if not (bounds[0] <= bounds[1] and np.isfinite(bounds).all()):
+            return None
+        return tuple(bounds)
+
+    def _watch(self, prop: vtk.vtkProp):
+        # the mapper, input or points may have been replaced
+        watched = [prop]
+        mapper = prop.GetMapper() if hasattr(prop, "GetMapper") else None
+        if mapper is not None:
+            watched.append(mapper)
+            if hasattr(mapper, "GetInputAlgorithm") and mapper.GetNumberOfInputPorts():
+                algorithm = mapper.GetInputAlgorithm()
+                if algorithm is not None and not algorithm.IsA("vtkTrivialProducer"):
+                    watched.append(algorithm)
+            data = mapper.GetInput() if hasattr(mapper, "GetInput") else None
+            if data is not None:
+                watched.append(data)
+                points = data.GetPoints() if hasattr(data, "GetPoints") else None
+                if points is not None:
+                    watched.extend((points, points.GetData()))
+
+        observers = self._observers.get(prop, [])
+        if len(observers) == len(watched) and all(
+            obj is current for (obj, _), current in zip(observers, watched)
+        ):
+            return
+
+        self._unwatch(prop)
+
+        def mark_outdated(obj, event):
+            self._outdated.add(prop)
+
+        self._observers[prop] = [
+            (obj, obj.AddObserver("ModifiedEvent", mark_outdated)) for obj in watched
+        ]
+
+    def _unwatch(self, prop: vtk.vtkProp):
+        for obj, observer in self._observers.pop(prop, []):
+            obj.RemoveObserver(observer)
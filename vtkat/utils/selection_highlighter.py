@@ -0,0 +1,154 @@
+import numpy as np
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from .poly_data_utils import set_polydata_colors
+
+
+class SelectionHighlighter:
+    """
+    Highlights the selected cells of an actor through the cell colors
+    of its own poly data, so no extra geometry is needed.
+
+    Only the cells that enter or leave the selection are written. Their
+    original colors are saved, so clearing the highlight costs time
+    proportional to the selection size. A "selected" mask array is also
+    kept in the cell data, with 1 for the highlighted cells.
+
+    Highlighting makes the mapper color the cells directly, so it replaces
+    the colors of a ScalarField on the same actor (see ScalarField).
+    """
+
+    def __init__(
+        self, actor: vtk.vtkActor, color=(255, 50, 50), mask_name: str = "selected"
+    ) -> None:
+        self.actor = actor
+        self.color = color
+        self.mask_name = mask_name
+
+        self._data = None
+        self._colors_array = None
+        self._mask_array = None
+        self._colors = None
+        self._mask = None
+        self._selected = np.empty(0, dtype=np.int64)
+        self._saved_colors = None
+
+    def get_highlighted(self) -> np.ndarray:
+        return self._selected
+
+    def highlight(self, cells):
+        """
+        Replaces the highlighted cells by the given ones.
+        """
+        self._prepare()
+        self._configure_mapper()
+
+        n_cells = len(self._colors)
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        cells = cells[(cells >= 0) & (cells < n_cells)]
+
+        removed = np.setdiff1d(self._selected, cells, assume_unique=True)
+        added = np.setdiff1d(cells, self._selected, assume_unique=True)
+        kept = np.intersect1d(self._selected, cells, assume_unique=True)
+        if len(removed) == 0 and len(added) == 0:
+            return
+
+        old_positions = np.searchsorted(self._selected, removed)
+        self._colors[removed] = self._saved_colors[old_positions]
+        self._mask[removed] = 0
+
+        saved_colors = np.empty((len(cells), self._colors.shape[1]), dtype=np.uint8)
+        saved_colors[np.searchsorted(cells, kept)] = self._saved_colors[
+            np.searchsorted(self._selected, kept)
+        ]
+        saved_colors[np.searchsorted(cells, added)] = self._colors[added]
+
+        self._colors[added, :3] = self.color
+        self._mask[added] = 1
+
+        self._selected = cells
+        self._saved_colors = saved_colors
+        self._mark_modified()
+
+    def add(self, cells):
+        self.highlight(np.union1d(self._selected, cells))
+
+    def remove(self, cells):
+        self.highlight(np.setdiff1d(self._selected, cells))
+
+    def clear(self):
+        if len(self._selected) == 0:
+            return
+
+        if self._is_prepared():
+            self._colors[self._selected] = self._saved_colors
+            self._mask[self._selected] = 0
+            self._mark_modified()
+
+        self._selected = np.empty(0, dtype=np.int64)
+        self._saved_colors = None
+
+    def _is_prepared(self):
+        data = self.actor.GetMapper().GetInput()
+        if data is None or data is not self._data:
+            return False
+
+        if len(self._colors) != data.GetNumberOfCells():
+            return False
+
+        cell_data = data.GetCellData()
+        return (cell_data.GetScalars() is self._colors_array) and (
+            cell_data.GetArray(self.mask_name) is self._mask_array
+        )
+
+    def _prepare(self):
+        if self._is_prepared():
+            return
+
+        # the data or its arrays were replaced, so
+        # the previous selection means nothing now
+        self._selected = np.empty(0, dtype=np.int64)
+
+        self._data: vtk.vtkPolyData = self.actor.GetMapper().GetInput()
+        cell_data = self._data.GetCellData()
+        n_cells = self._data.GetNumberOfCells()
+
+        colors = cell_data.GetScalars()
+        if not self._is_color_array(colors, n_cells):
+            color = np.round(np.array(self.actor.GetProperty().GetColor()) * 255)
+            set_polydata_colors(self._data, color.astype(int))
+            colors = cell_data.GetScalars()
+
+        mask = cell_data.GetArray(self.mask_name)
+        if not (
+            isinstance(mask, vtk.vtkUnsignedCharArray)
+            and mask.GetNumberOfTuples() == n_cells
+        ):
+            mask = numpy_to_vtk(np.zeros(n_cells, dtype=np.uint8), deep=True)
+            mask.SetName(self.mask_name)
+            cell_data.AddArray(mask)
+
+        self._colors_array = colors
+        self._mask_array = mask
+        self._colors = vtk_to_numpy(colors)
+        self._mask = vtk_to_numpy(mask)
+        self._saved_colors = np.empty((0, self._colors.shape[1]), dtype=np.uint8)
+
+    def _configure_mapper(self):
+        # another tool (like a ScalarField) may have changed it
+        mapper = self.actor.GetMapper()
+        mapper.ScalarVisibilityOn()
+        mapper.SetScalarModeToUseCellData()
+        mapper.SetColorModeToDirectScalars()
+
+    def _is_color_array(self, array, n_cells):
+        return (
+            isinstance(array, vtk.vtkUnsignedCharArray)
+            and array.GetNumberOfComponents() in (3, 4)
+            and array.GetNumberOfTuples() == n_cells
+        )
+
+    def _mark_modified(self):
+        self._colors_array.Modified()
+        self._mask_array.Modified()